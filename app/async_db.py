@@ -0,0 +1,32 @@
+import os
+from functools import lru_cache
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app import metrics, querylog
+from app.db import DATABASE_URL, SQLITE_PRAGMAS, apply_sqlite_pragmas
+
+def async_database_url(url: str = DATABASE_URL) -> str:
+    """Map a sync SQLite URL onto the aiosqlite driver."""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Build the async engine on first use so aiosqlite is only needed in async mode."""
+    async_engine = create_async_engine(
+        async_database_url(),
+        pool_size=int(os.getenv("PARTS_DB_ASYNC_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("PARTS_DB_ASYNC_MAX_OVERFLOW", "10")),
+    )
+    if async_engine.dialect.name == "sqlite":
+        @event.listens_for(async_engine.sync_engine, "connect")
+        def set_sqlite_pragma(dbapi_conn, conn_record):
+            apply_sqlite_pragmas(dbapi_conn, SQLITE_PRAGMAS)
+    metrics.instrument(async_engine.sync_engine)
+    querylog.install(async_engine.sync_engine)
+    return async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,80 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import autocomplete, cache, etags, querylog
+from app.async_db import get_async_db
+from app.models.box import Box
+from app.models.location import Location
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
+from app.routes.boxes import BoxCreate
+
+# Async twins of app.routes.boxes
+router = APIRouter(prefix="/boxes", tags=["boxes"])
+
+def _box_select():
+    return select(Box.box_id, Box.code, Location.name).join_from(
+        Box, Location, Location.location_id == Box.location_id, isouter=True
+    )
+
+def _box_dict(box_id, code, location_name):
+    return {"box_id": box_id, "code": code, "location_name": location_name or ""}
+
+@router.post("/")
+async def add_box(box_data: BoxCreate, db: AsyncSession = Depends(get_async_db)):
+    location = await cache.resolve_location_async(db, box_data.location_name)
+    if not location:
+        raise HTTPException(status_code=404, detail=f"Location '{box_data.location_name}' not found")
+
+    existing = await cache.resolve_box_async(db, box_data.code)
+    if existing:
+        if existing["location_id"] != location["location_id"]:
+            raise HTTPException(status_code=409, detail=f"Box '{box_data.code}' belongs to another location")
+        return {"message": "Box already exists",
+                **_box_dict(existing["box_id"], existing["code"], location["location_name"])}
+
+    box = Box(code=box_data.code, location_id=location["location_id"])
+    db.add(box)
+    await db.commit()
+    await db.refresh(box)
+    cache.boxes_by_code.invalidate(box.code)
+    autocomplete.boxes.add(box.code)
+    return {"message": "Box added", **_box_dict(box.box_id, box.code, location["location_name"])}
+
+@router.get("/search", dependencies=[Depends(etags.conditional("boxes", "locations")), Depends(querylog.budget(2))])
+async def search_box(code: str, db: AsyncSession = Depends(get_async_db)):
+    box = await cache.resolve_box_async(db, code)
+    if not box:
+        return {"error": "Box not found"}
+    return _box_dict(box["box_id"], box["code"], box["location_name"])
+
+@router.get("/all", dependencies=[Depends(etags.conditional("boxes", "locations")), Depends(querylog.budget(2))])
+async def list_boxes(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    stmt = _box_select()
+    if after is not None:
+        stmt = stmt.where(Box.box_id > after)
+    rows = (await db.execute(stmt.order_by(Box.box_id).limit(limit + 1))).all()
+    next_cursor = rows[limit - 1].box_id if len(rows) > limit else None
+    return page_response([_box_dict(*r) for r in rows[:limit]], next_cursor, limit)
+
+@router.get("/{box_id:int}", dependencies=[Depends(querylog.budget(1))])
+async def get_box_by_id(box_id: int, db: AsyncSession = Depends(get_async_db)):
+    row = (await db.execute(_box_select().where(Box.box_id == box_id))).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Box not found")
+    return _box_dict(*row)
+
+@router.delete("/{box_id:int}")
+async def delete_box(box_id: int, db: AsyncSession = Depends(get_async_db)):
+    box = await db.get(Box, box_id)
+    if not box:
+        raise HTTPException(status_code=404, detail="Box not found")
+    await db.delete(box)
+    await db.commit()
+    cache.boxes_by_code.invalidate(box.code)
+    autocomplete.boxes.remove(box.code)
+    return {"message": f"Box ID {box_id} deleted"}
@@ -0,0 +1,248 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import autocomplete, cache, etags, querylog, search, totals
+from app.async_db import get_async_db
+from app.models.box import Box
+from app.models.inventory import InventoryItem
+from app.models.location import Location
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
+from app.routes.inventory import (
+    MAX_BATCH_ADJUSTMENTS,
+    InventoryAdjust,
+    InventoryBatchAdjust,
+    InventoryCreate,
+    InventoryUpdate,
+    _adjust_current,
+    _adjust_error,
+    _adjust_statement,
+    _adjusted,
+    _inventory_row,
+    _totals_cursor,
+)
+
+# Async twins of app.routes.inventory; /bulk and /export stay on the sync router
+router = APIRouter(prefix="/inventory", tags=["inventory"])
+
+def _inventory_select():
+    return (
+        select(
+            InventoryItem.item_id,
+            Box.code,
+            InventoryItem.part_number,
+            InventoryItem.description,
+            Location.name,
+            InventoryItem.quantity,
+        )
+        .join_from(InventoryItem, Box, Box.box_id == InventoryItem.box_id, isouter=True)
+        .join_from(Box, Location, Location.location_id == Box.location_id, isouter=True)
+    )
+
+@router.post("/")
+async def add_inventory(item_data: InventoryCreate, db: AsyncSession = Depends(get_async_db)):
+    part = await cache.resolve_part_async(db, item_data.part_number)
+    if not part:
+        raise HTTPException(status_code=404, detail=f"Part '{item_data.part_number}' not found")
+
+    location = await cache.resolve_location_async(db, item_data.location_name)
+    if not location:
+        raise HTTPException(status_code=404, detail=f"Location '{item_data.location_name}' not found")
+
+    box = await cache.resolve_box_async(db, item_data.box_id)
+    if box and box["location_id"] != location["location_id"]:
+        raise HTTPException(status_code=409, detail=f"Box '{item_data.box_id}' belongs to another location")
+    if box:
+        box_id = box["box_id"]
+    else:
+        new_box = Box(code=item_data.box_id, location_id=location["location_id"],
+                      created_at=datetime.now(timezone.utc))
+        db.add(new_box)
+        await db.flush()
+        box_id = new_box.box_id
+
+    item = InventoryItem(
+        box_id=box_id,
+        part_number=item_data.part_number,
+        description=item_data.description,
+        quantity=item_data.quantity,
+        updated_at=datetime.now(timezone.utc)
+    )
+    db.add(item)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        existing = (await db.execute(select(InventoryItem).where(
+            InventoryItem.box_id == box_id,
+            InventoryItem.part_number == item_data.part_number
+        ))).scalars().first()
+        if not existing:
+            raise
+        return {
+            "message": "Inventory item already exists",
+            "inventory_id": existing.item_id,
+            "box_id": item_data.box_id,
+            "part_number": existing.part_number,
+            "description": existing.description,
+            "location_name": item_data.location_name,
+            "quantity": existing.quantity
+        }
+
+    if not box:
+        autocomplete.boxes.add(item_data.box_id)
+
+    return {
+        "message": "Inventory item added",
+        "inventory_id": item.item_id,
+        "box_id": item_data.box_id,
+        "part_number": item.part_number,
+        "description": item.description,
+        "location_name": item_data.location_name,
+        "quantity": item.quantity
+    }
+
+@router.put("/{item_id:int}")
+async def update_inventory(item_id: int, update_data: InventoryUpdate, db: AsyncSession = Depends(get_async_db)):
+    item = await db.get(InventoryItem, item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    item.part_number = update_data.part_number  # type: ignore
+    item.description = update_data.description  # type: ignore
+    item.quantity = update_data.quantity  # type: ignore
+    item.updated_at = datetime.now(timezone.utc)  # type: ignore
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Box already holds an inventory item for part '{update_data.part_number}'"
+        )
+    return {
+        "message": "Inventory updated",
+        "inventory_id": item.item_id,
+        "box_id": item.box_id,
+        "part_number": item.part_number,
+        "description": item.description,
+        "new_quantity": item.quantity
+    }
+
+@router.post("/{item_id:int}/adjust", dependencies=[Depends(querylog.budget(2))])
+async def adjust_inventory(item_id: int, adjust: InventoryAdjust, db: AsyncSession = Depends(get_async_db)):
+    row = (await db.execute(_adjust_statement(item_id, adjust, datetime.now(timezone.utc)))).first()
+    if row is None:
+        error = _adjust_error(item_id, adjust, (await db.execute(_adjust_current(item_id))).first())
+        await db.rollback()
+        raise error
+    await db.commit()
+    return {"message": "Inventory adjusted", **_adjusted(row, adjust.delta)}
+
+@router.post("/adjust")
+async def adjust_inventory_batch(
+    adjustments: List[InventoryBatchAdjust] = Body(..., min_length=1, max_length=MAX_BATCH_ADJUSTMENTS),
+    db: AsyncSession = Depends(get_async_db),
+):
+    now = datetime.now(timezone.utc)
+    results = []
+    for adjust in adjustments:
+        row = (await db.execute(_adjust_statement(adjust.item_id, adjust, now))).first()
+        if row is None:
+            error = _adjust_error(adjust.item_id, adjust, (await db.execute(_adjust_current(adjust.item_id))).first())
+            await db.rollback()
+            raise error
+        results.append(_adjusted(row, adjust.delta))
+    await db.commit()
+    return {"message": f"{len(results)} inventory items adjusted", "results": results}
+
+@router.get(
+    "/search",
+    dependencies=[Depends(etags.conditional("inventory", "boxes", "locations")), Depends(querylog.budget(2))],
+)
+async def search_inventory(part_number: str, db: AsyncSession = Depends(get_async_db)):
+    rows = (await db.execute(
+        _inventory_select()
+        .where(InventoryItem.part_number == part_number)
+        .order_by(InventoryItem.item_id)
+    )).all()
+    if not rows:
+        return {"message": f"No inventory found for part_number '{part_number}'"}
+    return [_inventory_row(r) for r in rows]
+
+@router.get(
+    "/search_by_box/{box_code}",
+    dependencies=[Depends(etags.conditional("inventory", "boxes", "locations")), Depends(querylog.budget(2))],
+)
+async def search_inventory_by_box(box_code: str, db: AsyncSession = Depends(get_async_db)):
+    # One query from boxes, as in the sync route: no rows = no box, one row without an item = empty box
+    rows = (await db.execute(
+        select(
+            InventoryItem.item_id,
+            Box.code,
+            InventoryItem.part_number,
+            InventoryItem.description,
+            Location.name,
+            InventoryItem.quantity,
+        )
+        .join_from(Box, InventoryItem, InventoryItem.box_id == Box.box_id, isouter=True)
+        .join_from(Box, Location, Location.location_id == Box.location_id, isouter=True)
+        .where(Box.code == box_code)
+        .order_by(InventoryItem.item_id)
+    )).all()
+    if not rows:
+        return {"message": f"No box found with code '{box_code}'"}
+    if rows[0].item_id is None:
+        return {"message": f"No inventory found for box '{box_code}'"}
+    return [_inventory_row(r) for r in rows]
+
+@router.get(
+    "/find",
+    dependencies=[Depends(etags.conditional("inventory", "boxes", "locations")), Depends(querylog.budget(2))],
+)
+async def find_inventory(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    match = search.match_query(q)
+    if match is None:
+        return page_response([], None, limit)
+    rows = (await db.execute(search.FIND_INVENTORY, search.find_params(q, match, offset, limit))).all()
+    rows, next_cursor = search.found_page(rows, offset, limit)
+    return page_response([_inventory_row(r) for r in rows], next_cursor, limit)
+
+@router.get(
+    "/totals",
+    dependencies=[Depends(etags.conditional("inventory", "boxes", "locations")), Depends(querylog.budget(3))],
+)
+async def inventory_totals(
+    group_by: str = Query("part", pattern="^(part|location|box)$"),
+    part_number: Optional[str] = None,
+    location_name: Optional[str] = None,
+    box_code: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    location_id = None
+    if location_name is not None:
+        location = await cache.resolve_location_async(db, location_name)
+        if not location:
+            raise HTTPException(status_code=404, detail=f"Location '{location_name}' not found")
+        location_id = location["location_id"]
+    stmt = totals.totals_statement(group_by, part_number, location_id, box_code,
+                                   _totals_cursor(group_by, after), limit)
+    items, next_cursor = totals.totals_page(group_by, (await db.execute(stmt)).all(), limit)
+    return page_response(items, next_cursor, limit)
+
+@router.delete("/{inventory_id:int}")
+async def delete_inventory(inventory_id: int, db: AsyncSession = Depends(get_async_db)):
+    item = await db.get(InventoryItem, inventory_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Inventory item not found")
+    await db.delete(item)
+    await db.commit()
+    return {"message": f"Inventory ID {inventory_id} deleted"}
@@ -0,0 +1,79 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import autocomplete, cache, etags, querylog
+from app.async_db import get_async_db
+from app.models.location import Location
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
+from app.routes.locations import LocationCreate
+
+# Async twins of app.routes.locations
+router = APIRouter(prefix="/locations", tags=["locations"])
+
+def _location_dict(location_id, name, description):
+    return {
+        "location_id": location_id,
+        "location_name": name,
+        "description": description or ""
+    }
+
+@router.post("/")
+async def add_location(location_data: LocationCreate, db: AsyncSession = Depends(get_async_db)):
+    existing = await cache.resolve_location_async(db, location_data.location_name)
+    if existing:
+        return {"message": "Location already exists", **existing}
+    location = Location(name=location_data.location_name, description=location_data.description)
+    db.add(location)
+    await db.commit()
+    await db.refresh(location)
+    cache.locations_by_name.invalidate(location.name)
+    autocomplete.locations.add(location.name)
+    return {"message": "Location added",
+            **_location_dict(location.location_id, location.name, location.description)}
+
+@router.get("/search", dependencies=[Depends(etags.conditional("locations")), Depends(querylog.budget(2))])
+async def search_location(location_name: str, db: AsyncSession = Depends(get_async_db)):
+    location = await cache.resolve_location_async(db, location_name)
+    if not location:
+        return {"error": "Location not found"}
+    return location
+
+@router.get("/all", dependencies=[Depends(etags.conditional("locations")), Depends(querylog.budget(2))])
+async def list_locations(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    stmt = select(Location.location_id, Location.name, Location.description)
+    if after is not None:
+        stmt = stmt.where(Location.location_id > after)
+    rows = (await db.execute(stmt.order_by(Location.location_id).limit(limit + 1))).all()
+    next_cursor = rows[limit - 1].location_id if len(rows) > limit else None
+    return page_response([_location_dict(*r) for r in rows[:limit]], next_cursor, limit)
+
+@router.get("/{location_id:int}", dependencies=[Depends(querylog.budget(1))])
+async def get_location_by_id(location_id: int, db: AsyncSession = Depends(get_async_db)):
+    location = await db.get(Location, location_id)
+    if not location:
+        raise HTTPException(status_code=404, detail="Location not found")
+    return _location_dict(location.location_id, location.name, location.description)
+
+@router.get("/resolve_id/{location_name}", dependencies=[Depends(querylog.budget(1))])
+async def resolve_location_id(location_name: str, db: AsyncSession = Depends(get_async_db)):
+    location = await cache.resolve_location_async(db, location_name)
+    if not location:
+        raise HTTPException(status_code=404, detail="Location not found")
+    return {"location_id": location["location_id"]}
+
+@router.delete("/{location_id:int}")
+async def delete_location(location_id: int, db: AsyncSession = Depends(get_async_db)):
+    location = await db.get(Location, location_id)
+    if not location:
+        raise HTTPException(status_code=404, detail="Location not found")
+    await db.delete(location)
+    await db.commit()
+    cache.locations_by_name.invalidate(location.name)
+    autocomplete.locations.remove(location.name)
+    cache.boxes_by_code.clear()
+    return {"message": f"Location ID {location_id} deleted"}
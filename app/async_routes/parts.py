@@ -0,0 +1,99 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import autocomplete, cache, etags, querylog, search
+from app.async_db import get_async_db
+from app.models.part import Part
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
+from app.routes.parts import PartCreate
+
+# Async twins of app.routes.parts; integer path params use the :int convertor
+# so they never shadow the sync-only routes (/print, /bulk) registered after.
+router = APIRouter(prefix="/parts", tags=["parts"])
+
+def _part_dict(part):
+    return {
+        "part_id": part.part_id,
+        "part_number": part.part_number,
+        "description": part.description
+    }
+
+@router.post("/")
+async def add_part(part_data: PartCreate, db: AsyncSession = Depends(get_async_db)):
+    existing = await cache.resolve_part_async(db, part_data.part_number)
+    if existing:
+        return {"message": "Part already exists", **existing}
+    part = Part(part_number=part_data.part_number, description=part_data.description)
+    db.add(part)
+    await db.commit()
+    await db.refresh(part)
+    cache.parts_by_number.invalidate(part.part_number)
+    autocomplete.parts.add(part.part_number)
+    return {"message": "Part added", **_part_dict(part)}
+
+@router.get("/search", dependencies=[Depends(etags.conditional("parts")), Depends(querylog.budget(2))])
+async def search_part(part_number: str, db: AsyncSession = Depends(get_async_db)):
+    part = await cache.resolve_part_async(db, part_number)
+    if not part:
+        return {"error": "Part not found"}
+    return part
+
+@router.get("/all", dependencies=[Depends(etags.conditional("parts")), Depends(querylog.budget(2))])
+async def list_parts(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    stmt = select(Part.part_id, Part.part_number, Part.description)
+    if after is not None:
+        stmt = stmt.where(Part.part_id > after)
+    rows = (await db.execute(stmt.order_by(Part.part_id).limit(limit + 1))).all()
+    next_cursor = rows[limit - 1].part_id if len(rows) > limit else None
+    return page_response([_part_dict(r) for r in rows[:limit]], next_cursor, limit)
+
+@router.get("/find", dependencies=[Depends(etags.conditional("parts")), Depends(querylog.budget(2))])
+async def find_parts(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    match = search.match_query(q)
+    if match is None:
+        return page_response([], None, limit)
+    rows = (await db.execute(search.FIND_PARTS, search.find_params(q, match, offset, limit))).all()
+    rows, next_cursor = search.found_page(rows, offset, limit)
+    return page_response([_part_dict(r) for r in rows], next_cursor, limit)
+
+@router.get("/{part_id:int}", dependencies=[Depends(querylog.budget(1))])
+async def get_part_by_id(part_id: int, db: AsyncSession = Depends(get_async_db)):
+    part = await db.get(Part, part_id)
+    if not part:
+        raise HTTPException(status_code=404, detail="Part not found")
+    return _part_dict(part)
+
+@router.get("/by_number/{part_number}", dependencies=[Depends(etags.conditional("parts")), Depends(querylog.budget(2))])
+async def get_part_by_number(part_number: str, db: AsyncSession = Depends(get_async_db)):
+    part = await cache.resolve_part_async(db, part_number)
+    if not part:
+        return {"error": "Part not found"}
+    return part
+
+@router.get("/resolve_id/{part_number}", dependencies=[Depends(querylog.budget(1))])
+async def resolve_part_id(part_number: str, db: AsyncSession = Depends(get_async_db)):
+    part = await cache.resolve_part_async(db, part_number)
+    if not part:
+        raise HTTPException(status_code=404, detail="Part not found")
+    return {"part_id": part["part_id"]}
+
+@router.delete("/{part_id:int}")
+async def delete_part(part_id: int, db: AsyncSession = Depends(get_async_db)):
+    part = await db.get(Part, part_id)
+    if not part:
+        raise HTTPException(status_code=404, detail="Part not found")
+    await db.delete(part)
+    await db.commit()
+    cache.parts_by_number.invalidate(part.part_number)
+    autocomplete.parts.remove(part.part_number)
+    return {"message": f"Part {part_id} deleted successfully"}
@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Iterable, List
+
+from sqlalchemy import select
+
+from app.models.box import Box
+from app.models.location import Location
+from app.models.part import Part
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+
+def _fold(value: str) -> str:
+    return value.casefold()
+
+
+class PrefixIndex:
+    """Thread-safe sorted list of names answering case-insensitive prefix queries.
+
+    Names are kept sorted by their case-folded form, so a lookup is one
+    bisect plus a walk over the matches; adds and removes are a bisect and a
+    list insert/delete. Names differing only in case are kept separately.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._values: List[str] = []
+        self._lock = threading.Lock()
+        self.lookups = 0
+
+    def load(self, values: Iterable[str]):
+        ordered = sorted({v for v in values if v}, key=_fold)
+        with self._lock:
+            self._values = ordered
+
+    def add(self, value: str):
+        if not value:
+            return
+        with self._lock:
+            if not self._contains(value):
+                insort(self._values, value, key=_fold)
+
+    def add_many(self, values: Iterable[str]):
+        for value in values:
+            self.add(value)
+
+    def remove(self, value: str):
+        with self._lock:
+            i = self._find(value)
+            if i is not None:
+                del self._values[i]
+
+    def complete(self, prefix: str, limit: int = DEFAULT_LIMIT) -> List[str]:
+        """Up to `limit` names starting with prefix (ignoring case), in sorted order."""
+        folded = _fold(prefix)
+        with self._lock:
+            self.lookups += 1
+            values = self._values
+            i = bisect_left(values, folded, key=_fold)
+            matches = []
+            while i < len(values) and len(matches) < limit and _fold(values[i]).startswith(folded):
+                matches.append(values[i])
+                i += 1
+            return matches
+
+    def __len__(self):
+        return len(self._values)
+
+    def _find(self, value: str):
+        folded = _fold(value)
+        i = bisect_left(self._values, folded, key=_fold)
+        # Walk the run of names that fold to the same key
+        while i < len(self._values) and _fold(self._values[i]) == folded:
+            if self._values[i] == value:
+                return i
+            i += 1
+        return None
+
+    def _contains(self, value: str) -> bool:
+        return self._find(value) is not None
+
+    def stats(self) -> dict:
+        return {"size": len(self._values), "lookups": self.lookups}
+
+
+parts = PrefixIndex("parts")
+boxes = PrefixIndex("boxes")
+locations = PrefixIndex("locations")
+
+# kind (as in /autocomplete/{kind}) -> (index, column it is built from)
+INDEXES = {
+    "parts": (parts, Part.part_number),
+    "boxes": (boxes, Box.code),
+    "locations": (locations, Location.name),
+}
+
+
+def load(engine):
+    """(Re)build every index from the database; called once at startup."""
+    start = time.perf_counter()
+    with engine.connect() as conn:
+        for index, column in INDEXES.values():
+            index.load(conn.execute(select(column)).scalars())
+    logger.info(
+        "Built autocomplete indexes (%s) in %.2fs",
+        ", ".join(f"{kind}={len(index)}" for kind, (index, _) in INDEXES.items()),
+        time.perf_counter() - start,
+    )
+
+
+def stats() -> dict:
+    return {kind: index.stats() for kind, (index, _) in INDEXES.items()}
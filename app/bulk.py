@@ -0,0 +1,348 @@
+import json
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import autocomplete
+from app.models.box import Box
+from app.models.inventory import InventoryItem
+from app.models.location import Location
+from app.models.part import Part
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 5000  # keeps IN (...) lists under SQLite's bound-parameter limit
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def _parse_line(line: bytes):
+    """Return (record, error) for one NDJSON line."""
+    try:
+        return json.loads(line), None
+    except ValueError as e:
+        return None, f"Invalid JSON: {e}"
+
+
+async def iter_record_chunks(request: Request, chunk_size: int):
+    """Yield lists of (row, record, error) from a JSON array or NDJSON body.
+
+    NDJSON bodies are parsed while they stream in, so a large upload is handled
+    chunk by chunk without ever holding the whole payload. `row` is the 0-based
+    position of the record in the upload; `error` is set when a line is not
+    valid JSON.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    chunk = []
+    row = 0
+
+    if content_type in NDJSON_CONTENT_TYPES:
+        pending = b""
+        async for data in request.stream():
+            pending += data
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                if not line.strip():
+                    continue
+                chunk.append((row, *_parse_line(line)))
+                row += 1
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+        if pending.strip():
+            chunk.append((row, *_parse_line(pending)))
+    else:
+        try:
+            records = json.loads(await request.body())
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        for record in records:
+            chunk.append((row, record, None))
+            row += 1
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
+
+
+async def spool_upload(request: Request, path: str) -> int:
+    """Write a JSON array or NDJSON body to `path` as NDJSON; return its line count.
+
+    NDJSON is copied as it streams in (blank lines count too, so the result
+    is an upper bound); a JSON array is parsed and written one record per line.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    with open(path, "wb") as f:
+        if content_type in NDJSON_CONTENT_TYPES:
+            lines, last = 0, b"\n"
+            async for data in request.stream():
+                if data:
+                    f.write(data)
+                    lines += data.count(b"\n")
+                    last = data[-1:]
+            return lines + (last != b"\n")
+        try:
+            records = json.loads(await request.body())
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        for record in records:
+            f.write(json.dumps(record).encode())
+            f.write(b"\n")
+        return len(records)
+
+
+def iter_file_chunks(path: str, chunk_size: int):
+    """Yield lists of (row, record, error) from an NDJSON file, like iter_record_chunks.
+
+    For uploads spooled to disk and imported later by a background job.
+    """
+    chunk = []
+    row = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            chunk.append((row, *_parse_line(line)))
+            row += 1
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_record(model, record) -> tuple[Optional[object], Optional[str]]:
+    """Build `model` from a decoded record; return (obj, None) or (None, error)."""
+    if not isinstance(record, dict):
+        return None, "Row must be a JSON object"
+    try:
+        return model(**record), None
+    except ValueError as e:  # pydantic.ValidationError subclasses ValueError
+        return None, str(e)
+
+
+def summarize(results: list[dict]) -> dict:
+    counts: dict[str, int] = {}
+    for r in results:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    return counts
+
+
+def insert_ignoring_conflicts(db: Session, model, conflict_column: str, rows: list[dict]) -> int:
+    """executemany INSERT ... ON CONFLICT DO NOTHING; commit and return rows created."""
+    if not rows:
+        return 0
+    stmt = sqlite_insert(model.__table__).on_conflict_do_nothing(index_elements=[conflict_column])
+    created = db.execute(stmt, rows).rowcount
+    db.commit()
+    return created
+
+
+def create_chunk(
+    db: Session,
+    chunk,
+    schema,
+    model,
+    conflict_column: str,
+    key: Callable,
+    to_values: Callable,
+    seen: set,
+    counts: dict,
+    errors: list,
+    lookup_cache=None,
+    completions=None,
+):
+    """Validate, deduplicate and insert one chunk of (row, record, error); commits once.
+
+    Adds to `counts` (created/existing/duplicate) and `errors` in place, and
+    to `seen`, the keys of earlier chunks of the same upload.
+    """
+    rows = []
+    for row, record, error in chunk:
+        obj = None
+        if error is None:
+            obj, error = validate_record(schema, record)
+        if error:
+            errors.append({"row": row, "error": error})
+            continue
+        if key(obj) in seen:
+            counts["duplicate"] += 1
+            continue
+        seen.add(key(obj))
+        rows.append(to_values(obj))
+    try:
+        created = insert_ignoring_conflicts(db, model, conflict_column, rows)
+    except SQLAlchemyError as e:
+        db.rollback()
+        errors.extend({"row": row, "error": f"Chunk failed: {e.__class__.__name__}"} for row, _, _ in chunk)
+        return
+    counts["created"] += created
+    counts["existing"] += len(rows) - created
+    if lookup_cache is not None:
+        lookup_cache.invalidate_many(row[conflict_column] for row in rows)
+    if completions is not None:
+        completions.add_many(row[conflict_column] for row in rows)
+
+
+def upsert_inventory_chunk(db: Session, chunk, schema, on_existing: str) -> list[dict]:
+    """Validate against `schema`, resolve, create boxes for, and upsert one chunk of inventory rows; commits once.
+
+    Returns one result per (row, record, error) in `chunk`. Shared by
+    POST /inventory/bulk and inventory import jobs.
+    """
+    results: dict[int, dict] = {}
+    valid = []
+    for row, record, error in chunk:
+        item = None
+        if error is None:
+            item, error = validate_record(schema, record)
+        if error:
+            results[row] = {"row": row, "status": "error", "error": error}
+        else:
+            valid.append((row, item))
+    if not valid:
+        return [results[row] for row, _, _ in chunk]
+
+    # Set-based resolution of everything the chunk references
+    part_numbers = {i.part_number for _, i in valid}
+    known_parts = {pn for (pn,) in db.query(Part.part_number).filter(Part.part_number.in_(part_numbers))}
+    location_ids = dict(
+        db.query(Location.name, Location.location_id)
+        .filter(Location.name.in_({i.location_name for _, i in valid}))
+    )
+    boxes = {
+        code: (box_id, location_id)
+        for code, box_id, location_id in db.query(Box.code, Box.box_id, Box.location_id)
+        .filter(Box.code.in_({i.box_id for _, i in valid}))
+    }
+
+    now = datetime.now(timezone.utc)
+    new_boxes: dict[str, int] = {}
+    accepted = []
+    for row, item in valid:
+        if item.part_number not in known_parts:
+            results[row] = {"row": row, "status": "error", "error": f"Part '{item.part_number}' not found"}
+            continue
+        location_id = location_ids.get(item.location_name)
+        if location_id is None:
+            results[row] = {"row": row, "status": "error", "error": f"Location '{item.location_name}' not found"}
+            continue
+        box_location = boxes[item.box_id][1] if item.box_id in boxes else new_boxes.setdefault(item.box_id, location_id)
+        if box_location != location_id:
+            results[row] = {"row": row, "status": "error",
+                            "error": f"Box '{item.box_id}' belongs to another location"}
+            continue
+        accepted.append((row, item))
+
+    if new_boxes:
+        db.execute(sqlite_insert(Box.__table__).on_conflict_do_nothing(index_elements=["code"]), [
+            {"code": code, "location_id": location_id, "created_at": now}
+            for code, location_id in new_boxes.items()
+        ])
+        created_boxes = db.query(Box.code, Box.box_id, Box.location_id).filter(Box.code.in_(new_boxes))
+        for code, box_id, location_id in created_boxes:
+            boxes[code] = (box_id, location_id)
+        # A concurrent request may have created the same code elsewhere first;
+        # DO NOTHING kept its box, so check the location again
+        moved = {row for row, item in accepted
+                 if item.box_id in new_boxes and boxes[item.box_id][1] != new_boxes[item.box_id]}
+        for row, item in accepted:
+            if row in moved:
+                results[row] = {"row": row, "status": "error",
+                                "error": f"Box '{item.box_id}' belongs to another location"}
+        accepted = [(row, item) for row, item in accepted if row not in moved]
+
+    # Only needed to report created vs. updated; the upsert itself is race-free
+    box_ids = {boxes[i.box_id][0] for _, i in accepted}
+    existing = {
+        (box_id, pn): item_id
+        for box_id, pn, item_id in db.query(InventoryItem.box_id, InventoryItem.part_number, InventoryItem.item_id)
+        .filter(InventoryItem.box_id.in_(box_ids), InventoryItem.part_number.in_(part_numbers))
+    }
+
+    # When the same (box, part) appears more than once the last row wins, or
+    # with skip the first one does and the rest are skipped like existing rows
+    upserts: dict[tuple, dict] = {}
+    for row, item in accepted:
+        key = (boxes[item.box_id][0], item.part_number)
+        if on_existing == "skip" and (key in existing or key in upserts):
+            results[row] = {"row": row, "status": "skipped"}
+            continue
+        status = "updated" if key in existing or key in upserts else "created"
+        upserts[key] = {"box_id": key[0], "part_number": key[1], "description": item.description,
+                        "quantity": item.quantity, "updated_at": now}
+        results[row] = {"row": row, "status": status}
+
+    if upserts:
+        stmt = sqlite_insert(InventoryItem.__table__)
+        if on_existing == "skip":
+            stmt = stmt.on_conflict_do_nothing(index_elements=["box_id", "part_number"])
+        else:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["box_id", "part_number"],
+                set_={
+                    "description": stmt.excluded.description,
+                    "quantity": stmt.excluded.quantity,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+        db.execute(stmt, list(upserts.values()))
+        created = [key for key in upserts if key not in existing]
+        if created:
+            existing.update({
+                (box_id, pn): item_id
+                for box_id, pn, item_id in db.query(
+                    InventoryItem.box_id, InventoryItem.part_number, InventoryItem.item_id
+                ).filter(InventoryItem.box_id.in_({k[0] for k in created}),
+                         InventoryItem.part_number.in_({k[1] for k in created}))
+            })
+    db.commit()
+    if new_boxes:
+        autocomplete.boxes.add_many(new_boxes)
+
+    for row, item in accepted:
+        result = results[row]
+        result.update({
+            "inventory_id": existing.get((boxes[item.box_id][0], item.part_number)),
+            "box_id": item.box_id,
+            "part_number": item.part_number,
+        })
+    return [results[row] for row, _, _ in chunk]
+
+
+async def bulk_create(
+    request: Request,
+    db: Session,
+    schema,
+    model,
+    conflict_column: str,
+    key: Callable,
+    to_values: Callable,
+    chunk_size: int,
+    lookup_cache=None,
+    completions=None,
+) -> dict:
+    """Create records from a bulk body, leaving ones that already exist untouched.
+
+    Records are validated against `schema`, deduplicated in memory on `key`, and
+    inserted one transaction per chunk against the unique `conflict_column`.
+    Keys written are dropped from `lookup_cache` (an app.cache.LookupCache)
+    and added to `completions` (an app.autocomplete.PrefixIndex).
+    """
+    seen = set()
+    counts = {"created": 0, "existing": 0, "duplicate": 0}
+    errors = []
+    async for chunk in iter_record_chunks(request, chunk_size):
+        await run_in_threadpool(create_chunk, db, chunk, schema, model, conflict_column, key, to_values,
+                                seen, counts, errors, lookup_cache, completions)
+    return {**counts, "errors": errors}
@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import select
+
+from app.models.box import Box
+from app.models.location import Location
+from app.models.part import Part
+
+CACHE_SIZE = int(os.getenv("PARTS_CACHE_SIZE", "10000"))
+CACHE_TTL = float(os.getenv("PARTS_CACHE_TTL", "60"))  # seconds
+
+
+class LookupCache:
+    """Thread-safe LRU map with a per-entry TTL and hit/miss counters.
+
+    Only successful lookups are stored, so a name created after a miss is
+    found on the next call without needing an invalidation.
+    """
+
+    def __init__(self, name: str, maxsize: int = CACHE_SIZE, ttl: float = CACHE_TTL):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key) -> Optional[dict]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value: dict):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader: Callable[[], Optional[dict]]) -> Optional[dict]:
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_many(self, keys: Iterable):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+parts_by_number = LookupCache("parts_by_number")
+locations_by_name = LookupCache("locations_by_name")
+boxes_by_code = LookupCache("boxes_by_code")
+
+CACHES = (parts_by_number, locations_by_name, boxes_by_code)
+
+
+def stats() -> dict:
+    return {cache.name: cache.stats() for cache in CACHES}
+
+
+# ---------------- Lookup statements ----------------
+def _part_stmt(part_number: str):
+    return select(Part.part_id, Part.part_number, Part.description).where(Part.part_number == part_number)
+
+def _location_stmt(name: str):
+    return select(Location.location_id, Location.name, Location.description).where(Location.name == name)
+
+def _box_stmt(code: str):
+    return (
+        select(Box.box_id, Box.code, Box.location_id, Location.name)
+        .join_from(Box, Location, Location.location_id == Box.location_id, isouter=True)
+        .where(Box.code == code)
+    )
+
+def _part_value(row):
+    return {"part_id": row[0], "part_number": row[1], "description": row[2]} if row else None
+
+def _location_value(row):
+    return {"location_id": row[0], "location_name": row[1], "description": row[2] or ""} if row else None
+
+def _box_value(row):
+    return {"box_id": row[0], "code": row[1], "location_id": row[2], "location_name": row[3] or ""} if row else None
+
+
+# ---------------- Sync resolution ----------------
+def resolve_part(db, part_number: str) -> Optional[dict]:
+    """part_number -> {part_id, part_number, description}, or None."""
+    return parts_by_number.get_or_load(
+        part_number, lambda: _part_value(db.execute(_part_stmt(part_number)).first()))
+
+def resolve_location(db, name: str) -> Optional[dict]:
+    """Location name -> {location_id, location_name, description}, or None."""
+    return locations_by_name.get_or_load(
+        name, lambda: _location_value(db.execute(_location_stmt(name)).first()))
+
+def resolve_box(db, code: str) -> Optional[dict]:
+    """Box code -> {box_id, code, location_id, location_name}, or None."""
+    return boxes_by_code.get_or_load(
+        code, lambda: _box_value(db.execute(_box_stmt(code)).first()))
+
+
+# ---------------- Async resolution (AsyncSession) ----------------
+async def _get_or_load_async(cache: LookupCache, db, key, stmt, to_value) -> Optional[dict]:
+    value = cache.get(key)
+    if value is None:
+        value = to_value((await db.execute(stmt)).first())
+        if value is not None:
+            cache.set(key, value)
+    return value
+
+async def resolve_part_async(db, part_number: str) -> Optional[dict]:
+    return await _get_or_load_async(parts_by_number, db, part_number, _part_stmt(part_number), _part_value)
+
+async def resolve_location_async(db, name: str) -> Optional[dict]:
+    return await _get_or_load_async(locations_by_name, db, name, _location_stmt(name), _location_value)
+
+async def resolve_box_async(db, code: str) -> Optional[dict]:
+    return await _get_or_load_async(boxes_by_code, db, code, _box_stmt(code), _box_value)
@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# Days of history kept when the change log is pruned at startup; 0 keeps everything
+KEEP_DAYS = int(os.getenv("PARTS_CHANGES_KEEP_DAYS", "30"))
+
+# entity -> (table, primary key, {delta field: column}). Field names follow the
+# API's except inventory.box_id / boxes.location_id, which are the numeric IDs
+# of the referenced rows so a mirror can join them itself.
+TRACKED = {
+    "parts": ("parts", "part_id", {
+        "part_id": "part_id", "part_number": "part_number", "description": "description",
+    }),
+    "locations": ("locations", "location_id", {
+        "location_id": "location_id", "location_name": "name", "description": "description",
+    }),
+    "boxes": ("boxes", "box_id", {
+        "box_id": "box_id", "code": "code", "location_id": "location_id",
+    }),
+    "inventory": ("inventory", "item_id", {
+        "inventory_id": "item_id", "box_id": "box_id", "part_number": "part_number",
+        "description": "description", "quantity": "quantity",
+    }),
+}
+
+
+def _json_object(fields, prefix):
+    return "json_object(" + ", ".join(f"'{field}', {prefix}.{column}" for field, column in fields.items()) + ")"
+
+
+def trigger_statements():
+    """CREATE TRIGGER statements that log every write on the tracked tables.
+
+    Triggers rather than calls in each route, so bulk upserts, FK cascades
+    and the async routes are captured in the same transaction as the write.
+    """
+    for entity, (table, pk, fields) in TRACKED.items():
+        upsert = (
+            f"INSERT INTO changes (entity, entity_id, op, data) "
+            f"VALUES ('{entity}', NEW.{pk}, 'upsert', {_json_object(fields, 'NEW')});"
+        )
+        delete = (
+            f"INSERT INTO changes (entity, entity_id, op, data) "
+            f"VALUES ('{entity}', OLD.{pk}, 'delete', NULL);"
+        )
+        yield f"CREATE TRIGGER IF NOT EXISTS trg_{table}_log_insert AFTER INSERT ON {table} BEGIN {upsert} END"
+        yield f"CREATE TRIGGER IF NOT EXISTS trg_{table}_log_update AFTER UPDATE ON {table} BEGIN {upsert} END"
+        yield f"CREATE TRIGGER IF NOT EXISTS trg_{table}_log_delete AFTER DELETE ON {table} BEGIN {delete} END"
+
+
+def install_triggers(conn):
+    for statement in trigger_statements():
+        conn.execute(text(statement))
+
+
+def seed_baseline(conn) -> int:
+    """Log the current rows as upserts when the change log is empty.
+
+    Databases that predate the log would otherwise give `since=0` an
+    incomplete picture. Returns the number of rows logged.
+    """
+    if conn.execute(text("SELECT 1 FROM changes LIMIT 1")).first():
+        return 0
+    logged = 0
+    for entity, (table, pk, fields) in TRACKED.items():
+        logged += conn.execute(text(
+            f"INSERT INTO changes (entity, entity_id, op, data) "
+            f"SELECT '{entity}', t.{pk}, 'upsert', {_json_object(fields, 't')} FROM {table} t ORDER BY t.{pk}"
+        )).rowcount
+    if logged:
+        logger.info("Seeded change log with %d existing rows", logged)
+    return logged
+
+
+def prune(conn, keep_days: int = KEEP_DAYS) -> int:
+    """Drop changes older than `keep_days` that no longer matter to a full replay.
+
+    Removes a row's changes once a newer one exists, and delete tombstones,
+    so the log shrinks to the latest upsert of each surviving row plus recent
+    history: `since=0` still replays everything. Superseded changes are never
+    needed by a mirror; a pruned delete is, so the newest one raises
+    min_since. Returns the number of changes removed.
+    """
+    if keep_days <= 0:
+        return 0
+    age = {"age": f"-{keep_days} days"}
+    newest_delete = conn.execute(text(
+        "SELECT MAX(seq) FROM changes WHERE op = 'delete' AND changed_at < datetime('now', :age)"
+    ), age).scalar()
+    removed = conn.execute(text("""
+        DELETE FROM changes
+        WHERE changed_at < datetime('now', :age)
+          AND (op = 'delete' OR EXISTS (
+              SELECT 1 FROM changes newer
+              WHERE newer.entity = changes.entity AND newer.entity_id = changes.entity_id
+                AND newer.seq > changes.seq
+          ))
+    """), age).rowcount
+    if newest_delete:
+        conn.execute(text(
+            "INSERT INTO change_log_state (id, min_since) VALUES (1, :seq) "
+            "ON CONFLICT (id) DO UPDATE SET min_since = MAX(min_since, excluded.min_since)"
+        ), {"seq": newest_delete})
+    if removed:
+        logger.info("Pruned %d changes older than %d days from the change log", removed, keep_days)
+    return removed
+
+
+def min_since(conn) -> int:
+    """Smallest `since` other than 0 that still gets a complete delta; below it, resync."""
+    return conn.execute(text("SELECT min_since FROM change_log_state WHERE id = 1")).scalar() or 0
+
+
+def compact(rows):
+    """Keep only the newest change per (entity, id), in sequence order."""
+    latest = {}
+    for row in rows:
+        latest[(row.entity, row.entity_id)] = row
+    return [
+        {
+            "seq": row.seq,
+            "entity": row.entity,
+            "id": row.entity_id,
+            "op": row.op,
+            "data": json.loads(row.data) if row.data else None,
+        }
+        for row in sorted(latest.values(), key=lambda r: r.seq)
+    ]
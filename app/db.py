@@ -1,8 +1,58 @@
-from sqlalchemy import create_engine
+import os
+from typing import Optional
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from app import metrics, querylog
 from app.base import Base  # now cleanly imported
 
-engine = create_engine("sqlite:///parts_inventory.db", connect_args={"check_same_thread": False})
+try:
+    from dotenv import load_dotenv  # optional: pick up settings from a .env file
+    load_dotenv()
+except ImportError:
+    pass
+
+DATABASE_URL = os.getenv("PARTS_DB_URL", "sqlite:///parts_inventory.db")
+
+# Applied to every new SQLite connection in the pool; each one can be
+# overridden (or disabled with an empty value) through its environment variable.
+SQLITE_PRAGMAS = {
+    # Enforce foreign key constraints (prevents orphaned records)
+    "foreign_keys": os.getenv("PARTS_DB_FOREIGN_KEYS", "ON"),
+    # Write-Ahead Logging lets readers run alongside the single writer
+    "journal_mode": os.getenv("PARTS_DB_JOURNAL_MODE", "WAL"),
+    # NORMAL is durable under WAL except for power loss, and skips most fsyncs
+    "synchronous": os.getenv("PARTS_DB_SYNCHRONOUS", "NORMAL"),
+    # Negative values are KiB: 64 MiB page cache per connection
+    "cache_size": os.getenv("PARTS_DB_CACHE_SIZE", "-65536"),
+    "mmap_size": os.getenv("PARTS_DB_MMAP_SIZE", str(256 * 1024 * 1024)),
+    "temp_store": os.getenv("PARTS_DB_TEMP_STORE", "MEMORY"),
+    # Milliseconds a writer waits on a locked database before failing
+    "busy_timeout": os.getenv("PARTS_DB_BUSY_TIMEOUT", "5000"),
+}
+
+def apply_sqlite_pragmas(dbapi_conn, pragmas: dict):
+    cursor = dbapi_conn.cursor()
+    for name, value in pragmas.items():
+        if value not in (None, ""):
+            cursor.execute(f"PRAGMA {name}={value};")
+    cursor.close()
+
+def create_db_engine(url: str = DATABASE_URL, pragmas: Optional[dict] = None):
+    """Create an engine; SQLite connections get `pragmas` (default SQLITE_PRAGMAS)."""
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    if engine.dialect.name == "sqlite":
+        pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragma(dbapi_conn, conn_record):
+            apply_sqlite_pragmas(dbapi_conn, pragmas)
+    return engine
+
+engine = create_db_engine()
+# Per-request statement counts and DB time for /metrics
+metrics.instrument(engine)
+# Opt-in slow-query log and route query budgets (PARTS_SLOW_QUERY_MS, PARTS_QUERY_BUDGET)
+querylog.install(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base.metadata.create_all(bind=engine)
@@ -0,0 +1,81 @@
+from functools import lru_cache
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+from app.db import engine
+
+# Tables whose versions ETags are built from; triggers bump a table's counter
+# in table_versions in the same transaction as every write to it, so the tags
+# agree across server processes and survive restarts.
+TABLES = ("parts", "locations", "boxes", "inventory")
+
+
+def trigger_statements():
+    """CREATE TRIGGER statements counting every write on the tagged tables.
+
+    Triggers rather than calls in each route, so bulk upserts, FK cascades,
+    import jobs and the async routes all move the version with the write.
+    """
+    for table in TABLES:
+        bump = f"UPDATE table_versions SET version = version + 1 WHERE name = '{table}';"
+        for op in ("INSERT", "UPDATE", "DELETE"):
+            yield (
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{op.lower()} "
+                f"AFTER {op} ON {table} BEGIN {bump} END"
+            )
+
+
+def install_triggers(conn):
+    conn.execute(text(
+        "INSERT OR IGNORE INTO table_versions (name, version) VALUES "
+        + ", ".join(f"('{table}', 0)" for table in TABLES)
+    ))
+    for statement in trigger_statements():
+        conn.execute(text(statement))
+
+
+def bump(conn, *tables: str):
+    """Change the tags of `tables` for a write their triggers do not see (e.g. rebuilt totals)."""
+    for table in tables:
+        conn.execute(text("UPDATE table_versions SET version = version + 1 WHERE name = :name"), {"name": table})
+
+
+@lru_cache(maxsize=None)
+def _versions_query(tables: tuple):
+    unknown = set(tables) - set(TABLES)
+    if unknown:
+        raise ValueError(f"No ETag version for {sorted(unknown)}")
+    names = ", ".join(f"'{table}'" for table in tables)
+    return text(f"SELECT name, version FROM table_versions WHERE name IN ({names})")
+
+
+def etag_for(*tables: str) -> str:
+    """Current ETag for a response built from `tables`; one primary-key lookup."""
+    with engine.connect() as conn:
+        versions = dict(conn.execute(_versions_query(tables)).all())
+    return 'W/"' + ".".join(str(versions.get(t, 0)) for t in tables) + '"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison: W/"x" and "x" name the same representation
+    bare = etag.removeprefix("W/")
+    return "*" in candidates or any(tag.removeprefix("W/") == bare for tag in candidates)
+
+
+def conditional(*tables: str):
+    """Dependency for read routes whose result depends only on `tables`.
+
+    Answers 304 when the client's If-None-Match still matches; otherwise tags
+    the response with the current ETag. The tag is taken before the query
+    runs, so a write racing with the read can only make the next request
+    refetch, never serve stale data as current. Reading the tag is one SQL
+    statement, which counts against the route's querylog.budget.
+    """
+    async def check_etag(request: Request, response: Response):
+        etag = await run_in_threadpool(etag_for, *tables)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _matches(if_none_match, etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+    return check_etag
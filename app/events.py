@@ -0,0 +1,162 @@
+import asyncio
+import os
+from sqlalchemy import bindparam, event, text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.changes import compact, min_since
+from app.db import SessionLocal
+
+# Events buffered per subscriber before it is considered too slow
+QUEUE_SIZE = int(os.getenv("PARTS_EVENTS_QUEUE", "1000"))
+# Fallback poll of the change log for writes made by other processes
+POLL_INTERVAL = float(os.getenv("PARTS_EVENTS_POLL", "1.0"))
+BATCH_SIZE = 500
+
+# Sent instead of the dropped backlog when a subscriber's queue overflows
+RESYNC = {"type": "resync"}
+
+
+def changes_after(seq: int, limit: int = BATCH_SIZE):
+    """Compacted changes after `seq`, with box code and location name added to inventory upserts.
+
+    Returns (changes, last seq read, whether more rows are waiting).
+    """
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            text("SELECT seq, entity, entity_id, op, data FROM changes WHERE seq > :seq ORDER BY seq LIMIT :limit"),
+            {"seq": seq, "limit": limit},
+        ).all()
+        changes = compact(rows)
+        box_ids = {c["data"]["box_id"] for c in changes if c["entity"] == "inventory" and c["data"]}
+        if box_ids:
+            boxes = db.execute(
+                text(
+                    "SELECT b.box_id, b.code, l.name FROM boxes b "
+                    "LEFT JOIN locations l ON l.location_id = b.location_id "
+                    "WHERE b.box_id IN :ids"
+                ).bindparams(bindparam("ids", expanding=True)),
+                {"ids": list(box_ids)},
+            ).all()
+            by_id = {b.box_id: (b.code, b.name or "") for b in boxes}
+            for c in changes:
+                if c["entity"] == "inventory" and c["data"]:
+                    c["data"]["box_code"], c["data"]["location_name"] = by_id.get(c["data"]["box_id"], (None, None))
+        return changes, (rows[-1].seq if rows else seq), len(rows) == limit
+    finally:
+        db.close()
+
+
+def head_seq() -> int:
+    db = SessionLocal()
+    try:
+        return db.execute(text("SELECT COALESCE(MAX(seq), 0) FROM changes")).scalar()
+    finally:
+        db.close()
+
+
+def oldest_since() -> int:
+    db = SessionLocal()
+    try:
+        return min_since(db)
+    finally:
+        db.close()
+
+
+class Subscription:
+    """One client's bounded event queue."""
+
+    def __init__(self, maxsize: int = QUEUE_SIZE):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def offer(self, item):
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Slow consumer: rather than buffer without limit or block the
+            # publisher, drop its backlog and tell it to refetch.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(RESYNC)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class Broker:
+    """In-process pub/sub of change log entries.
+
+    Every committed transaction wakes a single tailer task (see notify), which
+    reads the new change log rows once and fans them out to every subscriber.
+    The tailer runs only while someone is subscribed.
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self._loop = None
+        self._wake = None
+        self._task = None
+        # Serializes starting the tailer; one per event loop
+        self._starting = None
+        self.last_seq = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def notify(self):
+        """Wake the tailer; safe to call from any thread."""
+        loop = self._loop
+        if loop is not None and self._subscribers:
+            loop.call_soon_threadsafe(self._wake.set)
+
+    async def subscribe(self) -> Subscription:
+        loop = asyncio.get_running_loop()
+        if self._starting is None or self._loop is not loop:
+            self._loop, self._starting = loop, asyncio.Lock()
+        # Held across the head_seq read, so clients subscribing together
+        # share one tailer instead of each starting their own
+        async with self._starting:
+            if self._task is None or self._task.done():
+                self._wake = asyncio.Event()
+                self.last_seq = await run_in_threadpool(head_seq)
+                self._task = asyncio.create_task(self._tail())
+            subscription = Subscription()
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+        if not self._subscribers and self._wake is not None:
+            self._wake.set()  # let the tailer notice and exit
+
+    def publish(self, item):
+        for subscription in list(self._subscribers):
+            subscription.offer(item)
+
+    async def _tail(self):
+        while self._subscribers:
+            try:
+                await asyncio.wait_for(self._wake.wait(), POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._subscribers:
+                break
+            changes, self.last_seq, more = await run_in_threadpool(changes_after, self.last_seq)
+            for change in changes:
+                self.publish(change)
+            if more:
+                self._wake.set()  # more waiting; go again without sleeping
+
+
+broker = Broker()
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session):
+    # Fires once the commit is visible to other connections; covers sync and
+    # async sessions alike and is a no-op without subscribers
+    broker.notify()
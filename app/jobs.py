@@ -0,0 +1,374 @@
+import glob
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import delete, insert, select, update
+
+from app.db import engine
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Jobs run at once by one server process; later submissions wait their turn
+JOB_WORKERS = int(os.getenv("PARTS_JOB_WORKERS", "2"))
+# Queued plus running jobs one process accepts before submit() refuses more
+MAX_PENDING_JOBS = int(os.getenv("PARTS_MAX_PENDING_JOBS", "100"))
+# Finished jobs kept, with their files, before the oldest are deleted
+KEEP_FINISHED_JOBS = int(os.getenv("PARTS_KEEP_FINISHED_JOBS", "500"))
+# Uploads waiting to be imported and the files jobs write
+JOBS_DIR = os.getenv("PARTS_JOBS_DIR") or os.path.join(tempfile.gettempdir(), "parts_jobs")
+# Progress is written to the jobs table at most this often (seconds) per job
+PROGRESS_INTERVAL = 0.5
+
+STATUSES = ("queued", "running", "done", "failed", "cancelled")
+FINISHED = ("done", "failed", "cancelled")
+
+# kind -> fn(ctx: JobContext, params: dict) -> result dict; see app.tasks
+HANDLERS: Dict[str, Callable] = {}
+
+_table = Job.__table__
+
+
+class JobCancelled(Exception):
+    """Raised by JobContext inside a handler whose job should stop."""
+
+
+class QueueFull(Exception):
+    """submit() found MAX_PENDING_JOBS already queued or running in this process."""
+
+
+def handler(kind: str):
+    """Register the decorated fn(ctx, params) as the handler for jobs of `kind`.
+
+    It runs on a worker thread with its own sessions, should call
+    ctx.progress() between units of work, and returns a JSON-able result.
+    Result keys starting with "_" are kept out of API responses; "_file"
+    names a file that GET /jobs/{job_id}/result sends instead.
+    """
+    def register(fn):
+        HANDLERS[kind] = fn
+        return fn
+    return register
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+class JobContext:
+    """Progress reporting and cancellation for the handler of one running job."""
+
+    def __init__(self, job_id: int, cancelled: threading.Event):
+        self.job_id = job_id
+        self.done = 0
+        self.total: Optional[int] = None
+        self.message: Optional[str] = None
+        self._cancelled = cancelled
+        self._written_at: Optional[float] = None
+
+    def check(self):
+        """Raise JobCancelled if the job was cancelled (or the server is stopping)."""
+        if self._cancelled.is_set():
+            raise JobCancelled()
+
+    def progress(self, done: int, total: Optional[int] = None, message: Optional[str] = None):
+        """Record progress, then stop the handler if the job was cancelled.
+
+        Written to the jobs table when the message changes or PROGRESS_INTERVAL
+        has passed, so handlers can call it after every chunk. The write also
+        picks up cancellations made through another server process.
+        """
+        self.check()
+        changed = message is not None and message != self.message
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+        now = time.monotonic()
+        if not changed and self._written_at is not None and now - self._written_at < PROGRESS_INTERVAL:
+            return
+        self._written_at = now
+        with engine.begin() as conn:
+            cancel = conn.execute(
+                update(_table).where(_table.c.job_id == self.job_id)
+                .values(progress=self.done, total=self.total, message=self.message)
+                .returning(_table.c.cancel_requested)
+            ).scalar()
+        if cancel:
+            self._cancelled.set()
+            raise JobCancelled()
+
+    def output_path(self, filename: str) -> str:
+        """Where the handler should write a result file; deleted along with the job."""
+        os.makedirs(JOBS_DIR, exist_ok=True)
+        return os.path.join(JOBS_DIR, f"job-{self.job_id}-{filename}")
+
+
+# Jobs queued or running in this process -> their cancel flag
+_active: Dict[int, threading.Event] = {}
+_running: set = set()
+_lock = threading.Lock()
+_idle = threading.Condition(_lock)
+_executor: Optional[ThreadPoolExecutor] = None
+_stopping = False
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="parts-job")
+    return _executor
+
+
+def _public(values: Optional[dict]) -> dict:
+    return {k: v for k, v in (values or {}).items() if not k.startswith("_")}
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _as_dict(row, with_result: bool = False) -> dict:
+    job = {
+        "job_id": row.job_id,
+        "kind": row.kind,
+        "status": row.status,
+        "params": _public(json.loads(row.params or "{}")),
+        "progress": row.progress,
+        "total": row.total,
+        "message": row.message,
+        "error": row.error,
+        "cancel_requested": row.cancel_requested,
+        "created_at": _iso(row.created_at),
+        "started_at": _iso(row.started_at),
+        "finished_at": _iso(row.finished_at),
+    }
+    if with_result:
+        job["result"] = json.loads(row.result) if row.result else None
+    return job
+
+
+def submit(kind: str, params: dict) -> dict:
+    """Queue a job of `kind` and return it; raises QueueFull when this process is saturated."""
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind '{kind}'")
+    with _lock:
+        if len(_active) >= MAX_PENDING_JOBS:
+            raise QueueFull(f"{len(_active)} jobs are already queued or running; try again later")
+        with engine.begin() as conn:
+            _prune(conn)
+            job_id = conn.execute(
+                insert(_table).values(kind=kind, status="queued", params=json.dumps(params))
+            ).inserted_primary_key[0]
+        _active[job_id] = threading.Event()
+    _pool().submit(_run, job_id)
+    return get(job_id)
+
+
+def get(job_id: int, with_result: bool = False) -> Optional[dict]:
+    with engine.connect() as conn:
+        row = conn.execute(select(_table).where(_table.c.job_id == job_id)).first()
+    return _as_dict(row, with_result) if row else None
+
+
+def list_jobs(status: Optional[str], kind: Optional[str], before: Optional[int], limit: int):
+    """One page of jobs, newest first: (items, next_cursor to pass back as `before`)."""
+    stmt = select(_table)
+    if status is not None:
+        stmt = stmt.where(_table.c.status == status)
+    if kind is not None:
+        stmt = stmt.where(_table.c.kind == kind)
+    if before is not None:
+        stmt = stmt.where(_table.c.job_id < before)
+    with engine.connect() as conn:
+        rows = conn.execute(stmt.order_by(_table.c.job_id.desc()).limit(limit + 1)).all()
+    next_cursor = rows[limit - 1].job_id if len(rows) > limit else None
+    return [_as_dict(row) for row in rows[:limit]], next_cursor
+
+
+def cancel(job_id: int) -> Optional[dict]:
+    """Ask a job to stop: queued jobs end at once, running ones at their next progress check.
+
+    Work a handler has already committed (e.g. earlier import chunks) stays.
+    """
+    with engine.begin() as conn:
+        row = conn.execute(
+            update(_table).where(_table.c.job_id == job_id, _table.c.status == "queued")
+            .values(status="cancelled", cancel_requested=True, finished_at=_now())
+            .returning(_table.c.params)
+        ).first()
+        if row is None:
+            conn.execute(
+                update(_table).where(_table.c.job_id == job_id, _table.c.status == "running")
+                .values(cancel_requested=True)
+            )
+    if row is not None:
+        _discard_upload(row.params)
+    with _lock:
+        flag = _active.get(job_id)
+    if flag is not None:
+        flag.set()
+    return get(job_id)
+
+
+def _run(job_id: int):
+    try:
+        with _lock:
+            flag = _active.get(job_id)
+            if _stopping or flag is None:
+                return  # left queued for the next server start
+            _running.add(job_id)
+        with engine.begin() as conn:
+            # Claimed atomically: another process recovering queued jobs may race for it
+            row = conn.execute(
+                update(_table).where(_table.c.job_id == job_id, _table.c.status == "queued")
+                .values(status="running", started_at=_now(), owner=os.getpid())
+                .returning(_table.c.kind, _table.c.params)
+            ).first()
+        if row is None:
+            return  # cancelled while queued, or taken by another process
+        ctx = JobContext(job_id, flag)
+        try:
+            fn = HANDLERS.get(row.kind)
+            if fn is None:
+                raise ValueError(f"No handler for job kind '{row.kind}'")
+            result = fn(ctx, json.loads(row.params or "{}"))
+        except JobCancelled:
+            if _stopping and _requeue(job_id):
+                return
+            _finish(job_id, ctx, "cancelled", params=row.params)
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job_id, row.kind)
+            _finish(job_id, ctx, "failed", params=row.params, error=f"{e.__class__.__name__}: {e}")
+        else:
+            _finish(job_id, ctx, "done", params=row.params, result=result)
+    finally:
+        with _lock:
+            _active.pop(job_id, None)
+            _running.discard(job_id)
+            _idle.notify_all()
+
+
+def _finish(job_id: int, ctx: JobContext, status: str, params: Optional[str],
+            result: Optional[dict] = None, error: Optional[str] = None):
+    values = {"status": status, "progress": ctx.done, "message": ctx.message, "finished_at": _now(), "error": error}
+    if status == "done":
+        values["total"] = ctx.total if ctx.total is not None else ctx.done
+        values["result"] = json.dumps(result if result is not None else {})
+    with engine.begin() as conn:
+        conn.execute(update(_table).where(_table.c.job_id == job_id).values(**values))
+    _discard_upload(params)
+    logger.info("Job %s %s", job_id, status)
+
+
+def _requeue(job_id: int) -> bool:
+    """Put a job interrupted by shutdown back in the queue, unless it was also cancelled.
+
+    Every handler is safe to run again from the start.
+    """
+    with engine.begin() as conn:
+        return bool(conn.execute(
+            update(_table).where(_table.c.job_id == job_id, _table.c.cancel_requested.is_(False))
+            .values(status="queued", progress=0, message=None, started_at=None, owner=None)
+        ).rowcount)
+
+
+def _discard_upload(params: Optional[str]):
+    upload = json.loads(params or "{}").get("_upload")
+    if upload and os.path.exists(upload):
+        os.remove(upload)
+
+
+def _prune(conn):
+    """Delete finished jobs beyond the newest KEEP_FINISHED_JOBS, and their files."""
+    cutoff = conn.execute(
+        select(_table.c.job_id).where(_table.c.status.in_(FINISHED))
+        .order_by(_table.c.job_id.desc()).offset(KEEP_FINISHED_JOBS).limit(1)
+    ).scalar()
+    if cutoff is None:
+        return
+    old = conn.execute(
+        select(_table.c.job_id).where(_table.c.status.in_(FINISHED), _table.c.job_id <= cutoff)
+    ).scalars().all()
+    conn.execute(delete(_table).where(_table.c.job_id.in_(old)))
+    for job_id in old:
+        for path in glob.glob(os.path.join(JOBS_DIR, f"job-{job_id}-*")):
+            os.remove(path)
+
+
+def _alive(job_id: int, pid: Optional[int]) -> bool:
+    """Whether the process that claimed a running job still runs it."""
+    if pid == os.getpid():
+        return job_id in _running
+    if not pid or os.name == "nt":  # os.kill(pid, 0) would terminate it on Windows
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def recover():
+    """Settle the jobs left behind by server processes that have exited.
+
+    Running jobs whose process is gone are marked failed; queued ones are
+    picked up by this process. Called when the app is created.
+    """
+    global _stopping
+    _stopping = False
+    with engine.begin() as conn:
+        rows = conn.execute(
+            select(_table.c.job_id, _table.c.status, _table.c.owner, _table.c.params)
+            .where(_table.c.status.in_(("queued", "running")))
+        ).all()
+        with _lock:
+            lost = [row for row in rows if row.status == "running" and not _alive(row.job_id, row.owner)]
+            queued = [row.job_id for row in rows if row.status == "queued" and row.job_id not in _active]
+            for job_id in queued:
+                _active[job_id] = threading.Event()
+        if lost:
+            conn.execute(
+                update(_table).where(_table.c.job_id.in_([row.job_id for row in lost]))
+                .values(status="failed", error="Interrupted: the server process running it exited",
+                        finished_at=_now())
+            )
+            logger.warning("Marked %d interrupted jobs as failed", len(lost))
+    for row in lost:
+        _discard_upload(row.params)
+    for job_id in queued:
+        _pool().submit(_run, job_id)
+
+
+def shutdown():
+    """Stop taking up queued jobs and interrupt running ones.
+
+    Interrupted jobs go back to the queue and run again from the start on
+    the next server start, as do jobs that never started.
+    """
+    global _stopping
+    with _lock:
+        _stopping = True
+        for flag in _active.values():
+            flag.set()
+
+
+def drain(timeout: Optional[float] = None) -> bool:
+    """Wait until this process has no queued or running jobs; False on timeout."""
+    with _idle:
+        return _idle.wait_for(lambda: not _active, timeout)
+
+
+def stats() -> dict:
+    with _lock:
+        return {"queued": len(_active) - len(_running), "running": len(_running)}
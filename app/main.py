@@ -1,19 +1,75 @@
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from app import jobs
+from app.autocomplete import load as load_autocomplete
+from app.changes import prune as prune_changes
 from app.db import engine
+from app.metrics import MetricsMiddleware
+from app.migrations import upgrade
 from app.models import Base
 
-def create_app():
-    app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Running background jobs stop at their next progress check and, like
+    # the ones still queued, start over when the server comes back
+    jobs.shutdown()
+
+def create_app(async_db: Optional[bool] = None):
+    """Build the API.
+
+    With async_db=True (or PARTS_DB_ASYNC=1) the CRUD and search routes run as
+    coroutines on an aiosqlite AsyncSession instead of occupying a threadpool
+    worker each; bulk, export and report routes stay on the sync Session.
+    """
+    if async_db is None:
+        async_db = os.getenv("PARTS_DB_ASYNC", "0") == "1"
+
+    app = FastAPI(lifespan=lifespan)
+    # Compress larger JSON bodies for clients that send Accept-Encoding: gzip
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Outermost, so latency and response sizes are what the client sees; see /metrics
+    app.add_middleware(MetricsMiddleware)
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
+    # Add indexes declared since the database was created
+    upgrade(engine)
+    # Bound the change log: drop superseded history older than PARTS_CHANGES_KEEP_DAYS
+    with engine.begin() as conn:
+        prune_changes(conn)
+    # In-memory prefix indexes behind /autocomplete, kept current by the write routes
+    load_autocomplete(engine)
+
+    if async_db:
+        # Registered first so they take precedence over their sync counterparts
+        from app.async_routes import boxes as async_boxes, inventory as async_inventory
+        from app.async_routes import locations as async_locations, parts as async_parts
+        app.include_router(async_boxes.router)
+        app.include_router(async_inventory.router)
+        app.include_router(async_locations.router)
+        app.include_router(async_parts.router)
 
     # Import and include routers
     #from app.routes import locations, boxes, inventory, parts
-    from app.routes import boxes, inventory, locations, parts
+    from app.routes import autocomplete, boxes, changes, events, inventory, jobs as job_routes, locations, monitoring
+    from app.routes import parts, reports
     app.include_router(boxes.router)
     app.include_router(inventory.router)
     app.include_router(locations.router)
     app.include_router(parts.router)
+    app.include_router(changes.router)
+    app.include_router(events.router)
+    app.include_router(autocomplete.router)
+    app.include_router(monitoring.router)
+    app.include_router(reports.router)
+    app.include_router(job_routes.router)
+
+    # Run the jobs a previous server process left queued; the jobs router
+    # imports app.tasks, which registers their handlers
+    jobs.recover()
 
     return app
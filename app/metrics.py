@@ -0,0 +1,224 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import event
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+
+# Route label of requests no route matched, so arbitrary paths cannot grow the label set
+UNMATCHED = "<unmatched>"
+
+
+class RequestStats:
+    """Statements run on behalf of one request, filled in by the engine hooks.
+
+    `budget` is the route's declared statement limit, if any (see app.querylog).
+    """
+
+    __slots__ = ("request", "queries", "db_seconds", "budget", "over_budget")
+
+    def __init__(self, request: str = ""):
+        self.request = request
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.budget: Optional[int] = None
+        self.over_budget = False
+
+
+# Set by MetricsMiddleware for the duration of a request. Starlette copies the
+# context into threadpool workers and background tasks, so the sync routes'
+# queries are counted against the request that issued them.
+_current: ContextVar[Optional[RequestStats]] = ContextVar("parts_request_stats", default=None)
+
+
+def current() -> Optional[RequestStats]:
+    """Stats of the request being served in this context, or None outside one."""
+    return _current.get()
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RequestMetrics:
+    """Per-route request, latency, size and query counters.
+
+    Each finished request takes the lock once to update its series; the
+    Prometheus text is only built when /metrics is scraped.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.sizes: Dict[Tuple[str, str], Histogram] = {}
+        self.queries: Dict[Tuple[str, str], Histogram] = {}
+        self.db_seconds: Dict[Tuple[str, str], float] = {}
+
+    def started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, method: str, route: str, status: int, seconds: float, size: int, stats: RequestStats):
+        key = (method, route)
+        with self._lock:
+            self.in_flight -= 1
+            self.requests[(method, route, status)] = self.requests.get((method, route, status), 0) + 1
+            self._series(self.latency, key, LATENCY_BUCKETS).observe(seconds)
+            self._series(self.sizes, key, SIZE_BUCKETS).observe(size)
+            self._series(self.queries, key, QUERY_BUCKETS).observe(stats.queries)
+            self.db_seconds[key] = self.db_seconds.get(key, 0.0) + stats.db_seconds
+
+    @staticmethod
+    def _series(table: Dict, key, buckets) -> Histogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = Histogram(buckets)
+        return histogram
+
+    def reset(self):
+        with self._lock:
+            self.requests.clear()
+            self.latency.clear()
+            self.sizes.clear()
+            self.queries.clear()
+            self.db_seconds.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            requests = dict(self.requests)
+            histograms = [(name, help_text, {key: _copy(h) for key, h in table.items()})
+                          for name, help_text, table in (
+                              ("parts_http_request_duration_seconds", "Request latency by route", self.latency),
+                              ("parts_http_response_size_bytes", "Response body size (after compression)",
+                               self.sizes),
+                              ("parts_db_queries_per_request", "SQL statements run per request", self.queries),
+                          )]
+            db_seconds = dict(self.db_seconds)
+            in_flight = self.in_flight
+        lines = family("parts_http_requests_in_flight", "gauge", "Requests being served", {(): in_flight})
+        lines += family("parts_http_requests_total", "counter", "Requests by route and status", {
+            (("method", m), ("route", r), ("status", str(s))): n for (m, r, s), n in requests.items()
+        })
+        for name, help_text, table in histograms:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for (method, route), histogram in table.items():
+                lines += _histogram_lines(name, (("method", method), ("route", route)), histogram)
+        lines += family("parts_db_seconds_total", "counter", "Time spent in SQL statements by route", {
+            (("method", m), ("route", r)): round(s, 6) for (m, r), s in db_seconds.items()
+        })
+        return "\n".join(lines) + "\n"
+
+
+def _copy(histogram: Histogram) -> Histogram:
+    copy = Histogram(histogram.buckets)
+    copy.counts, copy.sum, copy.count = list(histogram.counts), histogram.sum, histogram.count
+    return copy
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Iterable[Tuple[str, str]]) -> str:
+    text = ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels)
+    return f"{{{text}}}" if text else ""
+
+
+def _number(value) -> str:
+    return "+Inf" if value == float("inf") else repr(value) if isinstance(value, float) else str(value)
+
+
+def _histogram_lines(name: str, labels: Tuple, histogram: Histogram):
+    cumulative = 0
+    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+        cumulative += count
+        yield f"{name}_bucket{_labels(labels + (('le', _number(float(bound))),))} {cumulative}"
+    yield f"{name}_sum{_labels(labels)} {_number(round(histogram.sum, 6))}"
+    yield f"{name}_count{_labels(labels)} {histogram.count}"
+
+
+def family(name: str, kind: str, help_text: str, samples: Dict[Tuple, float]) -> list:
+    """Prometheus text lines for one metric: samples maps label pairs to a value."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines += [f"{name}{_labels(labels)} {_number(value)}" for labels, value in samples.items()]
+    return lines
+
+
+registry = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording each HTTP request in `registry`.
+
+    Plain ASGI rather than BaseHTTPMiddleware, so streamed responses pass
+    through untouched; a request ends when its last body chunk is sent.
+    Routes are labelled by their template (/parts/{part_id}), not the path.
+    """
+
+    def __init__(self, app, registry: RequestMetrics = registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats(f"{scope['method']} {scope['path']}")
+        token = _current.set(stats)
+        status, size = 500, 0
+
+        async def send_counted(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        self.registry.started()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_counted)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            # path_format drops convertors, so the sync and async twins share a label
+            label = getattr(route, "path_format", None) or UNMATCHED
+            self.registry.finished(scope["method"], label, status, time.perf_counter() - start, size, stats)
+
+
+def instrument(engine):
+    """Count each statement run on engine, and its time, against the current request."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info["metrics_query_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end_query(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        start = conn.info.pop("metrics_query_start", None)
+        if stats is not None and start is not None:
+            stats.queries += 1
+            stats.db_seconds += time.perf_counter() - start
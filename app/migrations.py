@@ -0,0 +1,59 @@
+import logging
+from sqlalchemy import text
+from app.base import Base
+from app.changes import seed_baseline
+from app.search import install_indexes
+from app.totals import seed_totals
+
+logger = logging.getLogger(__name__)
+
+def _merge_duplicate_inventory(conn) -> int:
+    """Fold repeated (box_id, part_number) rows into the oldest one, summing quantity.
+
+    Databases created before the unique index could hold duplicates (e.g. via
+    update_inventory renaming a part); they must go before the index can exist.
+    """
+    duplicates = conn.execute(text(
+        "SELECT COUNT(*) FROM (SELECT 1 FROM inventory GROUP BY box_id, part_number HAVING COUNT(*) > 1)"
+    )).scalar()
+    if not duplicates:
+        return 0
+    conn.execute(text("""
+        UPDATE inventory SET quantity = (
+            SELECT SUM(i2.quantity) FROM inventory i2
+            WHERE i2.box_id = inventory.box_id AND i2.part_number = inventory.part_number
+        )
+        WHERE item_id IN (
+            SELECT MIN(item_id) FROM inventory GROUP BY box_id, part_number HAVING COUNT(*) > 1
+        )
+    """))
+    conn.execute(text("""
+        DELETE FROM inventory WHERE item_id NOT IN (
+            SELECT MIN(item_id) FROM inventory GROUP BY box_id, part_number
+        )
+    """))
+    logger.warning("Merged %d duplicated (box_id, part_number) inventory groups", duplicates)
+    return duplicates
+
+def upgrade(engine):
+    """Create any index declared on the models that an existing database lacks.
+
+    create_all() only creates missing tables, so indexes added to a model later
+    never reach databases that already have the table. Also seeds the change
+    log, the stock totals and the full-text search indexes for databases that
+    predate them. Safe to run repeatedly.
+    """
+    with engine.begin() as conn:
+        # Seed before merging duplicates below, whose writes the triggers then
+        # record on top of a complete baseline
+        seed_baseline(conn)
+        seed_totals(conn)
+        existing = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+        if "uq_inventory_box_id_part_number" not in existing:
+            _merge_duplicate_inventory(conn)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(conn)
+                    logger.info("Created index %s", index.name)
+        install_indexes(conn)
@@ -3,3 +3,7 @@ from app.models.part import Part
 from app.models.location import Location
 from app.models.box import Box
 from app.models.inventory import InventoryItem
+from app.models.change import Change, ChangeLogState
+from app.models.stock import StockByLocation, StockByPart
+from app.models.job import Job
+from app.models.table_version import TableVersion
@@ -1,14 +1,18 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.db import Base
 
 class Box(Base):
     __tablename__ = "boxes"
+    __table_args__ = (
+        # add_box/add_inventory look boxes up by code within a location
+        Index("ix_boxes_code_location_id", "code", "location_id"),
+    )
 
     box_id = Column(Integer, primary_key=True)
     code = Column(String, unique=True, nullable=False)  # Equivalent to D4 in VBA
-    location_id = Column(Integer, ForeignKey("locations.location_id"))
+    location_id = Column(Integer, ForeignKey("locations.location_id"), index=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationship to Location
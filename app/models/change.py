@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Index, Integer, String, DateTime, event, text
+from app.db import Base
+
+class Change(Base):
+    """One row per insert/update/delete on a tracked table, written by triggers (see app.changes)."""
+    __tablename__ = "changes"
+    # AUTOINCREMENT so a sequence number is never handed out twice; the index
+    # finds the newer changes to a row when the log is pruned
+    __table_args__ = (
+        Index("ix_changes_entity_row", "entity", "entity_id", "seq"),
+        {"sqlite_autoincrement": True},
+    )
+
+    seq = Column(Integer, primary_key=True)
+    entity = Column(String, nullable=False)      # parts | locations | boxes | inventory
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)          # upsert | delete
+    data = Column(String, nullable=True)         # JSON of the row after an upsert
+    changed_at = Column(DateTime, server_default=text("CURRENT_TIMESTAMP"))
+
+
+class ChangeLogState(Base):
+    """Single row (id 1) recording what pruning dropped from the change log (see app.changes.prune)."""
+    __tablename__ = "change_log_state"
+
+    id = Column(Integer, primary_key=True)
+    # Newest delete pruned from the log; a mirror that synced before it must resync
+    min_since = Column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_change_triggers(metadata, connection, **kw):
+    from app.changes import install_triggers
+    install_triggers(connection)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.db import Base
 
 class InventoryItem(Base):
     __tablename__ = "inventory"   # keep existing name to avoid breaking dependencies
+    __table_args__ = (
+        # One row per part per box; also serves lookups on box_id alone
+        Index("uq_inventory_box_id_part_number", "box_id", "part_number", unique=True),
+    )
 
     item_id = Column(Integer, primary_key=True, index=True)
     box_id = Column(Integer, ForeignKey("boxes.box_id"), nullable=False)
@@ -0,0 +1,22 @@
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, text
+from app.db import Base
+
+class Job(Base):
+    """One background job (see app.jobs); kept after it finishes so its result can be fetched."""
+    __tablename__ = "jobs"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    job_id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)                 # import | export | reindex | reconcile
+    status = Column(String, nullable=False, index=True)   # queued | running | done | failed | cancelled
+    params = Column(String, nullable=True)                # JSON
+    progress = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=True)                # None while the amount of work is unknown
+    message = Column(String, nullable=True)
+    result = Column(String, nullable=True)                # JSON, once done
+    error = Column(String, nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    owner = Column(Integer, nullable=True)                # pid of the server process running it
+    created_at = Column(DateTime, server_default=text("CURRENT_TIMESTAMP"))
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, event
+from app.db import Base
+
+class StockByPart(Base):
+    """Total quantity and inventory row count per part number, kept by triggers (see app.totals)."""
+    __tablename__ = "stock_by_part"
+
+    part_number = Column(String, primary_key=True)
+    quantity = Column(Integer, nullable=False, default=0)
+    items = Column(Integer, nullable=False, default=0)
+
+
+class StockByLocation(Base):
+    """Totals per (location, part number), kept by triggers. location_id 0 = boxes without a location."""
+    __tablename__ = "stock_by_location"
+
+    location_id = Column(Integer, primary_key=True)
+    part_number = Column(String, primary_key=True, index=True)
+    quantity = Column(Integer, nullable=False, default=0)
+    items = Column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_stock_triggers(metadata, connection, **kw):
+    from app.totals import install_triggers
+    install_triggers(connection)
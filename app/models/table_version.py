@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, event
+from app.db import Base
+
+class TableVersion(Base):
+    """Write counter per table, bumped by triggers; ETags are built from it (see app.etags)."""
+    __tablename__ = "table_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_version_triggers(metadata, connection, **kw):
+    from app.etags import install_triggers
+    install_triggers(connection)
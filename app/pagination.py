@@ -0,0 +1,25 @@
+from typing import Optional
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def keyset_page(query, key_column, after: Optional[int], limit: int):
+    """Fetch one page of `query` ordered by `key_column`, starting after `after`.
+
+    Seeks on the indexed key instead of using OFFSET, so every page costs the
+    same no matter how deep into the table it is. Returns (rows, next_cursor);
+    next_cursor is None on the last page.
+    """
+    if after is not None:
+        query = query.filter(key_column > after)
+    # Fetch one extra row to learn whether another page exists
+    rows = query.order_by(key_column).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, getattr(rows[-1], key_column.key)
+
+
+def page_response(items, next_cursor, limit):
+    return {"items": items, "next_cursor": next_cursor, "limit": limit}
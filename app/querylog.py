@@ -0,0 +1,106 @@
+import logging
+import os
+import time
+from typing import Optional
+
+from sqlalchemy import event
+
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+# Both checks are opt-in. Statements slower than this many milliseconds are
+# logged with their EXPLAIN QUERY PLAN; unset or empty disables the log.
+SLOW_QUERY_MS = os.getenv("PARTS_SLOW_QUERY_MS", "")
+# What a route exceeding its declared query budget does: "off", "warn" (log
+# it, for production) or "raise" (fail the request, for tests and CI).
+BUDGET_MODE = os.getenv("PARTS_QUERY_BUDGET", "off").lower()
+
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request ran more SQL statements than its route's budget allows."""
+
+
+def budget(statements: int):
+    """Route dependency declaring the most SQL statements one request may run.
+
+    Used like etags.conditional:
+        @router.get("/search", dependencies=[Depends(querylog.budget(1))])
+    The declaration is always cheap; it is enforced only when
+    PARTS_QUERY_BUDGET is warn or raise. A route whose statement count grows
+    with the result size (an N+1 loop) trips it on the first larger request.
+    """
+    async def declare():
+        stats = metrics.current()
+        if stats is not None:
+            stats.budget = statements
+    return declare
+
+
+def query_plan(conn, statement: str, parameters) -> Optional[list]:
+    """EXPLAIN QUERY PLAN lines for a statement, or None if it cannot be explained.
+
+    Runs on the raw DBAPI connection so the EXPLAIN itself is neither timed
+    nor counted against the request.
+    """
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return None
+    if isinstance(parameters, list):  # executemany: one parameter set is enough
+        parameters = parameters[0] if parameters else ()
+    try:
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return [row[-1] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception:
+        return None
+
+
+def _slow(stats, statement, parameters, elapsed_ms, plan) -> str:
+    where = f" in {stats.request}" if stats is not None else ""
+    lines = [f"Slow query ({elapsed_ms:.1f} ms){where}: {' '.join(statement.split())}"]
+    if parameters:
+        lines.append(f"  parameters: {str(parameters)[:200]}")
+    for step in plan or ():
+        lines.append(f"  plan: {step}")
+    return "\n".join(lines)
+
+
+def install(engine, slow_query_ms: str = SLOW_QUERY_MS, budget_mode: str = BUDGET_MODE):
+    """Add the slow-query log and/or budget check to engine, as configured.
+
+    Registers nothing when both are off. Must be installed after
+    metrics.instrument, whose hook counts the statement this one checks.
+    """
+    threshold = float(slow_query_ms) / 1000 if slow_query_ms not in (None, "") else None
+    enforce = budget_mode in ("warn", "raise")
+    if threshold is None and not enforce:
+        return
+
+    if threshold is not None:
+        @event.listens_for(engine, "before_cursor_execute")
+        def _start(conn, cursor, statement, parameters, context, executemany):
+            conn.info["querylog_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _check(conn, cursor, statement, parameters, context, executemany):
+        stats = metrics.current()
+        if threshold is not None:
+            elapsed = time.perf_counter() - conn.info.pop("querylog_start", time.perf_counter())
+            if elapsed >= threshold:
+                plan = query_plan(conn, statement, parameters)
+                logger.warning(_slow(stats, statement, parameters, elapsed * 1000, plan))
+        if enforce and stats is not None and stats.budget is not None:
+            if stats.queries > stats.budget and not stats.over_budget:
+                stats.over_budget = True  # report each request once
+                message = (
+                    f"{stats.request} ran {stats.queries} SQL statements, over its budget of "
+                    f"{stats.budget}; statement {stats.queries}: {' '.join(statement.split())}"
+                )
+                if budget_mode == "raise":
+                    raise QueryBudgetExceeded(message)
+                logger.warning(message)
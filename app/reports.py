@@ -0,0 +1,142 @@
+import csv
+import io
+import json
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+
+from app.db import SessionLocal
+from app.models.box import Box
+from app.models.inventory import InventoryItem
+from app.models.location import Location
+from app.models.part import Part
+
+# Rows fetched per round trip, and emitted per chunk, by every report
+BATCH_SIZE = 1000
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson", "text": "text/plain; charset=utf-8"}
+EXTENSIONS = {"csv": "csv", "ndjson": "ndjson", "text": "txt"}
+FORMAT_PATTERN = "^(csv|ndjson|text)$"
+
+
+class Report(NamedTuple):
+    title: str
+    columns: Tuple[str, ...]
+    statement: Callable  # () -> Select yielding rows in `columns` order
+    line: str  # str.format template for one row of the plain-text report
+
+
+def _parts():
+    return select(Part.part_id, Part.part_number, Part.description).order_by(Part.part_id)
+
+
+def _locations():
+    return select(Location.location_id, Location.name, Location.description).order_by(Location.location_id)
+
+
+def _boxes():
+    # Location names come from the join, not one query per box
+    return (
+        select(Box.box_id, Box.code, func.coalesce(Location.name, ""))
+        .outerjoin(Location, Location.location_id == Box.location_id)
+        .order_by(Box.box_id)
+    )
+
+
+def _inventory():
+    return (
+        select(
+            InventoryItem.item_id,
+            func.coalesce(Box.code, ""),
+            InventoryItem.part_number,
+            InventoryItem.description,
+            func.coalesce(Location.name, ""),
+            InventoryItem.quantity,
+        )
+        .outerjoin(Box, Box.box_id == InventoryItem.box_id)
+        .outerjoin(Location, Location.location_id == Box.location_id)
+        .order_by(InventoryItem.item_id)
+    )
+
+
+REPORTS: Dict[str, Report] = {
+    "parts": Report("PARTS", ("part_id", "part_number", "description"), _parts,
+                    "Part ID: {part_id}, Number: {part_number}, Description: {description}"),
+    "locations": Report("LOCATIONS", ("location_id", "location_name", "description"), _locations,
+                        "Location ID: {location_id}, Name: {location_name}, Description: {description}"),
+    "boxes": Report("BOXES", ("box_id", "code", "location_name"), _boxes,
+                    "Box ID: {box_id}, Code: {code}, Location: {location_name}"),
+    "inventory": Report("INVENTORY",
+                        ("inventory_id", "box_id", "part_number", "description", "location_name", "quantity"),
+                        _inventory,
+                        "Inventory ID: {inventory_id}, Box: {box_id}, Part: {part_number}, "
+                        "Description: {description}, Location: {location_name}, Quantity: {quantity}"),
+}
+NAME_PATTERN = f"^({'|'.join(REPORTS)})$"
+
+
+def row_count(name: str) -> int:
+    """Rows report `name` will have."""
+    with SessionLocal() as db:
+        return db.execute(select(func.count()).select_from(REPORTS[name].statement().subquery())).scalar()
+
+
+def _drain(buf: io.StringIO) -> str:
+    """Return what `buf` holds and empty it for the next batch."""
+    value = buf.getvalue()
+    buf.seek(0)
+    buf.truncate()
+    return value
+
+
+def chunks(name: str, fmt: str, batch_size: int = BATCH_SIZE, progress: Optional[Callable[[int], None]] = None):
+    """Yield report `name` as CSV, NDJSON or plain text, one batch of rows at a time.
+
+    One SELECT read with yield_per, so memory stays flat however large the
+    table. Owns its session because it runs while the response is being
+    streamed, after the request's dependencies may already have been torn down.
+    `progress` is called with the number of rows emitted after each batch.
+    """
+    report = REPORTS[name]
+    db = SessionLocal()
+    try:
+        result = db.execute(report.statement(), execution_options={"yield_per": batch_size})
+        buf = io.StringIO()
+        writer = csv.writer(buf) if fmt == "csv" else None
+        if writer:
+            writer.writerow(report.columns)
+        elif fmt == "text":
+            buf.write(f"=== {report.title} IN DATABASE ===\n")
+        if buf.tell():
+            yield _drain(buf)
+
+        count = 0
+        for rows in result.partitions():
+            for row in rows:
+                if writer:
+                    writer.writerow(row)
+                elif fmt == "ndjson":
+                    buf.write(json.dumps(dict(zip(report.columns, row))))
+                    buf.write("\n")
+                else:
+                    buf.write(report.line.format(**dict(zip(report.columns, row))))
+                    buf.write("\n")
+            count += len(rows)
+            if progress is not None:
+                progress(count)
+            yield _drain(buf)
+        if fmt == "text":
+            yield f"=== END {report.title} ({count} rows) ===\n"
+    finally:
+        db.close()
+
+
+def response(name: str, fmt: str) -> StreamingResponse:
+    """Stream report `name` with chunked transfer encoding."""
+    disposition = "inline" if fmt == "text" else "attachment"
+    return StreamingResponse(
+        chunks(name, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f"{disposition}; filename={name}.{EXTENSIONS[fmt]}"},
+    )
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, HTTPException, Query
+from app import autocomplete
+
+router = APIRouter(prefix="/autocomplete", tags=["autocomplete"])
+
+@router.get("/{kind}")
+async def complete(
+    kind: str,
+    prefix: str = "",
+    limit: int = Query(autocomplete.DEFAULT_LIMIT, ge=1, le=autocomplete.MAX_LIMIT),
+):
+    """Part numbers, box codes or location names starting with prefix (case-insensitive).
+
+    kind is parts, boxes or locations. Served from in-memory sorted indexes,
+    so it never touches the database (async def: no threadpool hop either).
+    """
+    entry = autocomplete.INDEXES.get(kind)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"Unknown autocomplete kind '{kind}'")
+    return {"kind": kind, "prefix": prefix, "items": entry[0].complete(prefix, limit)}
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
+from app import autocomplete, cache, etags, querylog, reports
 from app.db import SessionLocal
 from app.models.box import Box
 from app.models.location import Location
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, page_response
 
 router = APIRouter(prefix="/boxes", tags=["boxes"])
 
@@ -18,68 +21,87 @@ def get_db():
     finally:
         db.close()
 
+def _box_query(db: Session):
+    """Boxes with their location name (None without a location), in one query."""
+    return (
+        db.query(Box.box_id, Box.code, Location.name)
+        .outerjoin(Location, Location.location_id == Box.location_id)
+    )
+
 @router.post("/")
 def add_box(box_data: BoxCreate, db: Session = Depends(get_db)):
     # Resolve location by name
-    location = db.query(Location).filter(Location.name == box_data.location_name).first()
+    location = cache.resolve_location(db, box_data.location_name)
     if not location:
         raise HTTPException(status_code=404, detail=f"Location '{box_data.location_name}' not found")
 
-    existing = db.query(Box).filter(Box.code == box_data.code, Box.location_id == location.location_id).first()
+    existing = cache.resolve_box(db, box_data.code)
     if existing:
+        if existing["location_id"] != location["location_id"]:
+            raise HTTPException(status_code=409, detail=f"Box '{box_data.code}' belongs to another location")
         return {
             "message": "Box already exists",
-            "box_id": existing.box_id,
-            "code": existing.code,
-            "location_name": location.name
+            "box_id": existing["box_id"],
+            "code": existing["code"],
+            "location_name": location["location_name"]
         }
 
-    box = Box(code=box_data.code, location_id=location.location_id)
+    box = Box(code=box_data.code, location_id=location["location_id"])
     db.add(box)
     db.commit()
     db.refresh(box)
+    cache.boxes_by_code.invalidate(box.code)
+    autocomplete.boxes.add(box.code)
     return {
         "message": "Box added",
         "box_id": box.box_id,
         "code": box.code,
-        "location_name": location.name
+        "location_name": location["location_name"]
     }
 
-@router.get("/search")
+@router.get("/search", dependencies=[Depends(etags.conditional("boxes", "locations")), Depends(querylog.budget(2))])
 def search_box(code: str, db: Session = Depends(get_db)):
-    box = db.query(Box).filter(Box.code == code).first()
+    box = cache.resolve_box(db, code)
     if not box:
         return {"error": "Box not found"}
-    location = db.query(Location).filter(Location.location_id == box.location_id).first()
     return {
-        "box_id": box.box_id,
-        "code": box.code,
-        "location_name": location.name if location else ""
+        "box_id": box["box_id"],
+        "code": box["code"],
+        "location_name": box["location_name"]
     }
 
-@router.get("/print")
-def print_boxes(db: Session = Depends(get_db)):
-    boxes = db.query(Box).all()
-
-    print("\n=== BOXES IN DATABASE ===")
-    for b in boxes:
-        location = db.query(Location).filter(Location.location_id == b.location_id).first()
-        loc_name = location.name if location else "Unknown"
-        print(f"Box ID: {b.box_id}, Code: {b.code}, Location: {loc_name}")
-    print("=== END BOXES ===\n")
+@router.get("/all", dependencies=[Depends(etags.conditional("boxes", "locations")), Depends(querylog.budget(2))])
+def list_boxes(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """Page through boxes ordered by box_id, with their location names."""
+    rows, next_cursor = keyset_page(_box_query(db), Box.box_id, after, limit)
+    items = [
+        {
+            "box_id": r.box_id,
+            "code": r.code,
+            "location_name": r.name or ""
+        }
+        for r in rows
+    ]
+    return page_response(items, next_cursor, limit)
 
-    return {"message": f"Printed {len(boxes)} boxes to backend console"}
+@router.get("/print", dependencies=[Depends(querylog.budget(1))])
+def print_boxes(fmt: str = Query("text", alias="format", pattern=reports.FORMAT_PATTERN)):
+    """Stream every box with its location name as a plain-text (default), CSV or NDJSON report."""
+    return reports.response("boxes", fmt)
 
-@router.get("/{box_id}")
+@router.get("/{box_id}", dependencies=[Depends(querylog.budget(1))])
 def get_box_by_id(box_id: int, db: Session = Depends(get_db)):
-    box = db.query(Box).filter(Box.box_id == box_id).first()
+    box = _box_query(db).filter(Box.box_id == box_id).first()
     if not box:
         raise HTTPException(status_code=404, detail="Box not found")
-    location = db.query(Location).filter(Location.location_id == box.location_id).first()
     return {
         "box_id": box.box_id,
         "code": box.code,
-        "location_name": location.name if location else ""
+        "location_name": box.name or ""
     }
 
 @router.delete("/{box_id}")
@@ -89,4 +111,6 @@ def delete_box(box_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Box not found")
     db.delete(box)
     db.commit()
+    cache.boxes_by_code.invalidate(box.code)
+    autocomplete.boxes.remove(box.code)
     return {"message": f"Box ID {box_id} deleted"}
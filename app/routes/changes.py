@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from app.changes import compact, min_since
+from app.db import SessionLocal
+from app.models.change import Change
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@router.get("")
+def list_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Changes to parts, locations, boxes and inventory after sequence number `since`.
+
+    Each entry is the newest state of one row ("upsert" with its fields, or
+    "delete"); older changes to the same row within the page are dropped.
+    Pass `last_seq` back as `since` to continue; `has_more` says whether to
+    ask again right away. `since=0` replays everything. Old history is
+    pruned; a `since` below min_since gets 410 and must start over from 0.
+    """
+    floor = min_since(db)
+    if 0 < since < floor:
+        raise HTTPException(status_code=410, detail={
+            "message": "Changes after this sequence number were pruned; resync with since=0",
+            "min_since": floor,
+        })
+    rows, next_cursor = keyset_page(db.query(Change), Change.seq, since, limit)
+    return {
+        "changes": compact(rows),
+        "last_seq": rows[-1].seq if rows else since,
+        "has_more": next_cursor is not None,
+        "min_since": floor,
+    }
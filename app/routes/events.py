@@ -0,0 +1,74 @@
+import asyncio
+import json
+from typing import Optional
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from app.events import RESYNC, broker, changes_after, oldest_since
+
+router = APIRouter(tags=["events"])
+
+# Comment line sent when idle so proxies keep the stream open and clients can detect a dead link
+HEARTBEAT_SECONDS = 15
+
+def _sse(change) -> str:
+    if change is RESYNC:
+        return "event: resync\ndata: {}\n\n"
+    return f"id: {change['seq']}\nevent: change\ndata: {json.dumps(change, separators=(',', ':'))}\n\n"
+
+@router.get("/events")
+async def stream_events(
+    request: Request,
+    since: Optional[int] = Query(None, ge=0),
+    last_event_id: Optional[str] = Header(None),
+):
+    """Server-Sent Events stream of changes to parts, locations, boxes and inventory.
+
+    Opens with a `ready` event holding the current last_seq. Each `change`
+    event carries the same entry as /changes (inventory upserts also get
+    box_code and location_name). Reconnecting with Last-Event-ID (or ?since=)
+    first replays what was missed from the change log. A `resync` event means
+    this client fell too far behind (or the changes it missed were pruned)
+    and should refetch.
+    """
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    subscription = await broker.subscribe()
+
+    async def events():
+        sent = -1
+        try:
+            yield f"event: ready\ndata: {json.dumps({'last_seq': broker.last_seq})}\n\n"
+            # Replay after subscribing so nothing falls between backlog and live events
+            if since and since < await run_in_threadpool(oldest_since):
+                # The deletes it missed were pruned from the change log
+                yield _sse(RESYNC)
+            elif since is not None:
+                cursor, more = since, True
+                while more:
+                    backlog, cursor, more = await run_in_threadpool(changes_after, cursor)
+                    for change in backlog:
+                        yield _sse(change)
+                    sent = cursor
+            while not await request.is_disconnected():
+                try:
+                    change = await asyncio.wait_for(subscription.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if change is not RESYNC and change["seq"] <= sent:
+                    continue  # already delivered by the replay
+                yield _sse(change)
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/events/stats")
+def event_stats():
+    """Connected subscribers and the last change sequence broadcast."""
+    return {"subscribers": broker.subscriber_count, "last_seq": broker.last_seq}
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from datetime import datetime, timezone
 
+from app import autocomplete, cache, etags, querylog, reports, search, totals
+from app.bulk import DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE, iter_record_chunks, summarize, upsert_inventory_chunk
 from app.db import SessionLocal
-from app.models.part import Part
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
 from app.models.location import Location
 from app.models.box import Box
 from app.models.inventory import InventoryItem
@@ -12,6 +18,9 @@ from app.models.inventory import InventoryItem
 # Prefix ensures routes mount at /inventory
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
+# Adjustments accepted by one POST /inventory/adjust
+MAX_BATCH_ADJUSTMENTS = 1000
+
 class InventoryCreate(BaseModel):
     box_id: str
     part_number: str
@@ -24,6 +33,17 @@ class InventoryUpdate(BaseModel):
     description: str
     quantity: int
 
+class InventoryAdjust(BaseModel):
+    delta: int
+    # Optional preconditions: only adjust while the item still has these values
+    expected_quantity: Optional[int] = None
+    expected_updated_at: Optional[datetime] = None
+    # Picking more than is in stock is refused unless this is set
+    allow_negative: bool = False
+
+class InventoryBatchAdjust(InventoryAdjust):
+    item_id: int
+
 def get_db():
     db = SessionLocal()
     try:
@@ -34,62 +54,96 @@ def get_db():
 @router.post("/")
 def add_inventory(item_data: InventoryCreate, db: Session = Depends(get_db)):
     # Resolve Part
-    part = db.query(Part).filter(Part.part_number == item_data.part_number).first()
+    part = cache.resolve_part(db, item_data.part_number)
     if not part:
         raise HTTPException(status_code=404, detail=f"Part '{item_data.part_number}' not found")
 
     # Resolve Location
-    location = db.query(Location).filter(Location.name == item_data.location_name).first()
+    location = cache.resolve_location(db, item_data.location_name)
     if not location:
         raise HTTPException(status_code=404, detail=f"Location '{item_data.location_name}' not found")
 
     # Ensure Box exists for this Location with given code
-    box = db.query(Box).filter(Box.code == item_data.box_id, Box.location_id == location.location_id).first()
-    if not box:
-        box = Box(code=item_data.box_id, location_id=location.location_id,
-                  created_at=datetime.now(timezone.utc))
-        db.add(box)
-        db.commit()
-        db.refresh(box)
-
-    # Check if inventory already exists for this part in this box
-    existing = db.query(InventoryItem).filter(
-        InventoryItem.box_id == box.box_id,
-        InventoryItem.part_number == part.part_number
-    ).first()
-    if existing:
-        return {
-            "message": "Inventory item already exists",
-            "inventory_id": existing.item_id,
-            "box_id": box.code,
-            "part_number": existing.part_number,
-            "description": existing.description,
-            "location_name": location.name,
-            "quantity": existing.quantity
-        }
+    box = cache.resolve_box(db, item_data.box_id)
+    if box and box["location_id"] != location["location_id"]:
+        raise HTTPException(status_code=409, detail=f"Box '{item_data.box_id}' belongs to another location")
+    if box:
+        box_id = box["box_id"]
+    else:
+        new_box = Box(code=item_data.box_id, location_id=location["location_id"],
+                      created_at=datetime.now(timezone.utc))
+        db.add(new_box)
+        db.flush()
+        box_id = new_box.box_id
 
-    # Create new inventory item
+    # Create new inventory item; the (box_id, part_number) unique index rejects repeats
     item = InventoryItem(
-        box_id=box.box_id,
+        box_id=box_id,
         part_number=item_data.part_number,
         description=item_data.description,
         quantity=item_data.quantity,
         updated_at=datetime.now(timezone.utc)
     )
     db.add(item)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        existing = db.query(InventoryItem).filter(
+            InventoryItem.box_id == box_id,
+            InventoryItem.part_number == item_data.part_number
+        ).first()
+        if not existing:
+            raise
+        return {
+            "message": "Inventory item already exists",
+            "inventory_id": existing.item_id,
+            "box_id": item_data.box_id,
+            "part_number": existing.part_number,
+            "description": existing.description,
+            "location_name": item_data.location_name,
+            "quantity": existing.quantity
+        }
     db.refresh(item)
+    if not box:
+        autocomplete.boxes.add(item_data.box_id)
 
     return {
         "message": "Inventory item added",
         "inventory_id": item.item_id,
-        "box_id": box.code,
+        "box_id": item_data.box_id,
         "part_number": item.part_number,
         "description": item.description,
-        "location_name": location.name,
+        "location_name": location["location_name"],
         "quantity": item.quantity
     }
 
+@router.post("/bulk")
+async def bulk_add_inventory(
+    request: Request,
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=MAX_CHUNK_SIZE),
+    on_existing: str = Query("update", pattern="^(update|skip)$"),
+    db: Session = Depends(get_db),
+):
+    """Import many inventory rows from a JSON array or NDJSON body.
+
+    Each row has the same fields as POST /inventory/. Missing boxes are created,
+    rows for an existing (box, part) pair update it (or are skipped when
+    on_existing=skip, which also keeps only the first of repeated pairs), and
+    the work is committed once per chunk_size rows.
+    """
+    results = []
+    async for chunk in iter_record_chunks(request, chunk_size):
+        try:
+            results.extend(await run_in_threadpool(upsert_inventory_chunk, db, chunk, InventoryCreate, on_existing))
+        except SQLAlchemyError as e:
+            db.rollback()
+            results.extend(
+                {"row": row, "status": "error", "error": f"Chunk failed: {e.__class__.__name__}"}
+                for row, _, _ in chunk
+            )
+    return {"message": f"Processed {len(results)} inventory rows", **summarize(results), "results": results}
+
 @router.put("/{item_id}")
 def update_inventory(item_id: int, update_data: InventoryUpdate, db: Session = Depends(get_db)):
     item = db.query(InventoryItem).filter(InventoryItem.item_id == item_id).first()
@@ -100,7 +154,14 @@ def update_inventory(item_id: int, update_data: InventoryUpdate, db: Session = D
     item.description = update_data.description  # type: ignore
     item.quantity = update_data.quantity  # type: ignore
     item.updated_at = datetime.now(timezone.utc)  # type: ignore
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Box already holds an inventory item for part '{update_data.part_number}'"
+        )
     db.refresh(item)
     return {
         "message": "Inventory updated",
@@ -111,47 +172,239 @@ def update_inventory(item_id: int, update_data: InventoryUpdate, db: Session = D
         "new_quantity": item.quantity
     }
 
-@router.get("/search")
+def _adjust_statement(item_id: int, adjust: InventoryAdjust, now: datetime):
+    """UPDATE adding adjust.delta to one item's quantity, guarded by its preconditions.
+
+    Read and write happen in this one statement, so concurrent adjustments
+    add up instead of overwriting each other. Returns the new row, or no row
+    when the item is missing or a precondition failed.
+    """
+    inventory = InventoryItem.__table__
+    stmt = (
+        update(inventory)
+        .where(inventory.c.item_id == item_id)
+        .values(quantity=inventory.c.quantity + adjust.delta, updated_at=now)
+        .returning(inventory.c.item_id, inventory.c.part_number, inventory.c.quantity, inventory.c.updated_at)
+    )
+    if adjust.expected_quantity is not None:
+        stmt = stmt.where(inventory.c.quantity == adjust.expected_quantity)
+    if adjust.expected_updated_at is not None:
+        stmt = stmt.where(inventory.c.updated_at == adjust.expected_updated_at)
+    if not adjust.allow_negative:
+        stmt = stmt.where(inventory.c.quantity + adjust.delta >= 0)
+    return stmt
+
+def _adjust_current(item_id: int):
+    return select(InventoryItem.quantity, InventoryItem.updated_at).where(InventoryItem.item_id == item_id)
+
+def _adjust_error(item_id: int, adjust: InventoryAdjust, current) -> HTTPException:
+    """404/409 for an adjustment that matched no row; `current` is the item's (quantity, updated_at) or None."""
+    if current is None:
+        return HTTPException(status_code=404, detail=f"Inventory item {item_id} not found")
+    quantity, updated_at = current
+    if adjust.expected_quantity is not None and quantity != adjust.expected_quantity:
+        reason = f"quantity is {quantity}, expected {adjust.expected_quantity}"
+    elif adjust.expected_updated_at is not None and quantity + adjust.delta >= 0:
+        reason = "it was modified after expected_updated_at"
+    else:
+        reason = f"only {quantity} in stock"
+    return HTTPException(status_code=409, detail={
+        "message": f"Inventory item {item_id} not adjusted: {reason}",
+        "inventory_id": item_id,
+        "quantity": quantity,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+    })
+
+def _adjusted(row, delta: int) -> dict:
+    item_id, part_number, quantity, updated_at = row
+    return {
+        "inventory_id": item_id,
+        "part_number": part_number,
+        "delta": delta,
+        "quantity": quantity,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+    }
+
+@router.post("/{item_id}/adjust", dependencies=[Depends(querylog.budget(2))])
+def adjust_inventory(item_id: int, adjust: InventoryAdjust, db: Session = Depends(get_db)):
+    """Add delta (negative to pick) to an item's quantity atomically.
+
+    Unlike PUT, two stations adjusting the same item never lose each other's
+    change. expected_quantity / expected_updated_at (as returned by an earlier
+    call) turn it into a compare-and-set: 409 with the current state if the
+    item changed meanwhile. Also 409 when stock would go below zero.
+    """
+    row = db.execute(_adjust_statement(item_id, adjust, datetime.now(timezone.utc))).first()
+    if row is None:
+        error = _adjust_error(item_id, adjust, db.execute(_adjust_current(item_id)).first())
+        db.rollback()
+        raise error
+    db.commit()
+    return {"message": "Inventory adjusted", **_adjusted(row, adjust.delta)}
+
+@router.post("/adjust")
+def adjust_inventory_batch(
+    adjustments: List[InventoryBatchAdjust] = Body(..., min_length=1, max_length=MAX_BATCH_ADJUSTMENTS),
+    db: Session = Depends(get_db),
+):
+    """Apply many adjustments ({"item_id", "delta", ...preconditions}) in one transaction.
+
+    All or nothing: the first one that fails rolls the rest back and its
+    404/409 is returned.
+    """
+    now = datetime.now(timezone.utc)
+    results = []
+    for adjust in adjustments:
+        row = db.execute(_adjust_statement(adjust.item_id, adjust, now)).first()
+        if row is None:
+            error = _adjust_error(adjust.item_id, adjust, db.execute(_adjust_current(adjust.item_id)).first())
+            db.rollback()
+            raise error
+        results.append(_adjusted(row, adjust.delta))
+    db.commit()
+    return {"message": f"{len(results)} inventory items adjusted", "results": results}
+
+def _inventory_query(db: Session):
+    """Inventory rows joined with their box code and location name.
+
+    Projects plain columns instead of hydrating ORM objects so a search costs
+    one round trip no matter how many items match.
+    """
+    return (
+        db.query(
+            InventoryItem.item_id,
+            Box.code,
+            InventoryItem.part_number,
+            InventoryItem.description,
+            Location.name,
+            InventoryItem.quantity,
+        )
+        .outerjoin(Box, Box.box_id == InventoryItem.box_id)
+        .outerjoin(Location, Location.location_id == Box.location_id)
+    )
+
+def _inventory_row(row):
+    item_id, box_code, part_number, description, location_name, quantity = row
+    return {
+        "inventory_id": item_id,
+        "box_id": box_code or "",
+        "part_number": part_number,
+        "description": description,
+        "location_name": location_name or "",
+        "quantity": quantity
+    }
+
+@router.get(
+    "/search",
+    dependencies=[Depends(etags.conditional("inventory", "boxes", "locations")), Depends(querylog.budget(2))],
+)
 def search_inventory(part_number: str, db: Session = Depends(get_db)):
     """Search inventory by part_number (query param)."""
-    items = db.query(InventoryItem).filter(InventoryItem.part_number == part_number).all()
-    if not items:
+    rows = (
+        _inventory_query(db)
+        .filter(InventoryItem.part_number == part_number)
+        .order_by(InventoryItem.item_id)
+        .all()
+    )
+    if not rows:
         return {"message": f"No inventory found for part_number '{part_number}'"}
-    results = []
-    for i in items:
-        box = db.query(Box).filter(Box.box_id == i.box_id).first()
-        location = db.query(Location).filter(Location.location_id == box.location_id).first() if box else None
-        results.append({
-            "inventory_id": i.item_id,
-            "box_id": box.code if box else "",
-            "part_number": i.part_number,
-            "description": i.description,
-            "location_name": location.name if location else "",
-            "quantity": i.quantity
-        })
-    return results
-
-@router.get("/search_by_box/{box_code}")
+    return [_inventory_row(r) for r in rows]
+
+@router.get(
+    "/search_by_box/{box_code}",
+    dependencies=[Depends(etags.conditional("inventory", "boxes", "locations")), Depends(querylog.budget(2))],
+)
 def search_inventory_by_box(box_code: str, db: Session = Depends(get_db)):
     """Search inventory by box_code (string)."""
-    box = db.query(Box).filter(Box.code == box_code).first()
-    if not box:
+    # Driven from boxes so one query also tells "no box" (no rows) apart
+    # from "empty box" (one row without an item)
+    rows = (
+        db.query(
+            InventoryItem.item_id,
+            Box.code,
+            InventoryItem.part_number,
+            InventoryItem.description,
+            Location.name,
+            InventoryItem.quantity,
+        )
+        .select_from(Box)
+        .outerjoin(InventoryItem, InventoryItem.box_id == Box.box_id)
+        .outerjoin(Location, Location.location_id == Box.location_id)
+        .filter(Box.code == box_code)
+        .order_by(InventoryItem.item_id)
+        .all()
+    )
+    if not rows:
         return {"message": f"No box found with code '{box_code}'"}
-    items = db.query(InventoryItem).filter(InventoryItem.box_id == box.box_id).all()
-    if not items:
+    if rows[0].item_id is None:
         return {"message": f"No inventory found for box '{box_code}'"}
-    results = []
-    for i in items:
-        location = db.query(Location).filter(Location.location_id == box.location_id).first()
-        results.append({
-            "inventory_id": i.item_id,
-            "box_id": box.code,
-            "part_number": i.part_number,
-            "description": i.description,
-            "location_name": location.name if location else "",
-            "quantity": i.quantity
-        })
-    return results
+    return [_inventory_row(r) for r in rows]
+
+@router.get(
+    "/find",
+    dependencies=[Depends(etags.conditional("inventory", "boxes", "locations")), Depends(querylog.budget(2))],
+)
+def find_inventory(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Full-text search of inventory part numbers and descriptions, best match first.
+
+    Same matching as /parts/find; pass next_cursor back as `offset`.
+    """
+    match = search.match_query(q)
+    if match is None:
+        return page_response([], None, limit)
+    rows = db.execute(search.FIND_INVENTORY, search.find_params(q, match, offset, limit)).all()
+    rows, next_cursor = search.found_page(rows, offset, limit)
+    return page_response([_inventory_row(r) for r in rows], next_cursor, limit)
+
+def _totals_cursor(group_by: str, after: Optional[str]):
+    """Parse `after` for the group's key: a part number, or a location/box ID."""
+    if after is None or group_by == "part":
+        return after
+    try:
+        return int(after)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"after must be an integer when grouping by {group_by}")
+
+@router.get(
+    "/totals",
+    dependencies=[Depends(etags.conditional("inventory", "boxes", "locations")), Depends(querylog.budget(3))],
+)
+def inventory_totals(
+    group_by: str = Query("part", pattern="^(part|location|box)$"),
+    part_number: Optional[str] = None,
+    location_name: Optional[str] = None,
+    box_code: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """Total quantity and number of inventory rows per part, location or box.
+
+    Filters combine, e.g. group_by=location&part_number=PN001 splits one
+    part's stock over locations. Totals come from summary tables kept by
+    triggers, so they cost the same however many rows they cover.
+    Pass next_cursor back as `after`.
+    """
+    location_id = None
+    if location_name is not None:
+        location = cache.resolve_location(db, location_name)
+        if not location:
+            raise HTTPException(status_code=404, detail=f"Location '{location_name}' not found")
+        location_id = location["location_id"]
+    stmt = totals.totals_statement(group_by, part_number, location_id, box_code,
+                                   _totals_cursor(group_by, after), limit)
+    items, next_cursor = totals.totals_page(group_by, db.execute(stmt).all(), limit)
+    return page_response(items, next_cursor, limit)
+
+@router.get("/export", dependencies=[Depends(querylog.budget(1))])
+def export_inventory(fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$")):
+    """Stream every inventory item with its box code and location name (NDJSON or CSV)."""
+    return reports.response("inventory", fmt)
 
 @router.delete("/{inventory_id}")
 def delete_inventory(inventory_id: int, db: Session = Depends(get_db)):
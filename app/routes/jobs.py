@@ -0,0 +1,129 @@
+import os
+import tempfile
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field, ValidationError
+from app import jobs, querylog, reports, tasks
+from app.bulk import DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE, spool_upload
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, page_response
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+class ExportParams(BaseModel):
+    report: str = Field(..., pattern=reports.NAME_PATTERN)
+    format: str = Field("csv", pattern=reports.FORMAT_PATTERN)
+
+class ReindexParams(BaseModel):
+    pass
+
+class ReconcileParams(BaseModel):
+    # Rebuild the stock totals when they have drifted; false only reports
+    fix: bool = True
+
+# Kinds POST /jobs accepts; imports carry a body, so they have their own route
+PARAMS = {"export": ExportParams, "reindex": ReindexParams, "reconcile": ReconcileParams}
+
+class JobSubmit(BaseModel):
+    kind: str = Field(..., pattern=f"^({'|'.join(PARAMS)})$")
+    params: dict = {}
+
+def _with_links(job: dict, request: Request) -> dict:
+    job["status_url"] = str(request.url_for("job_status", job_id=job["job_id"]))
+    if job["status"] == "done":
+        job["result_url"] = str(request.url_for("job_result", job_id=job["job_id"]))
+    return job
+
+def submit_job(request: Request, kind: str, params: dict) -> dict:
+    """Queue a job and return it with its status_url, or 503 while the queue is full."""
+    try:
+        job = jobs.submit(kind, params)
+    except jobs.QueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    return _with_links(job, request)
+
+def _get_job(job_id: int, with_result: bool = False) -> dict:
+    job = jobs.get(job_id, with_result)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.post("", status_code=202)
+def create_job(body: JobSubmit, request: Request):
+    """Queue an export, reindex or reconcile job and return its handle.
+
+    Poll status_url until status is done, failed or cancelled; a done job's
+    result is at result_url.
+    """
+    try:
+        params = PARAMS[body.kind].model_validate(body.params).model_dump()
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False, include_context=False))
+    return submit_job(request, body.kind, params)
+
+@router.post("/import/{target}", status_code=202)
+async def submit_import(
+    request: Request,
+    target: str = Path(..., pattern=f"^({'|'.join(tasks.IMPORT_TARGETS)})$"),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=MAX_CHUNK_SIZE),
+    on_existing: str = Query("update", pattern="^(update|skip)$"),
+):
+    """Queue an import of a JSON array or NDJSON body into parts, locations or inventory.
+
+    Takes the same records as POST /{target}/bulk. The body is spooled to disk
+    and the request returns once it is uploaded; the result has per-status
+    counts and the rows that failed.
+    """
+    os.makedirs(jobs.JOBS_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix=f"upload-{target}-", suffix=".ndjson", dir=jobs.JOBS_DIR)
+    os.close(fd)
+    try:
+        records = await spool_upload(request, path)
+        params = {"target": target, "records": records, "chunk_size": chunk_size, "_upload": path}
+        if target == "inventory":
+            params["on_existing"] = on_existing
+        return submit_job(request, "import", params)
+    except BaseException:
+        os.remove(path)
+        raise
+
+@router.get("", dependencies=[Depends(querylog.budget(1))])
+def list_jobs(
+    request: Request,
+    status: Optional[str] = Query(None, pattern=f"^({'|'.join(jobs.STATUSES)})$"),
+    kind: Optional[str] = None,
+    before: Optional[int] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    """Jobs newest first, optionally by status and kind; pass next_cursor back as `before`."""
+    items, next_cursor = jobs.list_jobs(status, kind, before, limit)
+    return page_response([_with_links(job, request) for job in items], next_cursor, limit)
+
+@router.get("/{job_id}", dependencies=[Depends(querylog.budget(1))])
+def job_status(job_id: int, request: Request):
+    """Status and progress (done out of total, when known) of one job."""
+    return _with_links(_get_job(job_id), request)
+
+@router.get("/{job_id}/result", dependencies=[Depends(querylog.budget(1))])
+def job_result(job_id: int):
+    """Result of a finished job: a file for exports, JSON for the other kinds."""
+    job = _get_job(job_id, with_result=True)
+    if job["status"] != "done":
+        raise HTTPException(status_code=409, detail={
+            "message": f"Job is {job['status']}", "status": job["status"], "error": job["error"],
+        })
+    result = job["result"] or {}
+    if "_file" in result:
+        if not os.path.exists(result["_file"]):
+            raise HTTPException(status_code=410, detail="Job result file is gone")
+        return FileResponse(result["_file"], media_type=result["_media_type"], filename=result["filename"])
+    return {k: v for k, v in result.items() if not k.startswith("_")}
+
+@router.post("/{job_id}/cancel", status_code=202)
+def cancel_job(job_id: int, request: Request):
+    """Cancel a queued job, or ask a running one to stop at its next progress check."""
+    job = _get_job(job_id)
+    if job["status"] in jobs.FINISHED:
+        raise HTTPException(status_code=409, detail=f"Job is already {job['status']}")
+    return _with_links(jobs.cancel(job_id), request)
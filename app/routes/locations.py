@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
+from app import autocomplete, cache, etags, querylog, reports
+from app.bulk import DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE, bulk_create
 from app.db import SessionLocal
 from app.models.location import Location
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, page_response
 
 router = APIRouter(prefix="/locations", tags=["locations"])
 
@@ -19,19 +23,16 @@ def get_db():
 
 @router.post("/")
 def add_location(location_data: LocationCreate, db: Session = Depends(get_db)):
-    existing = db.query(Location).filter(Location.name == location_data.location_name).first()
+    existing = cache.resolve_location(db, location_data.location_name)
     if existing:
-        return {
-            "message": "Location already exists",
-            "location_id": existing.location_id,
-            "location_name": existing.name,
-            "description": existing.description or ""
-        }
+        return {"message": "Location already exists", **existing}
 
     location = Location(name=location_data.location_name, description=location_data.description)
     db.add(location)
     db.commit()
     db.refresh(location)
+    cache.locations_by_name.invalidate(location.name)
+    autocomplete.locations.add(location.name)
 
     return {
         "message": "Location added",
@@ -40,44 +41,55 @@ def add_location(location_data: LocationCreate, db: Session = Depends(get_db)):
         "description": location.description or ""
     }
 
-@router.get("/search")
+@router.post("/bulk")
+async def bulk_add_locations(
+    request: Request,
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=MAX_CHUNK_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Create locations from a JSON array or NDJSON body; existing names are left as-is."""
+    result = await bulk_create(
+        request, db, LocationCreate, Location, "name",
+        key=lambda loc: loc.location_name,
+        to_values=lambda loc: {"name": loc.location_name, "description": loc.description},
+        chunk_size=chunk_size,
+        lookup_cache=cache.locations_by_name,
+        completions=autocomplete.locations,
+    )
+    return {"message": f"{result['created']} locations added, {result['existing']} already existed", **result}
+
+@router.get("/search", dependencies=[Depends(etags.conditional("locations")), Depends(querylog.budget(2))])
 def search_location(location_name: str, db: Session = Depends(get_db)):
-    location = db.query(Location).filter(Location.name == location_name).first()
+    location = cache.resolve_location(db, location_name)
     if not location:
         return {"error": "Location not found"}
-    return {
-        "location_id": location.location_id,
-        "location_name": location.name,
-        "description": location.description or ""
-    }
+    return location
 
-@router.get("/all")
-def list_locations(db: Session = Depends(get_db)):
-    """Return all locations for dropdowns and list views."""
-    locations = db.query(Location).all()
-    if not locations:
-        return {"message": "No locations found"}
-    return [
+@router.get("/all", dependencies=[Depends(etags.conditional("locations")), Depends(querylog.budget(2))])
+def list_locations(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """Page through locations ordered by location_id for dropdowns and list views."""
+    query = db.query(Location.location_id, Location.name, Location.description)
+    rows, next_cursor = keyset_page(query, Location.location_id, after, limit)
+    items = [
         {
-            "location_id": loc.location_id,
-            "location_name": loc.name,
-            "description": loc.description or ""
+            "location_id": r.location_id,
+            "location_name": r.name,
+            "description": r.description or ""
         }
-        for loc in locations
+        for r in rows
     ]
+    return page_response(items, next_cursor, limit)
 
-@router.get("/print")
-def print_locations(db: Session = Depends(get_db)):
-    locations = db.query(Location).all()
-
-    print("\n=== LOCATIONS IN DATABASE ===")
-    for loc in locations:
-        print(f"Location ID: {loc.location_id}, Name: {loc.name}, Description: {loc.description}")
-    print("=== END LOCATIONS ===\n")
-    
-    return {"message": f"Printed {len(locations)} locations to backend console"}
+@router.get("/print", dependencies=[Depends(querylog.budget(1))])
+def print_locations(fmt: str = Query("text", alias="format", pattern=reports.FORMAT_PATTERN)):
+    """Stream every location as a plain-text (default), CSV or NDJSON report."""
+    return reports.response("locations", fmt)
 
-@router.get("/{location_id}")
+@router.get("/{location_id}", dependencies=[Depends(querylog.budget(1))])
 def get_location_by_id(location_id: int, db: Session = Depends(get_db)):
     location = db.query(Location).filter(Location.location_id == location_id).first()
     if not location:
@@ -88,12 +100,12 @@ def get_location_by_id(location_id: int, db: Session = Depends(get_db)):
         "description": location.description or ""
     }
 
-@router.get("/resolve_id/{location_name}")
+@router.get("/resolve_id/{location_name}", dependencies=[Depends(querylog.budget(1))])
 def resolve_location_id(location_name: str, db: Session = Depends(get_db)):
-    location = db.query(Location).filter(Location.name == location_name).first()
+    location = cache.resolve_location(db, location_name)
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
-    return {"location_id": location.location_id}
+    return {"location_id": location["location_id"]}
 
 @router.delete("/{location_id}")
 def delete_location(location_id: int, db: Session = Depends(get_db)):
@@ -102,6 +114,10 @@ def delete_location(location_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Location not found")
     db.delete(location)
     db.commit()
+    cache.locations_by_name.invalidate(location.name)
+    autocomplete.locations.remove(location.name)
+    # Boxes that were in this location no longer report its name
+    cache.boxes_by_code.clear()
     return {"message": f"Location ID {location_id} deleted"}
 
 
@@ -0,0 +1,34 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app import autocomplete, cache, jobs, metrics
+from app.events import broker
+
+router = APIRouter(tags=["monitoring"])
+
+@router.get("/cache/stats")
+def cache_stats():
+    """Hit/miss/eviction counters for the name/number lookup caches."""
+    return cache.stats()
+
+@router.get("/metrics")
+def prometheus_metrics():
+    """Request, query, cache and live-update metrics in the Prometheus text format."""
+    lookups = cache.stats()
+    completions = autocomplete.stats()
+    lines = [metrics.registry.render().rstrip("\n")]
+    for name, kind, key, help_text in (
+        ("parts_cache_hits_total", "counter", "hits", "Lookup cache hits"),
+        ("parts_cache_misses_total", "counter", "misses", "Lookup cache misses"),
+        ("parts_cache_evictions_total", "counter", "evictions", "Lookup cache evictions"),
+        ("parts_cache_entries", "gauge", "size", "Lookup cache entries"),
+    ):
+        lines += metrics.family(name, kind, help_text, {(("cache", c),): s[key] for c, s in lookups.items()})
+    lines += metrics.family("parts_autocomplete_entries", "gauge", "Names in each autocomplete index",
+                            {(("kind", k),): s["size"] for k, s in completions.items()})
+    lines += metrics.family("parts_autocomplete_lookups_total", "counter", "Autocomplete lookups",
+                            {(("kind", k),): s["lookups"] for k, s in completions.items()})
+    lines += metrics.family("parts_events_subscribers", "gauge", "Connected /events streams",
+                            {(): broker.subscriber_count})
+    lines += metrics.family("parts_jobs_active", "gauge", "Background jobs queued or running in this process",
+                            {(("state", state),): n for state, n in jobs.stats().items()})
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=metrics.CONTENT_TYPE)
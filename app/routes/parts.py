@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
+from app import autocomplete, cache, etags, querylog, reports, search
+from app.bulk import DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE, bulk_create
 from app.db import SessionLocal
 from app.models.part import Part
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, page_response
 
 router = APIRouter(prefix="/parts", tags=["parts"])
 
@@ -19,18 +23,15 @@ def get_db():
 
 @router.post("/")
 def add_part(part_data: PartCreate, db: Session = Depends(get_db)):
-    existing = db.query(Part).filter(Part.part_number == part_data.part_number).first()
+    existing = cache.resolve_part(db, part_data.part_number)
     if existing:
-        return {
-            "message": "Part already exists",
-            "part_id": existing.part_id,
-            "part_number": existing.part_number,
-            "description": existing.description
-        }
+        return {"message": "Part already exists", **existing}
     part = Part(part_number=part_data.part_number, description=part_data.description)
     db.add(part)
     db.commit()
     db.refresh(part)
+    cache.parts_by_number.invalidate(part.part_number)
+    autocomplete.parts.add(part.part_number)
     return {
         "message": "Part added",
         "part_id": part.part_id,
@@ -38,40 +39,83 @@ def add_part(part_data: PartCreate, db: Session = Depends(get_db)):
         "description": part.description
     }
 
-@router.get("/search")
+@router.post("/bulk")
+async def bulk_add_parts(
+    request: Request,
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=MAX_CHUNK_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Create parts from a JSON array or NDJSON body; existing part numbers are left as-is."""
+    result = await bulk_create(
+        request, db, PartCreate, Part, "part_number",
+        key=lambda p: p.part_number,
+        to_values=lambda p: {"part_number": p.part_number, "description": p.description},
+        chunk_size=chunk_size,
+        lookup_cache=cache.parts_by_number,
+        completions=autocomplete.parts,
+    )
+    return {"message": f"{result['created']} parts added, {result['existing']} already existed", **result}
+
+@router.get("/search", dependencies=[Depends(etags.conditional("parts")), Depends(querylog.budget(2))])
 def search_part(part_number: str, db: Session = Depends(get_db)):
     """Lookup by part_number via query parameter (e.g. /parts/search?part_number=ABC123)."""
-    part = db.query(Part).filter(Part.part_number == part_number).first()
+    part = cache.resolve_part(db, part_number)
     if not part:
         return {"error": "Part not found"}
-    return {
-        "part_id": part.part_id,
-        "part_number": part.part_number,
-        "description": part.description
-    }
+    return part
 
-@router.get("/print")
-def print_parts(db: Session = Depends(get_db)):
-    parts = db.query(Part).all()
-    print("\n=== PARTS IN DATABASE ===")
-    for p in parts:
-        print(f"Part ID: {p.part_id}, Number: {p.part_number}, Description: {p.description}")
-    print("=== END PARTS ===\n")
-    return {"message": f"Printed {len(parts)} parts to backend console"}
+@router.get("/print", dependencies=[Depends(querylog.budget(1))])
+def print_parts(fmt: str = Query("text", alias="format", pattern=reports.FORMAT_PATTERN)):
+    """Stream every part as a plain-text (default), CSV or NDJSON report."""
+    return reports.response("parts", fmt)
 
-@router.get("/all")
-def list_parts(db: Session = Depends(get_db)):
-    parts = db.query(Part).all()
-    return [
+@router.get("/all", dependencies=[Depends(etags.conditional("parts")), Depends(querylog.budget(2))])
+def list_parts(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """Page through parts ordered by part_id; pass next_cursor back as `after`."""
+    query = db.query(Part.part_id, Part.part_number, Part.description)
+    rows, next_cursor = keyset_page(query, Part.part_id, after, limit)
+    items = [
         {
-            "part_id": p.part_id,
-            "part_number": p.part_number,
-            "description": p.description
+            "part_id": r.part_id,
+            "part_number": r.part_number,
+            "description": r.description
         }
-            for p in parts
+        for r in rows
     ]
+    return page_response(items, next_cursor, limit)
 
-@router.get("/{part_id}")
+@router.get("/find", dependencies=[Depends(etags.conditional("parts")), Depends(querylog.budget(2))])
+def find_parts(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Full-text search of part numbers and descriptions, best match first.
+
+    Every word of q must match the start of a word (e.g. q=o-ring, q=PN-12).
+    Pass next_cursor back as `offset` for the next page.
+    """
+    match = search.match_query(q)
+    if match is None:
+        return page_response([], None, limit)
+    rows = db.execute(search.FIND_PARTS, search.find_params(q, match, offset, limit)).all()
+    rows, next_cursor = search.found_page(rows, offset, limit)
+    items = [
+        {
+            "part_id": r.part_id,
+            "part_number": r.part_number,
+            "description": r.description
+        }
+        for r in rows
+    ]
+    return page_response(items, next_cursor, limit)
+
+@router.get("/{part_id}", dependencies=[Depends(querylog.budget(1))])
 def get_part_by_id(part_id: int, db: Session = Depends(get_db)):
     """Lookup by integer part_id (e.g. /parts/1)."""
     part = db.query(Part).filter(Part.part_id == part_id).first()
@@ -83,25 +127,21 @@ def get_part_by_id(part_id: int, db: Session = Depends(get_db)):
         "description": part.description
     }
 
-@router.get("/by_number/{part_number}")
+@router.get("/by_number/{part_number}", dependencies=[Depends(etags.conditional("parts")), Depends(querylog.budget(2))])
 def get_part_by_number(part_number: str, db: Session = Depends(get_db)):
     """Lookup by part_number directly in path (e.g. /parts/by_number/ABC123)."""
-    part = db.query(Part).filter(Part.part_number == part_number).first()
+    part = cache.resolve_part(db, part_number)
     if not part:
         return {"error": "Part not found"}
-    return {
-        "part_id": part.part_id,
-        "part_number": part.part_number,
-        "description": part.description
-    }
+    return part
 
-@router.get("/resolve_id/{part_number}")
+@router.get("/resolve_id/{part_number}", dependencies=[Depends(querylog.budget(1))])
 def resolve_part_id(part_number: str, db: Session = Depends(get_db)):
     """Lightweight lookup for GUI: returns part_id from part_number."""
-    part = db.query(Part).filter(Part.part_number == part_number).first()
+    part = cache.resolve_part(db, part_number)
     if not part:
         raise HTTPException(status_code=404, detail="Part not found")
-    return {"part_id": part.part_id}
+    return {"part_id": part["part_id"]}
 
 @router.delete("/{part_id}")
 def delete_part(part_id: int, db: Session = Depends(get_db)):
@@ -111,4 +151,6 @@ def delete_part(part_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Part not found")
     db.delete(part)
     db.commit()
+    cache.parts_by_number.invalidate(part.part_number)
+    autocomplete.parts.remove(part.part_number)
     return {"message": f"Part {part_id} deleted successfully"}
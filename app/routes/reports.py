@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Path, Query, Request
+from app import querylog, reports
+from app.routes.jobs import submit_job
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+@router.get("/{name}", dependencies=[Depends(querylog.budget(1))])
+def stream_report(
+    name: str = Path(..., pattern=reports.NAME_PATTERN),
+    fmt: str = Query("csv", alias="format", pattern=reports.FORMAT_PATTERN),
+):
+    """Stream a parts, locations, boxes or inventory report (CSV, NDJSON or plain text)."""
+    return reports.response(name, fmt)
+
+@router.post("/{name}", status_code=202)
+def start_report(
+    request: Request,
+    name: str = Path(..., pattern=reports.NAME_PATTERN),
+    fmt: str = Query("csv", alias="format", pattern=reports.FORMAT_PATTERN),
+):
+    """Write a report to a file in the background and return its job handle.
+
+    For reports too large to hold a connection open for. Shorthand for
+    POST /jobs with kind "export": poll status_url until status is "done",
+    then fetch result_url.
+    """
+    return submit_job(request, "export", {"report": name, "format": fmt})
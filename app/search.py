@@ -0,0 +1,110 @@
+import logging
+import re
+from typing import Optional
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# index -> (content table, rowid column, indexed columns, bm25 weight per column).
+# External-content FTS5 tables: the index stores only tokens and reads the
+# text back from the table itself. Part numbers outrank description hits.
+INDEXES = {
+    "parts_fts": ("parts", "part_id", ("part_number", "description"), (10.0, 1.0)),
+    "inventory_fts": ("inventory", "item_id", ("part_number", "description"), (10.0, 1.0)),
+}
+
+# Letters and digits form tokens, so "O-RING" indexes as "o" "ring"; prefix
+# indexes on 2 and 3 characters keep short type-ahead prefixes cheap.
+TOKENIZE = "unicode61 remove_diacritics 2"
+PREFIX = "2 3"
+
+_WORD = re.compile(r"\w")
+
+
+def index_statements(name):
+    """CREATE statements for one FTS5 index and the triggers that keep it in sync."""
+    table, rowid, columns, _ = INDEXES[name]
+    cols = ", ".join(columns)
+    new = ", ".join(f"NEW.{c}" for c in columns)
+    old = ", ".join(f"OLD.{c}" for c in columns)
+    insert = f"INSERT INTO {name}(rowid, {cols}) VALUES (NEW.{rowid}, {new});"
+    delete = f"INSERT INTO {name}({name}, rowid, {cols}) VALUES ('delete', OLD.{rowid}, {old});"
+    yield (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({cols}, content='{table}', "
+        f"content_rowid='{rowid}', tokenize='{TOKENIZE}', prefix='{PREFIX}')"
+    )
+    yield f"CREATE TRIGGER IF NOT EXISTS trg_{name}_insert AFTER INSERT ON {table} BEGIN {insert} END"
+    yield f"CREATE TRIGGER IF NOT EXISTS trg_{name}_delete AFTER DELETE ON {table} BEGIN {delete} END"
+    # Only text edits touch the index; quantity changes leave it alone
+    yield (
+        f"CREATE TRIGGER IF NOT EXISTS trg_{name}_update AFTER UPDATE OF {cols} ON {table} "
+        f"BEGIN {delete} {insert} END"
+    )
+
+
+def install_indexes(conn) -> list:
+    """Create missing search indexes, filling new ones from their tables.
+
+    Returns the names of the indexes that were built.
+    """
+    existing = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))}
+    built = []
+    for name in INDEXES:
+        for statement in index_statements(name):
+            conn.execute(text(statement))
+        if name not in existing:
+            rebuild_index(conn, name)
+            logger.info("Built search index %s", name)
+            built.append(name)
+    return built
+
+
+def rebuild_index(conn, name):
+    """Re-read every row of an index's table into it, e.g. after editing the table with triggers off."""
+    conn.execute(text(f"INSERT INTO {name}({name}) VALUES ('rebuild')"))
+
+
+def match_query(q: str) -> Optional[str]:
+    """Turn free text into an FTS5 query: every word must match, as a prefix.
+
+    Each whitespace-separated word becomes a quoted prefix phrase, so
+    "o-ring 12" finds "O-RING 12MM" and "PN-1" finds "PN-1", "PN-10", ...
+    Quoting keeps FTS5 operators and punctuation in user input literal.
+    Returns None when q holds no searchable characters.
+    """
+    phrases = ['"' + word.replace('"', '""') + '"*' for word in q.split() if _WORD.search(word)]
+    return " ".join(phrases) or None
+
+
+def _ranked(name, select, joins=""):
+    weights = ", ".join(str(w) for w in INDEXES[name][3])
+    table, rowid = INDEXES[name][0], INDEXES[name][1]
+    return text(
+        f"SELECT {select} FROM {name} JOIN {table} t ON t.{rowid} = {name}.rowid {joins} "
+        f"WHERE {name} MATCH :match "
+        f"ORDER BY t.part_number = :exact COLLATE NOCASE DESC, bm25({name}, {weights}), {name}.rowid "
+        f"LIMIT :limit OFFSET :offset"
+    )
+
+
+# Ranked results have no stable key to seek on, so /find pages by offset.
+# The whole match set is ranked on every page anyway.
+FIND_PARTS = _ranked("parts_fts", "t.part_id, t.part_number, t.description")
+FIND_INVENTORY = _ranked(
+    "inventory_fts",
+    "t.item_id, b.code, t.part_number, t.description, l.name, t.quantity",
+    "LEFT JOIN boxes b ON b.box_id = t.box_id LEFT JOIN locations l ON l.location_id = b.location_id",
+)
+
+
+def find_params(q: str, match: str, offset: int, limit: int) -> dict:
+    # An exact part number always ranks first; one extra row tells whether
+    # another page exists
+    return {"match": match, "exact": q.strip(), "limit": limit + 1, "offset": offset}
+
+
+def found_page(rows, offset: int, limit: int):
+    """(rows for this page, next offset or None)."""
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], offset + limit
@@ -0,0 +1,141 @@
+import os
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import autocomplete, cache, etags, jobs, reports, search, totals
+from app.bulk import DEFAULT_CHUNK_SIZE, create_chunk, iter_file_chunks, upsert_inventory_chunk
+from app.db import SessionLocal, engine
+from app.models.location import Location
+from app.models.part import Part
+from app.routes.inventory import InventoryCreate
+from app.routes.locations import LocationCreate
+from app.routes.parts import PartCreate
+
+# Handlers for the job kinds behind /jobs. Each runs on a job worker thread with
+# its own sessions and is safe to run again from the start if interrupted.
+
+IMPORT_TARGETS = ("parts", "locations", "inventory")
+# Row errors kept in an import's result; error_count has them all
+MAX_REPORTED_ERRORS = 1000
+
+# target -> bulk_create arguments, as used by POST /parts/bulk and /locations/bulk
+_CREATE = {
+    "parts": dict(
+        schema=PartCreate, model=Part, conflict_column="part_number",
+        key=lambda p: p.part_number,
+        to_values=lambda p: {"part_number": p.part_number, "description": p.description},
+        lookup_cache=cache.parts_by_number, completions=autocomplete.parts,
+    ),
+    "locations": dict(
+        schema=LocationCreate, model=Location, conflict_column="name",
+        key=lambda loc: loc.location_name,
+        to_values=lambda loc: {"name": loc.location_name, "description": loc.description},
+        lookup_cache=cache.locations_by_name, completions=autocomplete.locations,
+    ),
+}
+
+
+@jobs.handler("import")
+def import_records(ctx: jobs.JobContext, params: dict) -> dict:
+    """Import an uploaded NDJSON file into parts, locations or inventory, one commit per chunk.
+
+    Same rules as the matching /bulk route. Chunks committed before a
+    cancellation stay; running the job again skips or updates them.
+    """
+    target, chunk_size = params["target"], params.get("chunk_size", DEFAULT_CHUNK_SIZE)
+    done, errors = 0, []
+    db = SessionLocal()
+    try:
+        if target == "inventory":
+            counts = {}
+            for chunk in iter_file_chunks(params["_upload"], chunk_size):
+                try:
+                    results = upsert_inventory_chunk(db, chunk, InventoryCreate, params.get("on_existing", "update"))
+                except SQLAlchemyError as e:
+                    db.rollback()
+                    results = [{"row": row, "status": "error", "error": f"Chunk failed: {e.__class__.__name__}"}
+                               for row, _, _ in chunk]
+                for result in results:
+                    if result["status"] == "error":
+                        errors.append({"row": result["row"], "error": result["error"]})
+                    else:
+                        counts[result["status"]] = counts.get(result["status"], 0) + 1
+                done += len(chunk)
+                ctx.progress(done, params.get("records"))
+        else:
+            spec = _CREATE[target]
+            seen, counts = set(), {"created": 0, "existing": 0, "duplicate": 0}
+            for chunk in iter_file_chunks(params["_upload"], chunk_size):
+                create_chunk(db, chunk, spec["schema"], spec["model"], spec["conflict_column"], spec["key"],
+                             spec["to_values"], seen, counts, errors, spec["lookup_cache"], spec["completions"])
+                done += len(chunk)
+                ctx.progress(done, params.get("records"))
+    finally:
+        db.close()
+    return {
+        "target": target,
+        "rows": done,
+        **counts,
+        "error_count": len(errors),
+        "errors": errors[:MAX_REPORTED_ERRORS],
+    }
+
+
+@jobs.handler("export")
+def export_report(ctx: jobs.JobContext, params: dict) -> dict:
+    """Write a report (see app.reports) to a file fetched through GET /jobs/{job_id}/result."""
+    name, fmt = params["report"], params["format"]
+    total = reports.row_count(name)
+    ctx.progress(0, total)
+    filename = f"{name}.{reports.EXTENSIONS[fmt]}"
+    path = ctx.output_path(filename)
+    partial, written = path + ".part", 0
+    try:
+        with open(partial, "w", encoding="utf-8", newline="") as f:
+            for chunk in reports.chunks(name, fmt, progress=lambda rows: ctx.progress(rows, total)):
+                f.write(chunk)
+                written += len(chunk.encode("utf-8"))
+        # Renamed only once complete, so a download never sees half a report
+        os.replace(partial, path)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    return {"report": name, "format": fmt, "rows": ctx.done, "bytes": written, "filename": filename,
+            "_file": path, "_media_type": reports.MEDIA_TYPES[fmt]}
+
+
+@jobs.handler("reindex")
+def reindex(ctx: jobs.JobContext, params: dict) -> dict:
+    """Rebuild the full-text search indexes, then this process's autocomplete indexes and lookup caches.
+
+    The in-memory indexes and caches belong to one server process; the
+    others rebuild theirs on restart and expire cache entries on their own.
+    """
+    steps = len(search.INDEXES) + 2
+    for done, name in enumerate(search.INDEXES):
+        ctx.progress(done, steps, f"Rebuilding {name}")
+        with engine.begin() as conn:
+            search.rebuild_index(conn, name)
+    ctx.progress(steps - 2, steps, "Reloading autocomplete indexes")
+    autocomplete.load(engine)
+    ctx.progress(steps - 1, steps, "Clearing lookup caches")
+    for lookup in cache.CACHES:
+        lookup.clear()
+    ctx.progress(steps, steps, "Done")
+    return {
+        "search_indexes": list(search.INDEXES),
+        "autocomplete": {kind: stats["size"] for kind, stats in autocomplete.stats().items()},
+    }
+
+
+@jobs.handler("reconcile")
+def reconcile_totals(ctx: jobs.JobContext, params: dict) -> dict:
+    """Check the trigger-maintained stock totals against inventory and, with fix, rebuild them."""
+    ctx.progress(0, 1, "Comparing stock totals with inventory")
+    with engine.begin() as conn:
+        result = totals.reconcile(conn, fix=params.get("fix", True))
+        if result["fixed"]:
+            # Rebuilt totals change /inventory/totals without an inventory write
+            etags.bump(conn, "inventory")
+    ctx.progress(1, 1, "Done")
+    return result
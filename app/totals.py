@@ -0,0 +1,219 @@
+import logging
+from typing import Optional
+from sqlalchemy import func, select, text
+from app.models.box import Box
+from app.models.inventory import InventoryItem
+from app.models.location import Location
+from app.models.stock import StockByLocation, StockByPart
+
+logger = logging.getLogger(__name__)
+
+GROUPS = ("part", "location", "box")
+
+# Location a box's stock is counted under; 0 stands for "no location"
+_LOC = "COALESCE((SELECT location_id FROM boxes WHERE box_id = {row}.box_id), 0)"
+
+
+def _add(row):
+    """Statements adding one inventory row (NEW/OLD) to the summary tables."""
+    return (
+        f"INSERT INTO stock_by_part (part_number, quantity, items) VALUES ({row}.part_number, {row}.quantity, 1) "
+        f"ON CONFLICT(part_number) DO UPDATE SET quantity = quantity + excluded.quantity, items = items + 1; "
+        f"INSERT INTO stock_by_location (location_id, part_number, quantity, items) "
+        f"VALUES ({_LOC.format(row=row)}, {row}.part_number, {row}.quantity, 1) "
+        f"ON CONFLICT(location_id, part_number) DO UPDATE SET quantity = quantity + excluded.quantity, items = items + 1;"
+    )
+
+
+def _subtract(row):
+    """Statements taking one inventory row back out, dropping groups left empty."""
+    loc = _LOC.format(row=row)
+    return (
+        f"UPDATE stock_by_part SET quantity = quantity - {row}.quantity, items = items - 1 "
+        f"WHERE part_number = {row}.part_number; "
+        f"DELETE FROM stock_by_part WHERE part_number = {row}.part_number AND items <= 0; "
+        f"UPDATE stock_by_location SET quantity = quantity - {row}.quantity, items = items - 1 "
+        f"WHERE location_id = {loc} AND part_number = {row}.part_number; "
+        f"DELETE FROM stock_by_location WHERE location_id = {loc} AND part_number = {row}.part_number AND items <= 0;"
+    )
+
+
+def trigger_statements():
+    """CREATE TRIGGER statements keeping stock_by_part / stock_by_location current.
+
+    Like the change log, maintained in SQL so bulk upserts, cascades and the
+    async routes update the totals in the same transaction as the write.
+    """
+    yield f"CREATE TRIGGER IF NOT EXISTS trg_inventory_totals_insert AFTER INSERT ON inventory BEGIN {_add('NEW')} END"
+    yield f"CREATE TRIGGER IF NOT EXISTS trg_inventory_totals_delete AFTER DELETE ON inventory BEGIN {_subtract('OLD')} END"
+    yield (
+        "CREATE TRIGGER IF NOT EXISTS trg_inventory_totals_update "
+        "AFTER UPDATE OF box_id, part_number, quantity ON inventory "
+        f"BEGIN {_subtract('OLD')} {_add('NEW')} END"
+    )
+    # A box changing location (or losing it when its location is deleted)
+    # moves all of its stock between locations
+    old, new = "COALESCE(OLD.location_id, 0)", "COALESCE(NEW.location_id, 0)"
+    yield (
+        "CREATE TRIGGER IF NOT EXISTS trg_boxes_totals_move AFTER UPDATE OF location_id ON boxes "
+        f"WHEN {old} <> {new} BEGIN "
+        "UPDATE stock_by_location SET "
+        "quantity = quantity - (SELECT i.quantity FROM inventory i "
+        "WHERE i.box_id = NEW.box_id AND i.part_number = stock_by_location.part_number), "
+        "items = items - 1 "
+        f"WHERE location_id = {old} AND part_number IN (SELECT part_number FROM inventory WHERE box_id = NEW.box_id); "
+        f"DELETE FROM stock_by_location WHERE location_id = {old} AND items <= 0; "
+        "INSERT INTO stock_by_location (location_id, part_number, quantity, items) "
+        f"SELECT {new}, part_number, quantity, 1 FROM inventory WHERE box_id = NEW.box_id AND 1 "
+        "ON CONFLICT(location_id, part_number) DO UPDATE SET "
+        "quantity = quantity + excluded.quantity, items = items + 1; "
+        "END"
+    )
+
+
+def install_triggers(conn):
+    for statement in trigger_statements():
+        conn.execute(text(statement))
+
+
+def seed_totals(conn) -> int:
+    """Fill the summary tables from inventory when they are empty but inventory is not.
+
+    Databases that predate the summary tables get their totals on the first
+    upgrade. Returns the number of part totals written.
+    """
+    if conn.execute(text("SELECT 1 FROM stock_by_part LIMIT 1")).first():
+        return 0
+    if not conn.execute(text("SELECT 1 FROM inventory LIMIT 1")).first():
+        return 0
+    seeded = rebuild_totals(conn)
+    logger.info("Seeded stock totals for %d part numbers", seeded)
+    return seeded
+
+
+_EXPECTED_BY_PART = "SELECT part_number, SUM(quantity), COUNT(*) FROM inventory GROUP BY part_number"
+_EXPECTED_BY_LOCATION = (
+    "SELECT COALESCE(b.location_id, 0) AS location_id, i.part_number AS part_number, SUM(i.quantity), COUNT(*) "
+    "FROM inventory i LEFT JOIN boxes b ON b.box_id = i.box_id GROUP BY 1, 2"
+)
+
+
+def rebuild_totals(conn) -> int:
+    """Rewrite both summary tables from inventory; returns the number of part totals."""
+    conn.execute(text("DELETE FROM stock_by_part"))
+    conn.execute(text("DELETE FROM stock_by_location"))
+    written = conn.execute(text(
+        f"INSERT INTO stock_by_part (part_number, quantity, items) {_EXPECTED_BY_PART}"
+    )).rowcount
+    conn.execute(text(
+        f"INSERT INTO stock_by_location (location_id, part_number, quantity, items) {_EXPECTED_BY_LOCATION}"
+    ))
+    return written
+
+
+def reconcile(conn, fix: bool = True) -> dict:
+    """Compare the summary tables with totals recomputed from inventory.
+
+    Returns how many part and (location, part) totals differ, counting
+    missing and extra groups. With fix=True both tables are rebuilt when
+    any do. Run it in one transaction, so writers wait instead of racing it.
+    """
+    drift = {
+        "stock_by_part": conn.execute(text(
+            f"SELECT COUNT(DISTINCT part_number) FROM ("
+            f"SELECT part_number FROM ({_EXPECTED_BY_PART} EXCEPT "
+            f"SELECT part_number, quantity, items FROM stock_by_part) "
+            f"UNION ALL SELECT part_number FROM (SELECT part_number, quantity, items FROM stock_by_part "
+            f"EXCEPT {_EXPECTED_BY_PART}))"
+        )).scalar(),
+        "stock_by_location": conn.execute(text(
+            f"SELECT COUNT(*) FROM (SELECT DISTINCT location_id, part_number FROM ("
+            f"SELECT * FROM ({_EXPECTED_BY_LOCATION} EXCEPT "
+            f"SELECT location_id, part_number, quantity, items FROM stock_by_location) "
+            f"UNION ALL SELECT * FROM (SELECT location_id, part_number, quantity, items FROM stock_by_location "
+            f"EXCEPT {_EXPECTED_BY_LOCATION})))"
+        )).scalar(),
+    }
+    fixed = bool(fix and any(drift.values()))
+    if fixed:
+        rebuild_totals(conn)
+        logger.warning("Rebuilt stock totals: %s groups had drifted", drift)
+    return {**drift, "fixed": fixed}
+
+
+def totals_statement(group_by: str, part_number: Optional[str], location_id: Optional[int],
+                     box_code: Optional[str], after, limit: int):
+    """SELECT for one page of totals, keyed and ordered by the group's cursor column.
+
+    Reads the trigger-maintained summary tables, so a part's total (or its
+    split over locations) is a primary key lookup however many inventory
+    rows it covers. Only a box_code filter or group_by=box reads inventory
+    itself, through its (box_id, part_number) index. location_id is the
+    resolved location_name filter (0 for boxes without a location).
+    Rows carry (key, label, quantity, items); fetches limit + 1 rows.
+    """
+    by_box = box_code is not None or group_by == "box"
+    if by_box:
+        # Box contents are small and live in inventory itself
+        source = (
+            select(InventoryItem.box_id, InventoryItem.part_number, InventoryItem.quantity,
+                   func.coalesce(Box.location_id, 0).label("location_id"), Box.code,
+                   Location.name.label("location_name"))
+            .join_from(InventoryItem, Box, Box.box_id == InventoryItem.box_id)
+            .join_from(Box, Location, Location.location_id == Box.location_id, isouter=True)
+        )
+        if box_code is not None:
+            source = source.where(Box.code == box_code)
+        if part_number is not None:
+            source = source.where(InventoryItem.part_number == part_number)
+        if location_id is not None:
+            source = source.where(func.coalesce(Box.location_id, 0) == location_id)
+        source = source.subquery()
+        quantity, items = func.sum(source.c.quantity), func.count()
+        key = {"part": source.c.part_number, "location": source.c.location_id, "box": source.c.box_id}[group_by]
+        label = {"part": source.c.part_number, "location": func.min(source.c.location_name),
+                 "box": func.min(source.c.code)}[group_by]
+        stmt = select(key.label("key"), label.label("label"), quantity.label("quantity"), items.label("items"))
+        stmt = stmt.select_from(source).group_by(key)
+    elif group_by == "part" and location_id is None:
+        key = StockByPart.part_number
+        stmt = select(key.label("key"), key.label("label"), StockByPart.quantity, StockByPart.items)
+        if part_number is not None:
+            stmt = stmt.where(key == part_number)
+    elif group_by == "part":
+        key = StockByLocation.part_number
+        stmt = (
+            select(key.label("key"), key.label("label"), StockByLocation.quantity, StockByLocation.items)
+            .where(StockByLocation.location_id == location_id)
+        )
+        if part_number is not None:
+            stmt = stmt.where(key == part_number)
+    else:  # location
+        key = StockByLocation.location_id
+        stmt = (
+            select(key.label("key"), func.min(Location.name).label("label"),
+                   func.sum(StockByLocation.quantity).label("quantity"),
+                   func.sum(StockByLocation.items).label("items"))
+            .join_from(StockByLocation, Location, Location.location_id == key, isouter=True)
+            .group_by(key)
+        )
+        if part_number is not None:
+            stmt = stmt.where(StockByLocation.part_number == part_number)
+        if location_id is not None:
+            stmt = stmt.where(key == location_id)
+    if after is not None:
+        stmt = stmt.where(key > after)
+    return stmt.order_by(key).limit(limit + 1)
+
+
+def totals_page(group_by: str, rows, limit: int):
+    """(items, next_cursor) for a totals query's rows."""
+    next_cursor = rows[limit - 1].key if len(rows) > limit else None
+    field = {"part": "part_number", "location": "location_name", "box": "box_id"}[group_by]
+    items = []
+    for r in rows[:limit]:
+        label = r.label
+        if group_by == "location" and r.key == 0:
+            label = ""  # boxes without a location
+        items.append({field: label, "quantity": r.quantity or 0, "items": r.items})
+    return items, next_cursor
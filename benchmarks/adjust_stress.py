@@ -0,0 +1,138 @@
+# benchmarks/adjust_stress.py
+# Run with: python -m benchmarks.adjust_stress [threads] [updates_per_thread]
+#
+# Many writers each add 1 to the same inventory item against a real uvicorn
+# server, then the final quantity is checked against the number of updates:
+#   - read-modify-write: GET the quantity, PUT quantity + 1 (the GUI's old
+#     update path), which loses updates when writers interleave;
+#   - adjust: POST /inventory/{id}/adjust with delta=1, one UPDATE statement;
+#   - compare-and-set: adjust with expected_quantity, re-reading on 409;
+#   - batch: POST /inventory/adjust bumping every item of a box at once.
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+_fd, DB_PATH = tempfile.mkstemp(suffix=".db", prefix="parts_adjust_")
+os.close(_fd)
+os.environ["PARTS_DB_URL"] = f"sqlite:///{DB_PATH}"
+
+from benchmarks.common import api_server  # noqa: E402
+from gui.api_client import ApiClient  # noqa: E402
+
+PART = "PN-HOT"
+BATCH_PARTS = 10
+
+
+def seed(client):
+    client.add_locations_bulk([{"location_name": "LOC-0", "description": "bench"}])
+    client.add_parts_bulk([{"part_number": f"{PART}-{k}", "description": "bench"} for k in range(BATCH_PARTS)])
+    client.add_inventory_bulk([
+        {"box_id": "BOX-0", "part_number": f"{PART}-{k}", "description": "bench",
+         "location_name": "LOC-0", "quantity": 0}
+        for k in range(BATCH_PARTS)
+    ])
+    return {row["part_number"]: row["inventory_id"] for row in client.search_inventory_by_box("BOX-0")}
+
+
+def quantity(client, part_number):
+    return client.search_inventory(part_number)[0]["quantity"]
+
+
+def read_modify_write(client, item_id, part_number):
+    current = quantity(client, part_number)
+    client.update_inventory(item_id, part_number, "bench", current + 1)
+    return 0
+
+
+def adjust(client, item_id, part_number):
+    client.adjust_inventory(item_id, 1)
+    return 0
+
+
+def compare_and_set(client, item_id, part_number):
+    expected, retries = quantity(client, part_number), 0
+    while True:
+        result = client.adjust_inventory(item_id, 1, expected_quantity=expected)
+        if not result.get("conflict"):
+            return retries
+        expected, retries = result["quantity"], retries + 1
+
+
+def run(label, base_url, threads, per_thread, update, item_id, part_number):
+    clients = [ApiClient(base_url) for _ in range(threads)]
+    before = quantity(clients[0], part_number)
+    retries = []
+    barrier = threading.Barrier(threads)
+
+    def writer(client):
+        barrier.wait()
+        retries.append(sum(update(client, item_id, part_number) for _ in range(per_thread)))
+
+    workers = [threading.Thread(target=writer, args=(c,)) for c in clients]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    gained = quantity(clients[0], part_number) - before
+    expected = threads * per_thread
+    return {
+        "mode": label,
+        "updates": expected,
+        "applied": gained,
+        "lost": expected - gained,
+        "retries": sum(retries),
+        "updates_per_s": round(expected / elapsed, 1),
+    }
+
+
+def run_batch(base_url, threads, per_thread, items):
+    clients = [ApiClient(base_url) for _ in range(threads)]
+    before = {pn: quantity(clients[0], pn) for pn in items}
+    batch = [{"item_id": item_id, "delta": 1} for item_id in items.values()]
+    barrier = threading.Barrier(threads)
+
+    def writer(client):
+        barrier.wait()
+        for _ in range(per_thread):
+            client.adjust_inventory_batch(batch)
+
+    workers = [threading.Thread(target=writer, args=(c,)) for c in clients]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    lost = sum(threads * per_thread - (quantity(clients[0], pn) - before[pn]) for pn in items)
+    return {
+        "mode": f"batch of {len(batch)}",
+        "updates": threads * per_thread * len(batch),
+        "lost": lost,
+        "updates_per_s": round(threads * per_thread * len(batch) / elapsed, 1),
+    }
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    try:
+        with api_server() as base_url:
+            items = seed(ApiClient(base_url))
+            part_number = f"{PART}-0"
+            for label, update in (("read-modify-write", read_modify_write), ("adjust", adjust),
+                                  ("compare-and-set", compare_and_set)):
+                print(json.dumps(run(label, base_url, threads, per_thread, update, items[part_number], part_number)))
+            print(json.dumps(run_batch(base_url, threads, per_thread, items)))
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(DB_PATH + suffix):
+                os.remove(DB_PATH + suffix)
+
+
+if __name__ == "__main__":
+    main()
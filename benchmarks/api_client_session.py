@@ -0,0 +1,86 @@
+# benchmarks/api_client_session.py
+# Run with: python -m benchmarks.api_client_session [calls]
+#
+# Times sequential search_inventory calls against a real uvicorn server on
+# localhost, opening a new TCP connection per call (the old module-level
+# requests.get behaviour) versus reusing ApiClient's keep-alive pool.
+# Over a remote link the gap grows with the round-trip time.
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+_fd, DB_PATH = tempfile.mkstemp(suffix=".db", prefix="parts_client_")
+os.close(_fd)
+os.environ["PARTS_DB_URL"] = f"sqlite:///{DB_PATH}"
+
+import requests  # noqa: E402
+
+from benchmarks.common import api_server  # noqa: E402
+from gui.api_client import ApiClient  # noqa: E402
+
+PARTS = 200
+
+
+def seed(client):
+    client.add_locations_bulk([{"location_name": "LOC-0", "description": "bench"}])
+    client.add_parts_bulk([{"part_number": f"PN-{i}", "description": "bench"} for i in range(PARTS)])
+    client.add_inventory_bulk([
+        {"box_id": f"BOX-{b}", "part_number": f"PN-{(b * 7 + k) % PARTS}", "description": "bench",
+         "location_name": "LOC-0", "quantity": 1}
+        for b in range(100) for k in range(5)
+    ])
+
+
+def run(label, calls, search):
+    latencies = []
+    start = time.perf_counter()
+    for i in range(calls):
+        t0 = time.perf_counter()
+        search(f"PN-{i % PARTS}")
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - start
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "mode": label,
+        "calls": calls,
+        "total_s": round(elapsed, 3),
+        "p50_ms": round(cuts[49], 3),
+        "p99_ms": round(cuts[98], 3),
+    }
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    try:
+        with api_server() as base_url, ApiClient(base_url) as client:
+            seed(client)
+            url = f"{base_url}/inventory/search"
+
+            def fresh_connection(part_number):
+                # Connection: close so the server does not hold the socket open
+                requests.get(url, params={"part_number": part_number},
+                             headers={"Connection": "close"}).json()
+
+            def pooled(part_number):
+                client.session.get(url, params={"part_number": part_number}).json()
+
+            print(json.dumps(run("new connection per call", calls, fresh_connection)))
+            before = client.connection_stats()
+            result = run("pooled keep-alive session", calls, pooled)
+            after = client.connection_stats()
+            result["connections_opened"] = after["connections_opened"] - before["connections_opened"]
+            print(json.dumps(result))
+            # The client method adds ETag revalidation on top of the pool
+            print(json.dumps(run("ApiClient.search_inventory", calls, client.search_inventory)))
+            print(json.dumps({"connection_stats": client.connection_stats()}))
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(DB_PATH + suffix):
+                os.remove(DB_PATH + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/async_api_client.py
+# Run with: python -m benchmarks.async_api_client [part_numbers] [concurrency] [latency_ms]
+#
+# Stock check over many part numbers against a local uvicorn server:
+# ApiClient.search_inventory one at a time versus
+# AsyncApiClient.search_inventory_many with bounded concurrency. latency_ms
+# (default 20) simulates the round trip of a remote link; at 0 on a
+# single-core box the server's CPU is the limit and fan-out cannot help.
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+_fd, DB_PATH = tempfile.mkstemp(suffix=".db", prefix="parts_async_client_")
+os.close(_fd)
+os.environ["PARTS_DB_URL"] = f"sqlite:///{DB_PATH}"
+
+from benchmarks.common import api_server  # noqa: E402
+from gui.api_client import ApiClient  # noqa: E402
+from gui.async_api_client import AsyncApiClient  # noqa: E402
+
+
+def seed(client, parts):
+    client.add_locations_bulk([{"location_name": "LOC-0", "description": "bench"}])
+    client.add_parts_bulk([{"part_number": f"PN-{i}", "description": "bench"} for i in range(parts)])
+    client.add_inventory_bulk([
+        {"box_id": f"BOX-{i // 10}", "part_number": f"PN-{i}", "description": "bench",
+         "location_name": "LOC-0", "quantity": 1}
+        for i in range(parts)
+    ])
+
+
+async def fan_out(base_url, part_numbers, concurrency):
+    async with AsyncApiClient(base_url, concurrency=concurrency) as client:
+        return await client.search_inventory_many(part_numbers)
+
+
+def main():
+    parts = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    latency_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 20
+    part_numbers = [f"PN-{i}" for i in range(parts)]
+    try:
+        with api_server(latency_ms) as base_url:
+            with ApiClient(base_url) as client:
+                seed(client, parts)
+                start = time.perf_counter()
+                serial = {pn: client.search_inventory(pn) for pn in part_numbers}
+                print(json.dumps({"mode": "ApiClient serial", "lookups": len(serial), "latency_ms": latency_ms,
+                                  "total_s": round(time.perf_counter() - start, 3)}))
+
+            start = time.perf_counter()
+            concurrent = asyncio.run(fan_out(base_url, part_numbers, concurrency))
+            print(json.dumps({"mode": "AsyncApiClient.search_inventory_many", "lookups": len(concurrent),
+                              "concurrency": concurrency, "latency_ms": latency_ms,
+                              "total_s": round(time.perf_counter() - start, 3)}))
+            assert concurrent == serial, "async and sync clients returned different results"
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(DB_PATH + suffix):
+                os.remove(DB_PATH + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/async_load.py
+# Run with: python -m benchmarks.async_load [clients] [requests_per_client]
+#
+# Compares latency of the sync (threadpool) and async (aiosqlite) route modes
+# with many concurrent in-process clients hitting the read endpoints.
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+_fd, DB_PATH = tempfile.mkstemp(suffix=".db", prefix="parts_load_")
+os.close(_fd)
+os.environ["PARTS_DB_URL"] = f"sqlite:///{DB_PATH}"
+
+import httpx  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import create_app  # noqa: E402
+
+PARTS = 200
+
+
+def seed():
+    client = TestClient(create_app())
+    client.post("/locations/bulk", json=[{"location_name": f"LOC-{i}", "description": "load"} for i in range(10)])
+    client.post("/parts/bulk", json=[{"part_number": f"PN-{i}", "description": "load"} for i in range(PARTS)])
+    client.post("/inventory/bulk", json=[
+        {"box_id": f"BOX-{b}", "part_number": f"PN-{(b * 7 + k) % PARTS}", "description": "load",
+         "location_name": f"LOC-{b % 10}", "quantity": 1}
+        for b in range(500) for k in range(5)
+    ])
+
+
+async def run_mode(async_db, clients, per_client):
+    app = create_app(async_db=async_db)
+    latencies = []
+
+    async def worker(client, n):
+        for i in range(per_client):
+            path = (f"/inventory/search?part_number=PN-{(n + i) % PARTS}" if i % 2
+                    else f"/parts/search?part_number=PN-{(n + i) % PARTS}")
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm-up round so pool connections are open before measuring
+        await asyncio.gather(*(client.get("/parts/search?part_number=PN-0") for _ in range(clients)))
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client, n) for n in range(clients)))
+        elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "mode": "async" if async_db else "sync",
+        "clients": clients,
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(cuts[49], 2),
+        "p99_ms": round(cuts[98], 2),
+    }
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    per_client = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    try:
+        seed()
+        for async_db in (False, True):
+            print(json.dumps(asyncio.run(run_mode(async_db, clients, per_client))))
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(DB_PATH + suffix):
+                os.remove(DB_PATH + suffix)
+
+
+if __name__ == "__main__":
+    main()
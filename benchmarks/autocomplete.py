@@ -0,0 +1,43 @@
+# benchmarks/autocomplete.py
+# Run with: python -m benchmarks.autocomplete [names]
+#
+# Times app.autocomplete.PrefixIndex on `names` generated part numbers
+# (default 1M): the startup build, prefix lookups of varying selectivity,
+# and the incremental add/remove the write routes perform.
+import json
+import sys
+import time
+
+from app.autocomplete import PrefixIndex
+from benchmarks.common import time_call
+
+PREFIXES = ["p", "pn-", "pn-05", "pn-0500", "PN-0500000", "zz"]
+
+
+def per_call_us(fn, calls=2000):
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) * 1e6 / calls
+
+
+def main():
+    names = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = [f"PN-{i:07d}" for i in range(names)]
+    index = PrefixIndex("bench")
+
+    start = time.perf_counter()
+    index.load(values)
+    print(json.dumps({"names": names, "load_s": round(time.perf_counter() - start, 2)}))
+
+    for prefix in PREFIXES:
+        ms = time_call(lambda: index.complete(prefix, 10), repeat=200)
+        print(json.dumps({"prefix": prefix, "matches": len(index.complete(prefix, 10)), "us": round(ms * 1000, 1)}))
+
+    add_us = per_call_us(lambda i: index.add(f"PN-X{i:05d}"))
+    remove_us = per_call_us(lambda i: index.remove(f"PN-X{i:05d}"))
+    print(json.dumps({"add_us": round(add_us, 1), "remove_us": round(remove_us, 1)}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.db import create_db_engine
+from app.models import Base
+
+
+@contextmanager
+def temp_database(pragmas=None):
+    """Yield (engine, SessionLocal) bound to a throwaway SQLite file.
+
+    `pragmas` is passed to create_db_engine; None means the production defaults.
+    """
+    fd, path = tempfile.mkstemp(suffix=".db", prefix="parts_bench_")
+    os.close(fd)
+    engine = create_db_engine(f"sqlite:///{path}", pragmas)
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+class StatementCounter:
+    """Count SQL statements executed on an engine while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def delayed_app():
+    """create_app() with PARTS_BENCH_LATENCY_MS of non-blocking delay per request.
+
+    Stands in for the round trip of a remote link, which loopback lacks.
+    """
+    import asyncio
+
+    from app.main import create_app
+
+    app = create_app()
+    delay = float(os.getenv("PARTS_BENCH_LATENCY_MS", "0")) / 1000
+    if not delay:
+        return app
+
+    @app.middleware("http")
+    async def simulated_latency(request, call_next):
+        await asyncio.sleep(delay)
+        return await call_next(request)
+
+    return app
+
+
+@contextmanager
+def api_server(latency_ms=0, workers=1):
+    """Run the API under uvicorn in a child process on a free localhost port.
+
+    The child inherits PARTS_DB_URL, so set it before entering. Running the
+    server out of process keeps it from competing with the client for the GIL.
+    `latency_ms` adds a simulated network delay to every request; `workers`
+    is uvicorn's worker process count. Yields the base URL.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env = dict(os.environ, PARTS_BENCH_LATENCY_MS=str(latency_ms))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.common:delayed_app", "--factory",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+         "--timeout-graceful-shutdown", "5", "--workers", str(workers)],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                urllib.request.urlopen(f"{base_url}/cache/stats", timeout=1)
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("API server did not start")
+                time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def time_call(fn, repeat=5):
+    """Return the median wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
@@ -0,0 +1,108 @@
+# benchmarks/fulltext_search.py
+# Run with: python -m benchmarks.fulltext_search [rows]
+#
+# Compares the FTS5 index behind /parts/find with a LIKE '%q%' scan over
+# part_number and description, on `rows` generated parts (default 1M).
+# Also reports the index build time and its cost per inserted row.
+import json
+import random
+import sys
+import time
+
+from sqlalchemy import text
+
+from benchmarks.common import temp_database, time_call
+from app import search
+
+NOUNS = ["O-RING", "GASKET", "WASHER", "BEARING", "BOLT", "NUT", "SPRING", "SEAL", "VALVE", "FITTING",
+         "BRACKET", "HOSE", "CLAMP", "BUSHING", "PIN", "SHIM", "SCREW", "RIVET", "FILTER", "SENSOR"]
+MATERIALS = ["viton", "nitrile", "steel", "brass", "nylon", "ptfe", "aluminium", "silicone"]
+LIMIT = 100
+
+# (label, q) covering a rare word, a common word, a short prefix and an exact part number
+QUERIES = [
+    ("rare word", "zirconia"),
+    ("common word", "gasket"),
+    ("two words", "o-ring viton"),
+    ("prefix", "bear"),
+    ("part number", "PN-0500000"),
+]
+
+
+def seed(conn, rows, extra=0):
+    rng = random.Random(42)
+    batch = []
+    for i in range(extra, extra + rows):
+        words = [rng.choice(NOUNS), rng.choice(MATERIALS), f"{rng.randint(2, 80)}mm"]
+        if rng.random() < 0.0001:
+            words.append("zirconia")
+        batch.append({"pn": f"PN-{i:07d}", "d": " ".join(words)})
+        if len(batch) == 10000:
+            conn.execute(text("INSERT INTO parts (part_number, description) VALUES (:pn, :d)"), batch)
+            batch = []
+    if batch:
+        conn.execute(text("INSERT INTO parts (part_number, description) VALUES (:pn, :d)"), batch)
+
+
+def like_search(conn, q):
+    # The exact-match routes' only alternative before /find: a leading-wildcard scan
+    clauses, params = [], {"limit": LIMIT + 1}
+    for n, word in enumerate(q.split()):
+        params[f"w{n}"] = f"%{word}%"
+        clauses.append(f"(part_number LIKE :w{n} OR description LIKE :w{n})")
+    return conn.execute(text(
+        f"SELECT part_id, part_number, description FROM parts WHERE {' AND '.join(clauses)} "
+        f"ORDER BY part_id LIMIT :limit"
+    ), params).all()
+
+
+def fts_search(conn, q):
+    params = search.find_params(q, search.match_query(q), 0, LIMIT)
+    return conn.execute(search.FIND_PARTS, params).all()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with temp_database() as (engine, _):
+        with engine.begin() as conn:
+            start = time.perf_counter()
+            seed(conn, rows)
+            print(json.dumps({"seeded_rows": rows, "seconds": round(time.perf_counter() - start, 1)}))
+
+        with engine.begin() as conn:
+            start = time.perf_counter()
+            search.install_indexes(conn)
+            print(json.dumps({"index_build_s": round(time.perf_counter() - start, 1)}))
+
+        with engine.connect() as conn:
+            for label, q in QUERIES:
+                like_ms = time_call(lambda: like_search(conn, q), repeat=3)
+                fts_ms = time_call(lambda: fts_search(conn, q), repeat=3)
+                total = conn.execute(
+                    text("SELECT COUNT(*) FROM parts_fts WHERE parts_fts MATCH :m"),
+                    {"m": search.match_query(q)},
+                ).scalar()
+                print(json.dumps({
+                    "query": label,
+                    "q": q,
+                    "fts_matches": total,
+                    "like_ms": round(like_ms, 2),
+                    "fts_ms": round(fts_ms, 2),
+                    "speedup": round(like_ms / fts_ms, 1) if fts_ms else None,
+                }))
+
+        # What keeping the index in sync costs each write
+        for label, drop in (("insert with fts triggers", False), ("insert without", True)):
+            with engine.begin() as conn:
+                if drop:
+                    for name in search.INDEXES:
+                        for op in ("insert", "update", "delete"):
+                            conn.execute(text(f"DROP TRIGGER trg_{name}_{op}"))
+                start = time.perf_counter()
+                seed(conn, 10000, extra=rows + (10000 if drop else 0))
+                elapsed = time.perf_counter() - start
+            print(json.dumps({"mode": label, "rows": 10000, "us_per_row": round(elapsed * 1e6 / 10000, 1)}))
+
+
+if __name__ == "__main__":
+    main()
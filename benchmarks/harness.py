@@ -0,0 +1,443 @@
+# benchmarks/harness.py
+# Run with: python -m benchmarks.harness [--parts N] [--locations N] [--boxes N] [--inventory N]
+#                                        [--requests N] [--concurrency N] [--modes ...] [--out FILE]
+#           python -m benchmarks.harness compare OLD.json NEW.json
+#
+# Reproducible load test of every route in app/routes. Builds a synthetic
+# dataset (seeded, so the same options give the same rows) into a template
+# SQLite file, then for each mode copies it to a fresh working database and
+# sends --requests calls per endpoint, --concurrency at a time:
+#   inprocess-sync   create_app() through httpx's ASGI transport, no sockets
+#   inprocess-async  the same with PARTS_DB_ASYNC routes
+#   server           uvicorn with --workers processes, driven by --clients
+#                    load generator processes over loopback
+# Prints one JSON document with throughput and p50/p95/p99 latency per
+# endpoint (and writes it to --out); `compare` diffs two such documents.
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+
+_DIR = tempfile.mkdtemp(prefix="parts_harness_")
+DB_PATH = os.path.join(_DIR, "run.db")
+TEMPLATE_PATH = os.path.join(_DIR, "template.db")
+os.environ["PARTS_DB_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["PARTS_JOBS_DIR"] = os.path.join(_DIR, "jobs")
+
+import httpx  # noqa: E402
+from fastapi.routing import APIRoute  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app import cache, jobs  # noqa: E402
+from app.db import Base, create_db_engine, engine as app_engine  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.migrations import upgrade  # noqa: E402
+from benchmarks.common import api_server  # noqa: E402
+
+MODES = ("inprocess-sync", "inprocess-async", "server")
+WORDS = ["resistor", "capacitor", "o-ring", "bearing", "bolt", "washer", "spring", "gasket",
+         "relay", "fuse", "diode", "sensor", "valve", "cable", "bracket", "hinge"]
+BULK = 10  # rows per bulk/batch request
+
+# Routes the harness does not drive, with the reason
+SKIPPED = {
+    "GET /events": "long-lived SSE stream; see /events/stats",
+    "GET /jobs/{job_id}": "needs a job handle from POST /jobs",
+    "GET /jobs/{job_id}/result": "needs a job handle from POST /jobs",
+    "POST /jobs/{job_id}/cancel": "needs a job handle from POST /jobs",
+}
+# Whole-table routes get a tenth of the requests
+HEAVY = {"GET /inventory/export", "GET /parts/print", "GET /locations/print", "GET /boxes/print",
+         "GET /reports/{name}", "POST /reports/{name}", "POST /jobs", "POST /jobs/import/{target}"}
+REPORTS = ("parts", "locations", "boxes", "inventory")
+REPORT_FORMATS = ("csv", "ndjson", "text")
+
+
+@dataclass
+class Dataset:
+    parts: int = 2000
+    locations: int = 20
+    boxes: int = 2000
+    inventory: int = 20000
+    seed: int = 1
+    # Extra rows per DELETE route so every delete request has its own target
+    spare: int = 200
+
+
+def part_number(i):
+    return f"PN-{i:06d}"
+
+
+def location_name(i):
+    return f"LOC-{i:03d}"
+
+
+def box_code(i):
+    return f"BOX-{i:05d}"
+
+
+def build(path, ds: Dataset) -> dict:
+    """Create the schema and rows in a new SQLite file; return the ids routes will target.
+
+    Rows go in through the schema's triggers, so the change log, full-text
+    index and stock totals match what the API would have produced.
+    """
+    if ds.inventory > ds.boxes * ds.parts or ds.spare > ds.parts:
+        raise SystemExit("inventory must fit in boxes x parts, and spare in parts")
+    rng = random.Random(ds.seed)
+    engine = create_db_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    upgrade(engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO locations (name, description) VALUES (:n, :d)"),
+                     [{"n": location_name(i), "d": f"Shelf {i}"} for i in range(ds.locations)]
+                     + [{"n": f"LOC-DEL-{i}", "d": "spare"} for i in range(ds.spare)])
+        conn.execute(text("INSERT INTO parts (part_number, description) VALUES (:pn, :d)"),
+                     [{"pn": part_number(i), "d": " ".join(rng.sample(WORDS, 3))} for i in range(ds.parts)]
+                     + [{"pn": f"PN-DEL-{i}", "d": "spare"} for i in range(ds.spare)])
+        conn.execute(text("INSERT INTO boxes (code, location_id) VALUES (:c, :l)"),
+                     [{"c": box_code(i), "l": i % ds.locations + 1} for i in range(ds.boxes)]
+                     + [{"c": f"BOX-DEL-{i}", "l": 1} for i in range(ds.spare)]
+                     + [{"c": "BOX-SPARE", "l": 1}])
+        rows, per_box = [], -(-ds.inventory // ds.boxes)
+        for b in range(ds.boxes):
+            count = min(per_box, ds.inventory - len(rows))
+            rows += [{"b": b + 1, "pn": part_number(p), "d": "stock", "q": rng.randint(1, 100)}
+                     for p in rng.sample(range(ds.parts), count)]
+        spare_box = ds.boxes + ds.spare + 1
+        rows += [{"b": spare_box, "pn": part_number(i), "d": "spare", "q": 1} for i in range(ds.spare)]
+        conn.execute(text("INSERT INTO inventory (box_id, part_number, description, quantity, updated_at) "
+                          "VALUES (:b, :pn, :d, :q, datetime('now'))"), rows)
+
+        def ids(sql):
+            return [r[0] for r in conn.execute(text(sql))]
+
+        targets = {
+            "parts": ids("SELECT part_id FROM parts WHERE part_number LIKE 'PN-DEL-%' ORDER BY part_id"),
+            "locations": ids("SELECT location_id FROM locations WHERE name LIKE 'LOC-DEL-%' ORDER BY location_id"),
+            "boxes": ids("SELECT box_id FROM boxes WHERE code LIKE 'BOX-DEL-%' ORDER BY box_id"),
+            "inventory": ids(f"SELECT item_id FROM inventory WHERE box_id = {spare_box} ORDER BY item_id"),
+            "items": [tuple(r) for r in conn.execute(text(
+                f"SELECT item_id, part_number FROM inventory WHERE box_id <> {spare_box} ORDER BY item_id"))],
+        }
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    engine.dispose()
+    return targets
+
+
+def scenarios(ds: Dataset, targets: dict) -> dict:
+    """endpoint ("METHOD /template") -> f(i, rng) giving the (path, json body) of its i-th request."""
+    def pn(rng):
+        return part_number(rng.randrange(ds.parts))
+
+    def loc(rng):
+        return location_name(rng.randrange(ds.locations))
+
+    def box(rng):
+        return box_code(rng.randrange(ds.boxes))
+
+    def item(rng):
+        return rng.choice(targets["items"])  # (item_id, part_number)
+
+    def word(rng):
+        return rng.choice(WORDS)
+
+    def update_item(i, rng):
+        item_id, number = item(rng)
+        return f"/inventory/{item_id}", {"part_number": number, "description": "bench", "quantity": rng.randint(1, 99)}
+
+    def complete(i, rng):
+        kind, prefix = (("parts", "PN-00"), ("boxes", "BOX-0"), ("locations", "LOC-0"))[i % 3]
+        return f"/autocomplete/{kind}?prefix={prefix}{rng.randrange(10)}", None
+
+    group = ("part", "location", "box")
+    return {
+        "POST /parts/": lambda i, rng: ("/parts/", {"part_number": f"PN-NEW-{i}", "description": "bench"}),
+        "POST /parts/bulk": lambda i, rng: ("/parts/bulk", [
+            {"part_number": f"PN-BULK-{i}-{k}", "description": "bench"} for k in range(BULK)]),
+        "GET /parts/search": lambda i, rng: (f"/parts/search?part_number={pn(rng)}", None),
+        "GET /parts/print": lambda i, rng: ("/parts/print", None),
+        "GET /parts/all": lambda i, rng: (f"/parts/all?after={rng.randrange(ds.parts)}&limit=100", None),
+        "GET /parts/find": lambda i, rng: (f"/parts/find?q={word(rng)}&limit=20", None),
+        "GET /parts/{part_id}": lambda i, rng: (f"/parts/{rng.randrange(1, ds.parts + 1)}", None),
+        "GET /parts/by_number/{part_number}": lambda i, rng: (f"/parts/by_number/{pn(rng)}", None),
+        "GET /parts/resolve_id/{part_number}": lambda i, rng: (f"/parts/resolve_id/{pn(rng)}", None),
+        "DELETE /parts/{part_id}": lambda i, rng: (f"/parts/{targets['parts'][i]}", None),
+
+        "POST /locations/": lambda i, rng: ("/locations/", {"location_name": f"LOC-NEW-{i}", "description": "b"}),
+        "POST /locations/bulk": lambda i, rng: ("/locations/bulk", [
+            {"location_name": f"LOC-BULK-{i}-{k}", "description": "bench"} for k in range(BULK)]),
+        "GET /locations/search": lambda i, rng: (f"/locations/search?location_name={loc(rng)}", None),
+        "GET /locations/print": lambda i, rng: ("/locations/print", None),
+        "GET /locations/all": lambda i, rng: ("/locations/all?limit=100", None),
+        "GET /locations/{location_id}": lambda i, rng: (f"/locations/{rng.randrange(1, ds.locations + 1)}", None),
+        "GET /locations/resolve_id/{location_name}": lambda i, rng: (f"/locations/resolve_id/{loc(rng)}", None),
+        "DELETE /locations/{location_id}": lambda i, rng: (f"/locations/{targets['locations'][i]}", None),
+
+        "POST /boxes/": lambda i, rng: ("/boxes/", {"code": f"BOX-NEW-{i}", "location_name": loc(rng)}),
+        "GET /boxes/search": lambda i, rng: (f"/boxes/search?code={box(rng)}", None),
+        "GET /boxes/all": lambda i, rng: (f"/boxes/all?after={rng.randrange(ds.boxes)}&limit=100", None),
+        "GET /boxes/print": lambda i, rng: ("/boxes/print", None),
+        "GET /boxes/{box_id}": lambda i, rng: (f"/boxes/{rng.randrange(1, ds.boxes + 1)}", None),
+        "DELETE /boxes/{box_id}": lambda i, rng: (f"/boxes/{targets['boxes'][i]}", None),
+
+        "POST /inventory/": lambda i, rng: ("/inventory/", {
+            "box_id": f"BOX-INV-{i}", "part_number": pn(rng), "description": "bench",
+            "location_name": loc(rng), "quantity": 1}),
+        "POST /inventory/bulk": lambda i, rng: ("/inventory/bulk", [
+            {"box_id": f"BOX-BULK-{i}", "part_number": part_number(k), "description": "bench",
+             "location_name": location_name(0), "quantity": 1} for k in range(BULK)]),
+        "PUT /inventory/{item_id}": update_item,
+        "POST /inventory/{item_id}/adjust": lambda i, rng: (f"/inventory/{item(rng)[0]}/adjust", {"delta": 1}),
+        "POST /inventory/adjust": lambda i, rng: ("/inventory/adjust", [
+            {"item_id": item(rng)[0], "delta": 1} for _ in range(BULK)]),
+        "GET /inventory/search": lambda i, rng: (f"/inventory/search?part_number={pn(rng)}", None),
+        "GET /inventory/search_by_box/{box_code}": lambda i, rng: (f"/inventory/search_by_box/{box(rng)}", None),
+        "GET /inventory/find": lambda i, rng: (f"/inventory/find?q={word(rng)}&limit=20", None),
+        "GET /inventory/totals": lambda i, rng: (
+            f"/inventory/totals?group_by={group[i % 3]}&part_number={pn(rng)}", None),
+        "GET /inventory/export": lambda i, rng: ("/inventory/export", None),
+        "DELETE /inventory/{inventory_id}": lambda i, rng: (f"/inventory/{targets['inventory'][i]}", None),
+
+        "GET /reports/{name}": lambda i, rng: (
+            f"/reports/{REPORTS[i % 4]}?format={REPORT_FORMATS[i % 3]}", None),
+        "POST /reports/{name}": lambda i, rng: (f"/reports/{REPORTS[i % 4]}?format=csv", None),
+
+        "POST /jobs": lambda i, rng: ("/jobs", (
+            {"kind": "export", "params": {"report": REPORTS[i % 4]}},
+            {"kind": "reconcile", "params": {"fix": False}})[i % 2]),
+        "POST /jobs/import/{target}": lambda i, rng: ("/jobs/import/parts", [
+            {"part_number": f"PN-JOB-{i}-{k}", "description": "bench"} for k in range(BULK)]),
+        "GET /jobs": lambda i, rng: ("/jobs?limit=20", None),
+
+        "GET /changes": lambda i, rng: (f"/changes?since={rng.randrange(ds.inventory)}&limit=100", None),
+        "GET /autocomplete/{kind}": complete,
+        "GET /events/stats": lambda i, rng: ("/events/stats", None),
+        "GET /cache/stats": lambda i, rng: ("/cache/stats", None),
+        "GET /metrics": lambda i, rng: ("/metrics", None),
+    }
+
+
+def routes_under_test(app) -> set:
+    """Every "METHOD /template" served by a router in app/routes."""
+    found = set()
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.endpoint.__module__.startswith("app.routes."):
+            found.update(f"{method} {route.path_format}" for method in route.methods if method != "HEAD")
+    return found
+
+
+def plan(ds: Dataset, targets: dict, requests: int) -> dict:
+    """endpoint -> list of (method, path, body), the same for every mode and run."""
+    planned = {}
+    for endpoint, make in scenarios(ds, targets).items():
+        method = endpoint.split(" ", 1)[0]
+        rng = random.Random(f"{ds.seed}:{endpoint}")
+        count = max(1, requests // 10) if endpoint in HEAVY else requests
+        planned[endpoint] = [(method, *make(i, rng)) for i in range(count)]
+    return planned
+
+
+async def drive(client: httpx.AsyncClient, calls, concurrency: int):
+    """Send calls with up to `concurrency` in flight; return (latencies in ms, errors, seconds)."""
+    latencies, errors = [], 0
+    pending = iter(calls)
+
+    async def worker():
+        nonlocal errors
+        for method, path, body in pending:
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def summarize(latencies, errors, seconds) -> dict:
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0]
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / seconds, 1),
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+    }
+
+
+def fresh_database():
+    """Point the working database back at the template; the app's engine must hold no connections."""
+    app_engine.dispose()
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(DB_PATH + suffix):
+            os.remove(DB_PATH + suffix)
+    shutil.copyfile(TEMPLATE_PATH, DB_PATH)
+    for lookup in cache.CACHES:
+        lookup.clear()
+
+
+async def run_inprocess(async_db: bool, planned: dict, concurrency: int) -> dict:
+    app = create_app(async_db=async_db)
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for endpoint, calls in planned.items():
+            results[endpoint] = summarize(*await drive(client, calls, concurrency))
+            # Jobs queued by this endpoint finish before the next one is timed
+            await asyncio.to_thread(jobs.drain)
+    return results
+
+
+def _client_process(job):
+    base_url, calls, concurrency = job
+
+    async def run():
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+            return await drive(client, calls, concurrency)
+
+    return asyncio.run(run())
+
+
+def run_server(planned: dict, concurrency: int, workers: int, clients: int) -> dict:
+    results = {}
+    with api_server(workers=workers) as base_url, multiprocessing.Pool(clients) as pool:
+        for endpoint, calls in planned.items():
+            shares = [calls[k::clients] for k in range(clients) if calls[k::clients]]
+            start = time.perf_counter()
+            parts = pool.map(_client_process, [(base_url, share, concurrency) for share in shares])
+            elapsed = time.perf_counter() - start
+            latencies = [ms for part in parts for ms in part[0]]
+            results[endpoint] = summarize(latencies, sum(part[1] for part in parts), elapsed)
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    ds = Dataset(args.parts, args.locations, args.boxes, args.inventory, args.seed, spare=args.requests)
+    start = time.perf_counter()
+    targets = build(TEMPLATE_PATH, ds)
+    build_seconds = time.perf_counter() - start
+
+    planned = plan(ds, targets, args.requests)
+    covered = routes_under_test(create_app())
+    uncovered = sorted(covered - set(planned) - set(SKIPPED))
+    if uncovered:
+        print(f"warning: no scenario for {', '.join(uncovered)}", file=sys.stderr)
+
+    results = {}
+    # The async engine keeps its connections, so in-process async runs last
+    for mode in sorted(args.modes, key=lambda m: ("server", "inprocess-sync", "inprocess-async").index(m)):
+        fresh_database()
+        if mode == "server":
+            results[mode] = run_server(planned, args.concurrency, args.workers, args.clients)
+        else:
+            results[mode] = asyncio.run(run_inprocess(mode == "inprocess-async", planned, args.concurrency))
+        print(f"{mode}: {sum(r['requests'] for r in results[mode].values())} requests", file=sys.stderr)
+
+    return {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "cpus": os.cpu_count(),
+        "dataset": asdict(ds),
+        "build_seconds": round(build_seconds, 2),
+        "config": {"requests": args.requests, "concurrency": args.concurrency,
+                   "workers": args.workers, "clients": args.clients},
+        "skipped": SKIPPED,
+        "uncovered": uncovered,
+        "results": results,
+    }
+
+
+def compare(old_path, new_path):
+    """One JSON line per endpoint in both files: old -> new and the relative change."""
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    for mode, endpoints in new["results"].items():
+        for endpoint, after in endpoints.items():
+            before = old.get("results", {}).get(mode, {}).get(endpoint)
+            if before is None:
+                continue
+            line = {"mode": mode, "endpoint": endpoint}
+            for key in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+                change = (after[key] - before[key]) / before[key] * 100 if before[key] else None
+                line[key] = [before[key], after[key], None if change is None else f"{change:+.1f}%"]
+            print(json.dumps(line))
+
+
+def parse_args():
+    defaults = Dataset()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.harness",
+        description="Load-test every API route on a synthetic dataset and report latency per endpoint as JSON.",
+    )
+    parser.add_argument("--parts", type=int, default=defaults.parts)
+    parser.add_argument("--locations", type=int, default=defaults.locations)
+    parser.add_argument("--boxes", type=int, default=defaults.boxes)
+    parser.add_argument("--inventory", type=int, default=defaults.inventory)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--requests", type=int, default=200, help="requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8, help="requests in flight per client")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers in server mode")
+    parser.add_argument("--clients", type=int, default=2, help="load generator processes in server mode")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--out", help="also write the JSON report to this file")
+    return parser.parse_args()
+
+
+def main():
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == "compare":
+            if len(sys.argv) != 4:
+                raise SystemExit("usage: python -m benchmarks.harness compare OLD.json NEW.json")
+            compare(sys.argv[2], sys.argv[3])
+            return
+        args = parse_args()
+        # Keep the report alone on stdout; routes that print() go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            report = run(args)
+    finally:
+        app_engine.dispose()
+        shutil.rmtree(_DIR, ignore_errors=True)
+    text_report = json.dumps(report, indent=2)
+    print(text_report)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text_report + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/inventory_totals.py
+# Run with: python -m benchmarks.inventory_totals [rows]
+#
+# Seeds `rows` inventory rows (default 1M) over 1,000 part numbers and 10
+# locations, then compares /inventory/totals, which reads the trigger-kept
+# summary tables, with a SUM over inventory itself and with the old client
+# approach of pulling every /inventory/search row and summing in Python.
+# Also reports what the triggers add to each inventory write.
+import json
+import sys
+import time
+
+from sqlalchemy import text
+
+from app.routes.inventory import inventory_totals, search_inventory
+from benchmarks.common import temp_database, time_call
+
+PARTS = 1000
+LOCATIONS = 10
+PER_BOX = 10
+
+
+def seed(conn, rows):
+    conn.execute(text("INSERT INTO locations (name) VALUES (:n)"), [{"n": f"LOC-{i}"} for i in range(LOCATIONS)])
+    conn.execute(text("INSERT INTO parts (part_number) VALUES (:pn)"), [{"pn": f"PN-{i:04d}"} for i in range(PARTS)])
+    boxes = rows // PER_BOX
+    conn.execute(text("INSERT INTO boxes (code, location_id) VALUES (:c, :l)"),
+                 [{"c": f"BOX-{b}", "l": b % LOCATIONS + 1} for b in range(boxes)])
+    batch = []
+    for b in range(boxes):
+        for k in range(PER_BOX):
+            batch.append({"b": b + 1, "pn": f"PN-{(b * 7 + k * 101) % PARTS:04d}", "q": (b + k) % 50 + 1})
+        if len(batch) >= 50000:
+            conn.execute(text("INSERT INTO inventory (box_id, part_number, quantity) VALUES (:b, :pn, :q)"), batch)
+            batch = []
+    if batch:
+        conn.execute(text("INSERT INTO inventory (box_id, part_number, quantity) VALUES (:b, :pn, :q)"), batch)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with temp_database() as (engine, SessionLocal):
+        with engine.begin() as conn:
+            start = time.perf_counter()
+            seed(conn, rows)
+            print(json.dumps({"seeded_rows": rows, "seconds": round(time.perf_counter() - start, 1)}))
+
+        db = SessionLocal()
+        pn = "PN-0042"
+        calls = [
+            ("totals: one part", lambda: inventory_totals(
+                group_by="part", part_number=pn, location_name=None, box_code=None, limit=100, after=None, db=db)),
+            ("totals: one part by location", lambda: inventory_totals(
+                group_by="location", part_number=pn, location_name=None, box_code=None, limit=100, after=None, db=db)),
+            ("totals: all locations", lambda: inventory_totals(
+                group_by="location", part_number=None, location_name=None, box_code=None, limit=100, after=None,
+                db=db)),
+            ("SUM over inventory: one part", lambda: db.execute(text(
+                "SELECT SUM(quantity), COUNT(*) FROM inventory WHERE part_number = :pn"), {"pn": pn}).all()),
+            ("SUM over inventory: all locations", lambda: db.execute(text(
+                "SELECT b.location_id, SUM(i.quantity) FROM inventory i JOIN boxes b ON b.box_id = i.box_id "
+                "GROUP BY b.location_id")).all()),
+            ("search + sum in Python: one part", lambda: sum(
+                r["quantity"] for r in search_inventory(pn, db=db))),
+        ]
+        for label, call in calls:
+            print(json.dumps({"call": label, "median_ms": round(time_call(call, repeat=5), 3)}))
+        print(json.dumps({"check": inventory_totals(
+            group_by="part", part_number=pn, location_name=None, box_code=None, limit=100, after=None, db=db)["items"]}))
+        db.close()
+
+        # Write cost: the same updates with and without the totals triggers
+        for label, drop in (("update with totals triggers", False), ("update without", True)):
+            with engine.begin() as conn:
+                if drop:
+                    for op in ("insert", "update", "delete"):
+                        conn.execute(text(f"DROP TRIGGER trg_inventory_totals_{op}"))
+                start = time.perf_counter()
+                conn.execute(text("UPDATE inventory SET quantity = quantity + 1 WHERE item_id = :i"),
+                             [{"i": i} for i in range(1, 10001)])
+                elapsed = time.perf_counter() - start
+            print(json.dumps({"mode": label, "rows": 10000, "us_per_row": round(elapsed * 1e6 / 10000, 1)}))
+
+
+if __name__ == "__main__":
+    main()
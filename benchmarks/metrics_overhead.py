@@ -0,0 +1,112 @@
+# benchmarks/metrics_overhead.py
+# Run with: python -m benchmarks.metrics_overhead [requests]
+#
+# Cost of the /metrics instrumentation on the hot path. First the middleware
+# alone around a no-op ASGI app, which isolates its own work; then the same
+# in-process GET /parts/{part_id} and /inventory/search calls through the app
+# with and without MetricsMiddleware (the engine hooks stay registered in
+# both runs, they only do work while a request is being recorded). Rendering
+# /metrics is timed too, since a scrape holds the registry lock while it copies.
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+_fd, DB_PATH = tempfile.mkstemp(suffix=".db", prefix="parts_metrics_")
+os.close(_fd)
+os.environ["PARTS_DB_URL"] = f"sqlite:///{DB_PATH}"
+
+import httpx  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import metrics  # noqa: E402
+from app.main import create_app  # noqa: E402
+from benchmarks.common import time_call  # noqa: E402
+
+PATHS = ["/parts/1", "/inventory/search?part_number=PN-1"]
+
+
+def seed(app):
+    client = TestClient(app)
+    client.post("/locations/", json={"location_name": "LOC-0", "description": "bench"})
+    client.post("/parts/bulk", json=[{"part_number": f"PN-{i}", "description": "bench"} for i in range(50)])
+    client.post("/inventory/bulk", json=[
+        {"box_id": f"BOX-{b}", "part_number": "PN-1", "description": "bench", "location_name": "LOC-0",
+         "quantity": 1} for b in range(20)
+    ])
+
+
+def without_metrics():
+    app = create_app()
+    app.user_middleware = [m for m in app.user_middleware if m.cls is not metrics.MetricsMiddleware]
+    return app
+
+
+async def per_request_us(app, path, calls):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):  # warm-up
+            await client.get(path)
+        start = time.perf_counter()
+        for _ in range(calls):
+            (await client.get(path)).raise_for_status()
+        return (time.perf_counter() - start) * 1e6 / calls
+
+
+async def noop_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def asgi_calls_us(app, calls):
+    scope = {"type": "http", "method": "GET", "path": "/noop", "headers": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) * 1e6 / calls
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    try:
+        registry = metrics.RequestMetrics()
+        bare = min(asyncio.run(asgi_calls_us(noop_app, 100_000)) for _ in range(3))
+        wrapped = min(asyncio.run(asgi_calls_us(metrics.MetricsMiddleware(noop_app, registry), 100_000))
+                      for _ in range(3))
+        print(json.dumps({"middleware_only_us": round(wrapped - bare, 2)}))
+
+        instrumented = create_app()
+        seed(instrumented)
+        plain = without_metrics()
+        for path in PATHS:
+            # Alternate the two apps so drift affects both alike
+            samples = {"with": [], "without": []}
+            for _ in range(3):
+                samples["without"].append(asyncio.run(per_request_us(plain, path, calls)))
+                samples["with"].append(asyncio.run(per_request_us(instrumented, path, calls)))
+            best = {mode: min(values) for mode, values in samples.items()}
+            print(json.dumps({
+                "path": path,
+                "us_without": round(best["without"], 1),
+                "us_with": round(best["with"], 1),
+                "overhead_us": round(best["with"] - best["without"], 1),
+            }))
+        print(json.dumps({"render_ms": round(time_call(metrics.registry.render, repeat=20), 3),
+                          "bytes": len(metrics.registry.render())}))
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(DB_PATH + suffix):
+                os.remove(DB_PATH + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# benchmarks/query_plans.py
+# Run with: python -m benchmarks.query_plans
+#
+# Regression check: drives every route against a temp database, captures the
+# SQL each one runs, and fails (exit 1) if EXPLAIN QUERY PLAN shows a table
+# scan without an index in a route that is not meant to read a whole table,
+# or if a route runs more statements than its declared querylog.budget.
+import os
+import sys
+import tempfile
+
+_fd, DB_PATH = tempfile.mkstemp(suffix=".db", prefix="parts_plans_")
+os.close(_fd)
+os.environ["PARTS_DB_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["PARTS_QUERY_BUDGET"] = "raise"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app import jobs  # noqa: E402
+from app.db import engine  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.querylog import QueryBudgetExceeded  # noqa: E402
+
+# Listings, exports and reports read whole tables by design
+FULL_SCAN_ROUTES = {
+    "GET /parts/all", "GET /locations/all", "GET /boxes/all",
+    "GET /parts/print", "GET /locations/print", "GET /boxes/print",
+    "GET /inventory/export", "GET /reports/{name}", "GET /jobs",
+}
+
+SETUP = [
+    ("POST", "/locations/", {"location_name": "LOC-A", "description": "a"}),
+    ("POST", "/locations/", {"location_name": "LOC-B", "description": "b"}),
+    ("POST", "/parts/", {"part_number": "PN-A", "description": "a"}),
+    ("POST", "/parts/", {"part_number": "PN-B", "description": "b"}),
+    ("POST", "/boxes/", {"code": "BOX-A", "location_name": "LOC-A"}),
+    ("POST", "/boxes/", {"code": "BOX-EMPTY", "location_name": "LOC-A"}),
+    ("POST", "/inventory/", {"box_id": "BOX-A", "part_number": "PN-A", "description": "a",
+                             "location_name": "LOC-A", "quantity": 1}),
+    ("POST", "/jobs", {"kind": "reconcile", "params": {"fix": False}}),
+]
+
+# (method, route template, concrete path, json body or None)
+ROUTES = [
+    ("POST", "/parts/", "/parts/", {"part_number": "PN-A", "description": "a"}),
+    ("POST", "/parts/bulk", "/parts/bulk", [{"part_number": "PN-C", "description": "c"}]),
+    ("GET", "/parts/search", "/parts/search?part_number=PN-A", None),
+    ("GET", "/parts/all", "/parts/all?limit=1", None),
+    ("GET", "/parts/all", "/parts/all?after=1", None),
+    ("GET", "/parts/find", "/parts/find?q=pn-a", None),
+    ("GET", "/parts/find", "/parts/find?q=a&limit=1&offset=1", None),
+    ("GET", "/parts/{part_id}", "/parts/1", None),
+    ("GET", "/parts/by_number/{part_number}", "/parts/by_number/PN-A", None),
+    ("GET", "/parts/resolve_id/{part_number}", "/parts/resolve_id/PN-A", None),
+    ("POST", "/locations/", "/locations/", {"location_name": "LOC-A", "description": "a"}),
+    ("POST", "/locations/bulk", "/locations/bulk", [{"location_name": "LOC-C", "description": "c"}]),
+    ("GET", "/locations/search", "/locations/search?location_name=LOC-A", None),
+    ("GET", "/locations/all", "/locations/all?after=1", None),
+    ("GET", "/locations/{location_id}", "/locations/1", None),
+    ("GET", "/locations/resolve_id/{location_name}", "/locations/resolve_id/LOC-A", None),
+    ("POST", "/boxes/", "/boxes/", {"code": "BOX-B", "location_name": "LOC-B"}),
+    ("GET", "/boxes/search", "/boxes/search?code=BOX-A", None),
+    ("GET", "/boxes/all", "/boxes/all?after=1", None),
+    ("GET", "/boxes/{box_id}", "/boxes/1", None),
+    ("GET", "/boxes/print", "/boxes/print", None),
+    ("GET", "/boxes/print", "/boxes/print?format=ndjson", None),
+    ("POST", "/inventory/", "/inventory/", {"box_id": "BOX-A", "part_number": "PN-B", "description": "b",
+                                            "location_name": "LOC-A", "quantity": 2}),
+    ("POST", "/inventory/bulk", "/inventory/bulk", [{"box_id": "BOX-B", "part_number": "PN-A", "description": "a",
+                                                     "location_name": "LOC-B", "quantity": 3}]),
+    ("PUT", "/inventory/{item_id}", "/inventory/1", {"part_number": "PN-A", "description": "a", "quantity": 5}),
+    ("POST", "/inventory/{item_id}/adjust", "/inventory/1/adjust", {"delta": -1, "expected_quantity": 5}),
+    ("POST", "/inventory/{item_id}/adjust", "/inventory/1/adjust", {"delta": -100}),
+    ("POST", "/inventory/adjust", "/inventory/adjust", [{"item_id": 1, "delta": 1}, {"item_id": 2, "delta": 1}]),
+    ("GET", "/inventory/search", "/inventory/search?part_number=PN-A", None),
+    ("GET", "/inventory/search_by_box/{box_code}", "/inventory/search_by_box/BOX-A", None),
+    ("GET", "/inventory/search_by_box/{box_code}", "/inventory/search_by_box/BOX-EMPTY", None),
+    ("GET", "/inventory/search_by_box/{box_code}", "/inventory/search_by_box/BOX-NONE", None),
+    ("GET", "/inventory/find", "/inventory/find?q=a", None),
+    ("GET", "/inventory/totals", "/inventory/totals?part_number=PN-A", None),
+    ("GET", "/inventory/totals", "/inventory/totals?after=PN-A&limit=1", None),
+    ("GET", "/inventory/totals", "/inventory/totals?location_name=LOC-A", None),
+    ("GET", "/inventory/totals", "/inventory/totals?group_by=location&part_number=PN-A", None),
+    ("GET", "/inventory/totals", "/inventory/totals?group_by=location", None),
+    ("GET", "/inventory/totals", "/inventory/totals?group_by=box&location_name=LOC-A", None),
+    ("GET", "/inventory/totals", "/inventory/totals?group_by=box&part_number=PN-A", None),
+    ("GET", "/inventory/totals", "/inventory/totals?group_by=box&after=1", None),
+    ("GET", "/inventory/totals", "/inventory/totals?box_code=BOX-A", None),
+    ("GET", "/inventory/export", "/inventory/export", None),
+    ("GET", "/reports/{name}", "/reports/parts?format=csv", None),
+    ("GET", "/reports/{name}", "/reports/locations?format=text", None),
+    ("GET", "/reports/{name}", "/reports/inventory?format=ndjson", None),
+    ("GET", "/changes", "/changes?since=3&limit=5", None),
+    ("GET", "/jobs", "/jobs?limit=5", None),
+    ("GET", "/jobs", "/jobs?status=done&before=5", None),
+    ("GET", "/jobs/{job_id}", "/jobs/1", None),
+    ("GET", "/jobs/{job_id}/result", "/jobs/1/result", None),
+    ("DELETE", "/inventory/{inventory_id}", "/inventory/1", None),
+    ("DELETE", "/boxes/{box_id}", "/boxes/1", None),
+    ("DELETE", "/locations/{location_id}", "/locations/1", None),
+    ("DELETE", "/parts/{part_id}", "/parts/1", None),
+]
+
+
+def unindexed_scans(conn, statement, parameters):
+    """Return the EXPLAIN QUERY PLAN lines that scan a table without an index."""
+    if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "INSERT")):
+        return []
+    if isinstance(parameters, list):  # executemany: one parameter set is enough
+        parameters = parameters[0] if parameters else ()
+    plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    # An FTS5 MATCH shows as "SCAN <fts table> VIRTUAL TABLE INDEX 0:M..." but uses the full-text index
+    return [row[-1] for row in plan
+            if row[-1].startswith("SCAN") and "USING" not in row[-1] and ":M" not in row[-1]]
+
+
+def main():
+    client = TestClient(create_app())
+    for method, path, body in SETUP:
+        client.request(method, path, json=body)
+    # Background jobs would otherwise run while the route queries are captured
+    jobs.drain()
+
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    failures = []
+    for method, template, path, body in ROUTES:
+        captured.clear()
+        event.listen(engine, "before_cursor_execute", capture)
+        route = f"{method} {template}"
+        try:
+            response = client.request(method, path, json=body)
+        except QueryBudgetExceeded as e:
+            failures.append(f"{route}: {e}")
+            continue
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        if response.status_code >= 500:
+            failures.append(f"{route}: HTTP {response.status_code}")
+        if route in FULL_SCAN_ROUTES:
+            continue
+        with engine.connect() as conn:
+            for statement, parameters in captured:
+                for scan in unindexed_scans(conn, statement, parameters):
+                    failures.append(f"{route}: {scan} <- {' '.join(statement.split())}")
+
+    engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(DB_PATH + suffix):
+            os.remove(DB_PATH + suffix)
+
+    if failures:
+        print("Queries without index support or over budget:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"OK: all queries from {len(ROUTES)} route calls use an index and stay within budget")
+
+
+if __name__ == "__main__":
+    main()
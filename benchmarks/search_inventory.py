@@ -0,0 +1,62 @@
+# benchmarks/search_inventory.py
+# Run with: python -m benchmarks.search_inventory
+import json
+
+from benchmarks.common import StatementCounter, temp_database, time_call
+from app.models import Box, InventoryItem, Location, Part
+from app.routes.inventory import search_inventory, search_inventory_by_box
+
+SIZES = (1, 10, 100, 1000, 10000)
+
+
+def seed(db, size):
+    """One part stocked in `size` boxes, plus one box holding `size` items."""
+    db.add_all([Location(name=f"LOC-{i}", description="bench") for i in range(10)])
+    db.add(Part(part_number="PN-BENCH", description="bench part"))
+    db.flush()
+    loc_ids = [l.location_id for l in db.query(Location).all()]
+
+    boxes = [Box(code=f"BOX-{i}", location_id=loc_ids[i % len(loc_ids)]) for i in range(size)]
+    big_box = Box(code="BOX-BIG", location_id=loc_ids[0])
+    db.add_all(boxes + [big_box])
+    db.flush()
+
+    db.add_all([
+        InventoryItem(box_id=b.box_id, part_number="PN-BENCH", description="O-RING", quantity=1)
+        for b in boxes
+    ])
+    db.add_all([
+        InventoryItem(box_id=big_box.box_id, part_number=f"PN-{i}", description="O-RING", quantity=1)
+        for i in range(size)
+    ])
+    db.commit()
+
+
+def main():
+    results = []
+    for size in SIZES:
+        with temp_database() as (engine, SessionLocal):
+            db = SessionLocal()
+            seed(db, size)
+            for name, call in (
+                ("search_inventory", lambda: search_inventory("PN-BENCH", db=db)),
+                ("search_inventory_by_box", lambda: search_inventory_by_box("BOX-BIG", db=db)),
+            ):
+                with StatementCounter(engine) as counter:
+                    call()
+                ms = time_call(call)
+                results.append({
+                    "endpoint": name,
+                    "matches": size,
+                    "statements": counter.count,
+                    "median_ms": round(ms, 3),
+                    "us_per_match": round(ms * 1000 / size, 2),
+                })
+            db.close()
+
+    for r in results:
+        print(json.dumps(r))
+
+
+if __name__ == "__main__":
+    main()
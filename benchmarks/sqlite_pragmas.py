@@ -0,0 +1,68 @@
+# benchmarks/sqlite_pragmas.py
+# Run with: python -m benchmarks.sqlite_pragmas
+import json
+import threading
+import time
+
+from sqlalchemy.exc import OperationalError
+
+from benchmarks.common import temp_database
+from app.db import SQLITE_PRAGMAS
+from app.models import InventoryItem, Box, Location
+
+WRITERS = (1, 4, 8)
+COMMITS_PER_WRITER = 200
+
+CONFIGS = {
+    # SQLite's own defaults: rollback journal, synchronous=FULL, 2 MiB cache
+    "default": {},
+    "tuned": SQLITE_PRAGMAS,
+}
+
+
+def writer(SessionLocal, box_id, worker, errors):
+    db = SessionLocal()
+    try:
+        for i in range(COMMITS_PER_WRITER):
+            try:
+                db.add(InventoryItem(box_id=box_id, part_number=f"PN-{worker}-{i}", description="bench", quantity=1))
+                db.commit()
+            except OperationalError:
+                db.rollback()
+                errors.append(worker)
+    finally:
+        db.close()
+
+
+def run(pragmas, writers):
+    with temp_database(pragmas) as (engine, SessionLocal):
+        db = SessionLocal()
+        location = Location(name="LOC", description="bench")
+        db.add(location)
+        db.flush()
+        box = Box(code="BOX", location_id=location.location_id)
+        db.add(box)
+        db.commit()
+        box_id = box.box_id
+        db.close()
+
+        errors = []
+        threads = [threading.Thread(target=writer, args=(SessionLocal, box_id, w, errors)) for w in range(writers)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        commits = writers * COMMITS_PER_WRITER - len(errors)
+        return {"commits_per_s": round(commits / elapsed, 1), "locked_errors": len(errors)}
+
+
+def main():
+    for writers in WRITERS:
+        for name, pragmas in CONFIGS.items():
+            print(json.dumps({"config": name, "writers": writers, **run(pragmas, writers)}))
+
+
+if __name__ == "__main__":
+    main()
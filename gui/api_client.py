@@ -1,13 +1,119 @@
 from urllib import response
+import json
+import threading
+import time
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Conditional-GET entries (ETag + parsed JSON) kept per client
+ETAG_CACHE_SIZE = 256
+
+# Connection pool / resilience defaults
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.3  # sleeps 0.3s, 0.6s, 1.2s between attempts
+# The server sends a keep-alive every 15 s, so a silent /events stream is dead
+EVENTS_READ_TIMEOUT = 45
+# Job statuses wait_for_job stops at
+JOB_FINISHED = ("done", "failed", "cancelled")
+
+
+class _TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to every request."""
+
+    def __init__(self, timeout):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def _adjust_payload(delta, expected_quantity=None, expected_updated_at=None):
+    payload = {"delta": delta}
+    if expected_quantity is not None:
+        payload["expected_quantity"] = expected_quantity
+    if expected_updated_at is not None:
+        payload["expected_updated_at"] = expected_updated_at
+    return payload
+
+
+def _conflict(response):
+    """The error dict for a 409 from /adjust (message plus the item's current state), else None."""
+    if response.status_code != 409:
+        return None
+    detail = response.json().get("detail")
+    if not isinstance(detail, dict):
+        return {"error": str(detail), "conflict": True}
+    return {**detail, "error": detail.get("message", "Conflict"), "conflict": True}
 
 class ApiClient:
-    def __init__(self, base_url="http://127.0.0.1:8000"):
+    def __init__(self, base_url="http://127.0.0.1:8000", pool_size=DEFAULT_POOL_SIZE,
+                 timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, backoff_factor=DEFAULT_BACKOFF):
+        """Client for the parts API.
+
+        All calls share one keep-alive connection pool (`pool_size` sockets per
+        host). Connection failures are retried for every method; 502/503/504
+        and read errors only for idempotent ones, so a POST is never sent twice.
+        Responses are requested gzip-compressed.
+        """
         self.base_url = base_url
+        self.session = _TimeoutSession(timeout)
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}),
+            raise_on_status=False,
+        )
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+        # (path, params) -> (etag, data) for list/search endpoints
+        self._etag_cache = OrderedDict()
+        # path -> last fully assembled listing, reused when no page changed
+        self._listing_cache = {}
+        # The GUI calls the client from a thread pool
+        self._cache_lock = threading.Lock()
+
+    # ---------------- Connection pool ----------------
+    def connection_stats(self):
+        """Return how many requests went over how many TCP connections."""
+        requests_sent = connections = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            if pool is None:
+                continue
+            requests_sent += pool.num_requests
+            connections += pool.num_connections
+        return {
+            "requests": requests_sent,
+            "connections_opened": connections,
+            "connections_reused": max(requests_sent - connections, 0),
+        }
+
+    def close(self):
+        """Close the pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     # ---------------- Parts ----------------
     def add_part(self, part_number, description):
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/parts/",
             json={"part_number": part_number, "description": description}
         )
@@ -16,37 +122,41 @@ class ApiClient:
         except ValueError:
             return {"message": response.text}
 
+    def add_parts_bulk(self, parts, chunk_size=None):
+        """Create many parts ({"part_number", "description"} dicts) in one call."""
+        return self._post_bulk("/parts/bulk", parts, chunk_size)
+
     def search_part(self, part_number: str):
         """Search for a part by its part_number using the backend route."""
         try:
-            response = requests.get(f"{self.base_url}/parts/by_number/{part_number}")
-            response.raise_for_status()
-            return response.json()
+            data, _ = self._conditional_get(f"/parts/by_number/{part_number}", raise_for_status=True)
+            return data
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
 
     def delete_part(self, part_id):
-        response = requests.delete(f"{self.base_url}/parts/{part_id}")
+        response = self.session.delete(f"{self.base_url}/parts/{part_id}")
         try:
             return response.json()
         except ValueError:
             return {"message": response.text}
 
     def list_parts(self):
-        try:
-            response = requests.get(f"{self.base_url}/parts/all")
-            response.raise_for_status()
-            return response.json()
-        except ValueError:
-            return {"message": response.text}
-        except requests.exceptions.RequestException as e:
-            return {"error": str(e)}
-        
+        """Return every part, following /parts/all pages until the last one."""
+        return self._list_all("/parts/all")
+
+    def list_parts_page(self, after=None, limit=None):
+        """Return one page of /parts/all: {"items": [...], "next_cursor": ...}."""
+        return self._get_page("/parts/all", after, limit)
+
+    def find_parts(self, q, offset=0, limit=None):
+        """Full-text search of parts, best match first: {"items", "next_cursor"} (next offset)."""
+        return self._find("/parts/find", q, offset, limit)
 
     # ---------------- Inventory ----------------
     def add_inventory(self, box_id, part_number, description, location_name, quantity):
         """Add inventory using box_id, part_number, description, and location_name."""
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/inventory/",
             json={
                 "box_id": box_id,
@@ -61,27 +171,48 @@ class ApiClient:
         except ValueError:
             return {"message": response.text}
 
+    def add_inventory_bulk(self, items, chunk_size=None, on_existing="update"):
+        """Import a list of inventory dicts (same fields as add_inventory) in one call."""
+        return self._post_bulk("/inventory/bulk", items, chunk_size, on_existing=on_existing)
+
     def search_inventory(self, part_number):
         """Search inventory by part_number."""
-        response = requests.get(f"{self.base_url}/inventory/search", params={"part_number": part_number})
         try:
-            return response.json()
-        except ValueError:
-            return {"message": response.text}
+            data, _ = self._conditional_get("/inventory/search", {"part_number": part_number})
+            return data
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
+
+    def find_inventory(self, q, offset=0, limit=None):
+        """Full-text search of inventory part numbers and descriptions, best match first."""
+        return self._find("/inventory/find", q, offset, limit)
+
+    def inventory_totals(self, group_by="part", part_number=None, location_name=None, box_code=None,
+                         after=None, limit=None):
+        """One page of /inventory/totals: quantity and item count per part, location or box."""
+        params = {"group_by": group_by, "part_number": part_number, "location_name": location_name,
+                  "box_code": box_code, "after": after, "limit": limit}
+        try:
+            data, _ = self._conditional_get(
+                "/inventory/totals", {k: v for k, v in params.items() if v is not None}, raise_for_status=True)
+            return data
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
 
     def search_inventory_by_box(self, box_code):
         """Search inventory by box_code (string)."""
         try:
-            response = requests.get(f"{self.base_url}/inventory/search_by_box/{box_code}")
-            response.raise_for_status()
-            return response.json()
-        except ValueError:
-            return {"message": response.text}
+            data, _ = self._conditional_get(f"/inventory/search_by_box/{box_code}", raise_for_status=True)
+            return data
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
 
+    def export_inventory(self, dest_path, fmt="ndjson"):
+        """Stream /inventory/export (ndjson or csv) straight to dest_path."""
+        return self._save("/inventory/export", dest_path, params={"format": fmt})
+
     def delete_inventory(self, inventory_id):
-        response = requests.delete(f"{self.base_url}/inventory/{inventory_id}")
+        response = self.session.delete(f"{self.base_url}/inventory/{inventory_id}")
         try:
             return response.json()
         except ValueError:
@@ -97,7 +228,38 @@ class ApiClient:
                 "description": description,
                 "quantity": quantity
             }
-            response = requests.put(f"{self.base_url}/inventory/{inventory_id}", json=payload)
+            response = self.session.put(f"{self.base_url}/inventory/{inventory_id}", json=payload)
+            response.raise_for_status()
+            return response.json()
+        except ValueError:
+            return {"message": response.text}
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
+
+    def adjust_inventory(self, inventory_id, delta, expected_quantity=None, expected_updated_at=None):
+        """
+        Adjust Inventory: add delta (negative to pick) to an item's quantity in one
+        server-side update, so concurrent pickers never overwrite each other.
+        With expected_quantity / expected_updated_at it only applies while the item
+        still matches; otherwise the result has "conflict": True and the item's
+        current quantity and updated_at.
+        """
+        return self._adjust(f"/inventory/{inventory_id}/adjust",
+                            _adjust_payload(delta, expected_quantity, expected_updated_at))
+
+    def adjust_inventory_batch(self, adjustments):
+        """
+        Apply {"item_id", "delta", ...} adjustments in one transaction: all of them,
+        or none and the conflict/error of the first that failed.
+        """
+        return self._adjust("/inventory/adjust", list(adjustments))
+
+    def _adjust(self, path, payload):
+        try:
+            response = self.session.post(f"{self.base_url}{path}", json=payload)
+            conflict = _conflict(response)
+            if conflict:
+                return conflict
             response.raise_for_status()
             return response.json()
         except ValueError:
@@ -107,7 +269,7 @@ class ApiClient:
 
     # ---------------- Locations ----------------
     def add_location(self, location_name, description):
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/locations/",
             json={"location_name": location_name, "description": description}
         )
@@ -116,18 +278,75 @@ class ApiClient:
         except ValueError:
             return {"message": response.text}
 
+    def add_locations_bulk(self, locations, chunk_size=None):
+        """Create many locations ({"location_name", "description"} dicts) in one call."""
+        return self._post_bulk("/locations/bulk", locations, chunk_size)
+
     def search_location(self, location_name):
         """Search location by name using /locations/search."""
-        response = requests.get(f"{self.base_url}/locations/search", params={"location_name": location_name})
+        data, _ = self._conditional_get("/locations/search", {"location_name": location_name})
+        return data
+
+    def list_locations(self):
+        """Return all locations, following /locations/all pages until the last one."""
+        return self._list_all("/locations/all")
+
+    def list_locations_page(self, after=None, limit=None):
+        """Return one page of /locations/all."""
+        return self._get_page("/locations/all", after, limit)
+
+    def delete_location(self, location_id):
+        response = self.session.delete(f"{self.base_url}/locations/{location_id}")
         try:
             return response.json()
         except ValueError:
             return {"message": response.text}
+    
+    # ---------------- Reports ----------------
+    def save_report(self, report, dest_path, fmt="csv"):
+        """Stream /reports/{report} (parts, locations, boxes, inventory) as csv, ndjson or text to dest_path."""
+        return self._save(f"/reports/{report}", dest_path, params={"format": fmt})
 
-    def list_locations(self):
-        """Return all locations using /locations/all."""
+    def start_report(self, report, fmt="csv"):
+        """Have the server write a report to a file in the background; returns its job (see Jobs)."""
+        return self._post_job(f"/reports/{report}", params={"format": fmt})
+
+    def _save(self, path, dest_path, params=None):
         try:
-            response = requests.get(f"{self.base_url}/locations/all")
+            with self.session.get(f"{self.base_url}{path}", params=params, stream=True) as response:
+                response.raise_for_status()
+                written = 0
+                with open(dest_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                        written += len(chunk)
+            return {"message": f"Exported {written} bytes to {dest_path}"}
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
+
+    # ---------------- Jobs ----------------
+    def submit_job(self, kind, **params):
+        """Queue an export, reindex or reconcile job; returns the job with its status_url."""
+        return self._post_job("/jobs", json={"kind": kind, "params": params})
+
+    def import_job(self, target, records, chunk_size=None, on_existing=None):
+        """Queue an import of records into parts, locations or inventory instead of waiting on /bulk."""
+        params = {}
+        if chunk_size is not None:
+            params["chunk_size"] = chunk_size
+        if on_existing is not None:
+            params["on_existing"] = on_existing
+        return self._post_job(f"/jobs/import/{target}", json=records, params=params)
+
+    def job_status(self, job_id):
+        return self.get(f"/jobs/{job_id}")
+
+    def list_jobs(self, status=None, kind=None, before=None, limit=None):
+        """One page of jobs, newest first: {"items", "next_cursor", "limit"}; pass next_cursor as `before`."""
+        params = {k: v for k, v in {"status": status, "kind": kind, "before": before, "limit": limit}.items()
+                  if v is not None}
+        try:
+            response = self.session.get(f"{self.base_url}/jobs", params=params)
             response.raise_for_status()
             return response.json()
         except ValueError:
@@ -135,16 +354,195 @@ class ApiClient:
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
 
-    def delete_location(self, location_id):
-        response = requests.delete(f"{self.base_url}/locations/{location_id}")
+    def job_result(self, job_id, dest_path=None):
+        """Result of a finished job; an export's file is saved to dest_path."""
+        if dest_path is not None:
+            return self._save(f"/jobs/{job_id}/result", dest_path)
+        return self.get(f"/jobs/{job_id}/result")
+
+    def cancel_job(self, job_id):
+        return self._post_job(f"/jobs/{job_id}/cancel")
+
+    def wait_for_job(self, job_id, interval=1.0, timeout=None):
+        """Poll job_status until the job is done, failed or cancelled (or timeout seconds pass)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.job_status(job_id)
+            if "status" not in job or job["status"] in JOB_FINISHED:
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(interval)
+
+    def _post_job(self, path, json=None, params=None):
         try:
+            response = self.session.post(f"{self.base_url}{path}", json=json, params=params)
+            response.raise_for_status()
             return response.json()
         except ValueError:
             return {"message": response.text}
-    
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
+
+    # ---------------- Autocomplete ----------------
+    def autocomplete(self, kind, prefix, limit=None):
+        """Names of `kind` (parts, boxes, locations) starting with prefix; [] on failure."""
+        params = {"prefix": prefix}
+        if limit is not None:
+            params["limit"] = limit
+        try:
+            response = self.session.get(f"{self.base_url}/autocomplete/{kind}", params=params)
+            response.raise_for_status()
+            return response.json()["items"]
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            return []
+
+    # ---------------- Change feed ----------------
+    def get_changes(self, since=0, limit=None):
+        """Return /changes after sequence number `since`: {"changes", "last_seq", "has_more", "min_since"}."""
+        params = {"since": since}
+        if limit is not None:
+            params["limit"] = limit
+        try:
+            response = self.session.get(f"{self.base_url}/changes", params=params)
+            response.raise_for_status()
+            return response.json()
+        except ValueError:
+            return {"message": response.text}
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
+
+    def stream_events(self, last_event_id=None):
+        """
+        Yield (event, data, event_id) from the /events Server-Sent Events stream
+        until the connection drops. Pass the last event_id seen to resume.
+        Raises requests exceptions on connection failure.
+        """
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id is not None:
+            headers["Last-Event-ID"] = str(last_event_id)
+        connect = self.session.timeout[0] if isinstance(self.session.timeout, tuple) else self.session.timeout
+        timeout = (connect, EVENTS_READ_TIMEOUT)
+        with self.session.get(f"{self.base_url}/events", headers=headers, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            event, data, event_id = "message", [], None
+            for line in response.iter_lines(decode_unicode=True):
+                if not line:  # blank line ends an event
+                    if data:
+                        yield event, json.loads("\n".join(data)), event_id
+                    event, data = "message", []
+                elif line.startswith(":"):
+                    continue  # comment / keep-alive
+                else:
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "event":
+                        event = value
+                    elif field == "data":
+                        data.append(value)
+                    elif field == "id":
+                        event_id = value
+
+    # ---------------- Bulk ----------------
+    def _post_bulk(self, path, records, chunk_size=None, **params):
+        if chunk_size is not None:
+            params["chunk_size"] = chunk_size
+        try:
+            response = self.session.post(f"{self.base_url}{path}", json=records, params=params)
+            response.raise_for_status()
+            return response.json()
+        except ValueError:
+            return {"message": response.text}
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
+
+    # ---------------- Conditional GET ----------------
+    def _conditional_get(self, path, params=None, raise_for_status=False):
+        """GET that revalidates with If-None-Match.
+
+        Returns (data, not_modified). On a 304 the JSON parsed the last time is
+        returned as the very same object, so unchanged data is neither
+        transferred nor re-parsed, and callers can skip re-rendering with an
+        identity check.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        with self._cache_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self.session.get(f"{self.base_url}{path}", params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            with self._cache_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return cached[1], True
+        if raise_for_status:
+            response.raise_for_status()
+        try:
+            data = response.json()
+        except ValueError:
+            return {"message": response.text}, False
+        etag = response.headers.get("ETag")
+        if etag and response.status_code == 200:
+            with self._cache_lock:
+                self._etag_cache[key] = (etag, data)
+                self._etag_cache.move_to_end(key)
+                while len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return data, False
+
+    # ---------------- Pagination ----------------
+    def _find(self, path, q, offset=0, limit=None):
+        params = {"q": q, "offset": offset}
+        if limit is not None:
+            params["limit"] = limit
+        try:
+            data, _ = self._conditional_get(path, params, raise_for_status=True)
+            return data
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}
+
+    def _fetch_page(self, path, after=None, limit=None):
+        """Return (page, not_modified) for one page of a keyset listing."""
+        params = {}
+        if after is not None:
+            params["after"] = after
+        if limit is not None:
+            params["limit"] = limit
+        try:
+            return self._conditional_get(path, params, raise_for_status=True)
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e)}, False
+
+    def _get_page(self, path, after=None, limit=None):
+        return self._fetch_page(path, after, limit)[0]
+
+    def _list_all(self, path, page_size=1000):
+        """Collect every item of a keyset-paginated listing into one list.
+
+        If every page came back 304 the previously returned list object is
+        returned again.
+        """
+        items = []
+        after = None
+        unchanged = True
+        while True:
+            page, not_modified = self._fetch_page(path, after, page_size)
+            if "items" not in page:
+                return page
+            unchanged = unchanged and not_modified
+            items.extend(page["items"])
+            after = page.get("next_cursor")
+            if after is None:
+                break
+        with self._cache_lock:
+            if unchanged and path in self._listing_cache:
+                return self._listing_cache[path]
+            self._listing_cache[path] = items
+        return items
+
     def get(self, path: str):
         try:
-            response = requests.get(f"{self.base_url}{path}")
+            response = self.session.get(f"{self.base_url}{path}")
             response.raise_for_status()
             return response.json()
         except ValueError:
@@ -156,7 +554,7 @@ class ApiClient:
     def add_box(self, code, location_name):
         """Add a box using its code and location_name (operator-friendly)."""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/boxes/",
                 json={"code": code, "location_name": location_name}
             )
@@ -170,14 +568,19 @@ class ApiClient:
 
     def search_box(self, code):
         """Search for a box by its code using /boxes/search."""
-        response = requests.get(f"{self.base_url}/boxes/search", params={"code": code})
-        try:
-            return response.json()
-        except ValueError:
-            return {"message": response.text}
+        data, _ = self._conditional_get("/boxes/search", {"code": code})
+        return data
+
+    def list_boxes(self):
+        """Return all boxes, following /boxes/all pages until the last one."""
+        return self._list_all("/boxes/all")
+
+    def list_boxes_page(self, after=None, limit=None):
+        """Return one page of /boxes/all."""
+        return self._get_page("/boxes/all", after, limit)
 
     def delete_box(self, box_id):
-        response = requests.delete(f"{self.base_url}/boxes/{box_id}")
+        response = self.session.delete(f"{self.base_url}/boxes/{box_id}")
         try:
             return response.json()
         except ValueError:
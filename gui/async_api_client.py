@@ -0,0 +1,498 @@
+# gui/async_api_client.py
+"""asyncio twin of gui.api_client.ApiClient, built on httpx.
+
+Every ApiClient method except connection_stats (httpx keeps no request and
+connection counters per pool) exists here as a coroutine with the same
+arguments and return shapes; stream_events is an async generator. The *_many
+helpers fan a list of lookups out over the shared connection pool with
+bounded concurrency, e.g. for a stock check script:
+
+    async def main():
+        async with AsyncApiClient() as client:
+            stock = await client.search_inventory_many(part_numbers)
+
+    asyncio.run(main())
+"""
+import asyncio
+import json
+from collections import OrderedDict
+
+import httpx
+
+from gui.api_client import (
+    DEFAULT_RETRIES, DEFAULT_TIMEOUT, ETAG_CACHE_SIZE, EVENTS_READ_TIMEOUT, JOB_FINISHED, _adjust_payload, _conflict,
+)
+
+# Requests in flight at once for the *_many helpers (and pool size)
+DEFAULT_CONCURRENCY = 20
+
+
+def _json(response):
+    try:
+        return response.json()
+    except ValueError:
+        return {"message": response.text}
+
+
+class AsyncApiClient:
+    def __init__(self, base_url="http://127.0.0.1:8000", concurrency=DEFAULT_CONCURRENCY,
+                 timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES):
+        """Async client for the parts API.
+
+        One httpx.AsyncClient keeps up to `concurrency` keep-alive connections;
+        failed connection attempts are retried `retries` times.
+        """
+        self.base_url = base_url
+        self.concurrency = concurrency
+        connect, read = timeout
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(read, connect=connect),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            transport=httpx.AsyncHTTPTransport(retries=retries),
+        )
+        # (path, params) -> (etag, data) for list/search endpoints
+        self._etag_cache = OrderedDict()
+        # path -> last fully assembled listing, reused when no page changed
+        self._listing_cache = {}
+
+    async def aclose(self):
+        """Close the pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    # ---------------- Parts ----------------
+    async def add_part(self, part_number, description):
+        response = await self.client.post("/parts/", json={"part_number": part_number, "description": description})
+        return _json(response)
+
+    async def add_parts_bulk(self, parts, chunk_size=None):
+        """Create many parts ({"part_number", "description"} dicts) in one call."""
+        return await self._post_bulk("/parts/bulk", parts, chunk_size)
+
+    async def search_part(self, part_number: str):
+        """Search for a part by its part_number using the backend route."""
+        try:
+            data, _ = await self._conditional_get(f"/parts/by_number/{part_number}", raise_for_status=True)
+            return data
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def delete_part(self, part_id):
+        return _json(await self.client.delete(f"/parts/{part_id}"))
+
+    async def list_parts(self):
+        """Return every part, following /parts/all pages until the last one."""
+        return await self._list_all("/parts/all")
+
+    async def list_parts_page(self, after=None, limit=None):
+        """Return one page of /parts/all: {"items": [...], "next_cursor": ...}."""
+        return await self._get_page("/parts/all", after, limit)
+
+    async def find_parts(self, q, offset=0, limit=None):
+        """Full-text search of parts, best match first: {"items", "next_cursor"} (next offset)."""
+        return await self._find("/parts/find", q, offset, limit)
+
+    # ---------------- Inventory ----------------
+    async def add_inventory(self, box_id, part_number, description, location_name, quantity):
+        """Add inventory using box_id, part_number, description, and location_name."""
+        response = await self.client.post(
+            "/inventory/",
+            json={
+                "box_id": box_id,
+                "part_number": part_number,
+                "description": description,
+                "location_name": location_name,
+                "quantity": quantity
+            }
+        )
+        return _json(response)
+
+    async def add_inventory_bulk(self, items, chunk_size=None, on_existing="update"):
+        """Import a list of inventory dicts (same fields as add_inventory) in one call."""
+        return await self._post_bulk("/inventory/bulk", items, chunk_size, on_existing=on_existing)
+
+    async def search_inventory(self, part_number):
+        """Search inventory by part_number."""
+        try:
+            data, _ = await self._conditional_get("/inventory/search", {"part_number": part_number})
+            return data
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def find_inventory(self, q, offset=0, limit=None):
+        """Full-text search of inventory part numbers and descriptions, best match first."""
+        return await self._find("/inventory/find", q, offset, limit)
+
+    async def inventory_totals(self, group_by="part", part_number=None, location_name=None, box_code=None,
+                               after=None, limit=None):
+        """One page of /inventory/totals: quantity and item count per part, location or box."""
+        params = {"group_by": group_by, "part_number": part_number, "location_name": location_name,
+                  "box_code": box_code, "after": after, "limit": limit}
+        try:
+            data, _ = await self._conditional_get(
+                "/inventory/totals", {k: v for k, v in params.items() if v is not None}, raise_for_status=True)
+            return data
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def search_inventory_by_box(self, box_code):
+        """Search inventory by box_code (string)."""
+        try:
+            data, _ = await self._conditional_get(f"/inventory/search_by_box/{box_code}", raise_for_status=True)
+            return data
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def export_inventory(self, dest_path, fmt="ndjson"):
+        """Stream /inventory/export (ndjson or csv) straight to dest_path."""
+        return await self._save("/inventory/export", dest_path, params={"format": fmt})
+
+    async def delete_inventory(self, inventory_id):
+        return _json(await self.client.delete(f"/inventory/{inventory_id}"))
+
+    async def update_inventory(self, inventory_id, part_number, description, quantity):
+        """Update Inventory: commit adjustments to an existing inventory record."""
+        payload = {
+            "part_number": part_number,
+            "description": description,
+            "quantity": quantity
+        }
+        try:
+            response = await self.client.put(f"/inventory/{inventory_id}", json=payload)
+            response.raise_for_status()
+            return _json(response)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def adjust_inventory(self, inventory_id, delta, expected_quantity=None, expected_updated_at=None):
+        """Add delta to an item's quantity atomically; see ApiClient.adjust_inventory."""
+        return await self._adjust(f"/inventory/{inventory_id}/adjust",
+                                  _adjust_payload(delta, expected_quantity, expected_updated_at))
+
+    async def adjust_inventory_batch(self, adjustments):
+        """Apply adjustments all-or-nothing; see ApiClient.adjust_inventory_batch."""
+        return await self._adjust("/inventory/adjust", list(adjustments))
+
+    async def _adjust(self, path, payload):
+        try:
+            response = await self.client.post(path, json=payload)
+            conflict = _conflict(response)
+            if conflict:
+                return conflict
+            response.raise_for_status()
+            return _json(response)
+        except ValueError:
+            return {"message": response.text}
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    # ---------------- Locations ----------------
+    async def add_location(self, location_name, description):
+        response = await self.client.post(
+            "/locations/", json={"location_name": location_name, "description": description}
+        )
+        return _json(response)
+
+    async def add_locations_bulk(self, locations, chunk_size=None):
+        """Create many locations ({"location_name", "description"} dicts) in one call."""
+        return await self._post_bulk("/locations/bulk", locations, chunk_size)
+
+    async def search_location(self, location_name):
+        """Search location by name using /locations/search."""
+        data, _ = await self._conditional_get("/locations/search", {"location_name": location_name})
+        return data
+
+    async def list_locations(self):
+        """Return all locations, following /locations/all pages until the last one."""
+        return await self._list_all("/locations/all")
+
+    async def list_locations_page(self, after=None, limit=None):
+        """Return one page of /locations/all."""
+        return await self._get_page("/locations/all", after, limit)
+
+    async def delete_location(self, location_id):
+        return _json(await self.client.delete(f"/locations/{location_id}"))
+
+    # ---------------- Boxes ----------------
+    async def add_box(self, code, location_name):
+        """Add a box using its code and location_name (operator-friendly)."""
+        try:
+            response = await self.client.post("/boxes/", json={"code": code, "location_name": location_name})
+            response.raise_for_status()
+            return _json(response)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def search_box(self, code):
+        """Search for a box by its code using /boxes/search."""
+        data, _ = await self._conditional_get("/boxes/search", {"code": code})
+        return data
+
+    async def list_boxes(self):
+        """Return all boxes, following /boxes/all pages until the last one."""
+        return await self._list_all("/boxes/all")
+
+    async def list_boxes_page(self, after=None, limit=None):
+        """Return one page of /boxes/all."""
+        return await self._get_page("/boxes/all", after, limit)
+
+    async def delete_box(self, box_id):
+        return _json(await self.client.delete(f"/boxes/{box_id}"))
+
+    async def get(self, path: str):
+        try:
+            response = await self.client.get(path)
+            response.raise_for_status()
+            return _json(response)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    # ---------------- Reports ----------------
+    async def save_report(self, report, dest_path, fmt="csv"):
+        """Stream /reports/{report} (parts, locations, boxes, inventory) as csv, ndjson or text to dest_path."""
+        return await self._save(f"/reports/{report}", dest_path, params={"format": fmt})
+
+    async def start_report(self, report, fmt="csv"):
+        """Have the server write a report to a file in the background; returns its job (see Jobs)."""
+        return await self._post_job(f"/reports/{report}", params={"format": fmt})
+
+    async def _save(self, path, dest_path, params=None):
+        try:
+            async with self.client.stream("GET", path, params=params) as response:
+                response.raise_for_status()
+                written = 0
+                with open(dest_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(64 * 1024):
+                        f.write(chunk)
+                        written += len(chunk)
+            return {"message": f"Exported {written} bytes to {dest_path}"}
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    # ---------------- Jobs ----------------
+    async def submit_job(self, kind, **params):
+        """Queue an export, reindex or reconcile job; returns the job with its status_url."""
+        return await self._post_job("/jobs", json={"kind": kind, "params": params})
+
+    async def import_job(self, target, records, chunk_size=None, on_existing=None):
+        """Queue an import of records into parts, locations or inventory instead of waiting on /bulk."""
+        params = {}
+        if chunk_size is not None:
+            params["chunk_size"] = chunk_size
+        if on_existing is not None:
+            params["on_existing"] = on_existing
+        return await self._post_job(f"/jobs/import/{target}", json=records, params=params)
+
+    async def job_status(self, job_id):
+        return await self.get(f"/jobs/{job_id}")
+
+    async def list_jobs(self, status=None, kind=None, before=None, limit=None):
+        """One page of jobs, newest first: {"items", "next_cursor", "limit"}; pass next_cursor as `before`."""
+        params = {k: v for k, v in {"status": status, "kind": kind, "before": before, "limit": limit}.items()
+                  if v is not None}
+        try:
+            response = await self.client.get("/jobs", params=params)
+            response.raise_for_status()
+            return _json(response)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def job_result(self, job_id, dest_path=None):
+        """Result of a finished job; an export's file is saved to dest_path."""
+        if dest_path is not None:
+            return await self._save(f"/jobs/{job_id}/result", dest_path)
+        return await self.get(f"/jobs/{job_id}/result")
+
+    async def cancel_job(self, job_id):
+        return await self._post_job(f"/jobs/{job_id}/cancel")
+
+    async def wait_for_job(self, job_id, interval=1.0, timeout=None):
+        """Poll job_status until the job is done, failed or cancelled (or timeout seconds pass)."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            job = await self.job_status(job_id)
+            if "status" not in job or job["status"] in JOB_FINISHED:
+                return job
+            if deadline is not None and loop.time() >= deadline:
+                return job
+            await asyncio.sleep(interval)
+
+    async def _post_job(self, path, json=None, params=None):
+        try:
+            response = await self.client.post(path, json=json, params=params)
+            response.raise_for_status()
+            return _json(response)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    # ---------------- Autocomplete ----------------
+    async def autocomplete(self, kind, prefix, limit=None):
+        """Names of `kind` (parts, boxes, locations) starting with prefix; [] on failure."""
+        params = {"prefix": prefix}
+        if limit is not None:
+            params["limit"] = limit
+        try:
+            response = await self.client.get(f"/autocomplete/{kind}", params=params)
+            response.raise_for_status()
+            return response.json()["items"]
+        except (httpx.HTTPError, ValueError, KeyError):
+            return []
+
+    # ---------------- Change feed ----------------
+    async def get_changes(self, since=0, limit=None):
+        """Return /changes after sequence number `since`: {"changes", "last_seq", "has_more", "min_since"}."""
+        params = {"since": since}
+        if limit is not None:
+            params["limit"] = limit
+        try:
+            response = await self.client.get("/changes", params=params)
+            response.raise_for_status()
+            return _json(response)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def stream_events(self, last_event_id=None):
+        """
+        Yield (event, data, event_id) from the /events Server-Sent Events stream
+        until the connection drops. Pass the last event_id seen to resume.
+        Raises httpx exceptions on connection failure.
+        """
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id is not None:
+            headers["Last-Event-ID"] = str(last_event_id)
+        timeout = httpx.Timeout(EVENTS_READ_TIMEOUT, connect=self.client.timeout.connect)
+        async with self.client.stream("GET", "/events", headers=headers, timeout=timeout) as response:
+            response.raise_for_status()
+            event, data, event_id = "message", [], None
+            async for line in response.aiter_lines():
+                if not line:  # blank line ends an event
+                    if data:
+                        yield event, json.loads("\n".join(data)), event_id
+                    event, data = "message", []
+                elif line.startswith(":"):
+                    continue  # comment / keep-alive
+                else:
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "event":
+                        event = value
+                    elif field == "data":
+                        data.append(value)
+                    elif field == "id":
+                        event_id = value
+
+    # ---------------- Fan-out ----------------
+    async def _many(self, method, keys, concurrency=None):
+        """Run `method(key)` for every key, at most `concurrency` at a time.
+
+        Returns {key: result} in input order; duplicate keys are fetched once.
+        A key whose request fails gets {"error": ...} rather than losing the
+        results of the others.
+        """
+        keys = list(dict.fromkeys(keys))
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def one(key):
+            async with semaphore:
+                try:
+                    return await method(key)
+                except httpx.HTTPError as e:
+                    return {"error": str(e)}
+
+        results = await asyncio.gather(*(one(key) for key in keys))
+        return dict(zip(keys, results))
+
+    async def search_inventory_many(self, part_numbers, concurrency=None):
+        """search_inventory for each part number: {part_number: result}."""
+        return await self._many(self.search_inventory, part_numbers, concurrency)
+
+    async def search_inventory_by_box_many(self, box_codes, concurrency=None):
+        """search_inventory_by_box for each box code: {box_code: result}."""
+        return await self._many(self.search_inventory_by_box, box_codes, concurrency)
+
+    async def search_part_many(self, part_numbers, concurrency=None):
+        """search_part for each part number: {part_number: result}."""
+        return await self._many(self.search_part, part_numbers, concurrency)
+
+    # ---------------- Bulk ----------------
+    async def _post_bulk(self, path, records, chunk_size=None, **params):
+        if chunk_size is not None:
+            params["chunk_size"] = chunk_size
+        try:
+            response = await self.client.post(path, json=records, params=params)
+            response.raise_for_status()
+            return _json(response)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    # ---------------- Conditional GET ----------------
+    async def _conditional_get(self, path, params=None, raise_for_status=False):
+        """GET that revalidates with If-None-Match; see ApiClient._conditional_get."""
+        key = (path, tuple(sorted((params or {}).items())))
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = await self.client.get(path, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return cached[1], True
+        if raise_for_status:
+            response.raise_for_status()
+        data = _json(response)
+        etag = response.headers.get("ETag")
+        if etag and response.status_code == 200:
+            self._etag_cache[key] = (etag, data)
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return data, False
+
+    # ---------------- Pagination ----------------
+    async def _find(self, path, q, offset=0, limit=None):
+        params = {"q": q, "offset": offset}
+        if limit is not None:
+            params["limit"] = limit
+        try:
+            data, _ = await self._conditional_get(path, params, raise_for_status=True)
+            return data
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def _fetch_page(self, path, after=None, limit=None):
+        params = {}
+        if after is not None:
+            params["after"] = after
+        if limit is not None:
+            params["limit"] = limit
+        try:
+            return await self._conditional_get(path, params, raise_for_status=True)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}, False
+
+    async def _get_page(self, path, after=None, limit=None):
+        return (await self._fetch_page(path, after, limit))[0]
+
+    async def _list_all(self, path, page_size=1000):
+        """Collect every item of a keyset-paginated listing into one list."""
+        items = []
+        after = None
+        unchanged = True
+        while True:
+            page, not_modified = await self._fetch_page(path, after, page_size)
+            if "items" not in page:
+                return page
+            unchanged = unchanged and not_modified
+            items.extend(page["items"])
+            after = page.get("next_cursor")
+            if after is None:
+                break
+        if unchanged and path in self._listing_cache:
+            return self._listing_cache[path]
+        self._listing_cache[path] = items
+        return items
@@ -0,0 +1,84 @@
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, QStringListModel, Qt, QTimer
+from PySide6.QtWidgets import QCompleter, QLineEdit
+
+from gui.common.worker import RequestRunner
+
+# Typing pause before asking the server, in milliseconds
+DEBOUNCE_MS = 200
+SUGGESTIONS = 10
+
+
+class RemoteCompleter(QObject):
+    """
+    Type-ahead for a QLineEdit backed by /autocomplete/{kind}.
+
+    Asks the server once typing pauses for DEBOUNCE_MS, on the runner's pool,
+    and only the newest answer is shown. When an earlier answer for a shorter
+    prefix was already complete (fewer than SUGGESTIONS names), longer
+    prefixes are filtered from it locally without another request.
+    """
+
+    def __init__(self, line_edit: QLineEdit, client, runner: RequestRunner, kind: str):
+        super().__init__(line_edit)
+        self.line_edit = line_edit
+        self.client = client
+        self.runner = runner
+        self.kind = kind
+        self._results: Dict[str, List[str]] = {}  # prefix (folded) -> names, while editing
+
+        self.model = QStringListModel(self)
+        self.completer = QCompleter(self.model, self)
+        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.completer.setCompletionMode(QCompleter.PopupCompletion)
+        line_edit.setCompleter(self.completer)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(DEBOUNCE_MS)
+        self._timer.timeout.connect(self._lookup)
+        # textEdited, not textChanged: picking a suggestion must not trigger a lookup
+        line_edit.textEdited.connect(lambda _: self._timer.start())
+        # Names may have been added or deleted by the next time the field is used
+        line_edit.editingFinished.connect(self.forget)
+
+    def _lookup(self):
+        prefix = self.line_edit.text().strip()
+        if not prefix:
+            return
+        cached = self._known(prefix)
+        if cached is not None:
+            self._show(prefix, cached)
+            return
+        kind = self.kind
+        self.runner.submit(
+            ("autocomplete", kind, prefix),
+            lambda: self.client.autocomplete(kind, prefix, SUGGESTIONS),
+            lambda names: self._on_names(prefix, names),
+            lambda error: None,  # suggestions are best-effort
+            channel=(self, "autocomplete"),
+        )
+
+    def _known(self, prefix: str) -> Optional[List[str]]:
+        folded = prefix.casefold()
+        for i in range(len(folded), 0, -1):
+            names = self._results.get(folded[:i])
+            if names is not None and (i == len(folded) or len(names) < SUGGESTIONS):
+                return [n for n in names if n.casefold().startswith(folded)]
+        return None
+
+    def _on_names(self, prefix: str, names: List[str]):
+        self._results[prefix.casefold()] = names
+        self._show(prefix, names)
+
+    def _show(self, prefix: str, names: List[str]):
+        if self.line_edit.text().strip() != prefix:
+            return  # typing moved on; the next lookup is already scheduled
+        self.model.setStringList(names)
+        if names and self.line_edit.hasFocus():
+            self.completer.complete()
+
+    def forget(self):
+        """Drop remembered answers so the next lookup asks the server."""
+        self._results.clear()
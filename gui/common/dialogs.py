@@ -13,3 +13,10 @@ def confirm(title: str, message: str) -> bool:
     box.setDefaultButton(QMessageBox.StandardButton.No)
     result = box.exec()
     return result == QMessageBox.StandardButton.Yes
+
+
+def error_popup(parent, title: str):
+    """
+    Return a callback that shows a background request's error text in a warning box.
+    """
+    return lambda error: QMessageBox.warning(parent, title, error)
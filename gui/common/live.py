@@ -0,0 +1,60 @@
+import threading
+
+import requests
+from PySide6.QtCore import QObject, Signal
+
+
+class LiveUpdates(QObject):
+    """
+    Follow the server's /events stream on a background thread.
+
+    - change(dict): one change entry ({"seq", "entity", "id", "op", "data"})
+    - resync(): events were missed (slow client or server restart); refetch
+    - connected(bool): stream opened / lost
+
+    Reconnects with backoff, resuming from the last event ID it saw.
+    """
+    change = Signal(object)
+    resync = Signal()
+    connected = Signal(bool)
+
+    MAX_BACKOFF = 30.0
+
+    def __init__(self, client, parent=None):
+        super().__init__(parent)
+        self.client = client
+        self.last_event_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="live-updates", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                for event, data, event_id in self.client.stream_events(self.last_event_id):
+                    if backoff:
+                        backoff = 0.0
+                        self.connected.emit(True)
+                    if self._stop.is_set():
+                        return
+                    if event == "ready" and self.last_event_id is None:
+                        # Resume point for a reconnect before any change arrived
+                        self.last_event_id = data.get("last_seq")
+                    elif event == "change":
+                        self.last_event_id = event_id
+                        self.change.emit(data)
+                    elif event == "resync":
+                        self.resync.emit()
+            except (requests.exceptions.RequestException, ValueError):
+                pass
+            self.connected.emit(False)
+            backoff = min(max(backoff * 2, 1.0), self.MAX_BACKOFF)
+            self._stop.wait(backoff)
@@ -1,8 +1,207 @@
-from PySide6.QtWidgets import QTableWidget, QTableWidgetItem
-
-def fill_table(table: QTableWidget, rows: list[list[str]]):
-    table.clearContents()
-    table.setRowCount(len(rows))
-    for r, row in enumerate(rows):
-        for c, val in enumerate(row):
-            table.setItem(r, c, QTableWidgetItem(str(val)))
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import QAbstractItemView, QTableView
+
+from gui.common.worker import RequestRunner
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Table model over API records (dicts), stored as one plain list per column.
+
+    Only the cells the view paints are ever turned into strings, so a listing
+    costs a few Python lists instead of one QTableWidgetItem per cell.
+    `columns` is [(header, record key), ...]; `id_key` names the hidden
+    per-row ID, returned for Qt.UserRole and used to select/remove rows.
+
+    load_pages() shows the first page of a keyset listing and fetches the
+    rest through canFetchMore/fetchMore as the view scrolls, on the runner's
+    thread pool.
+    """
+
+    def __init__(self, columns: Sequence[Tuple[str, str]], id_key: str,
+                 runner: Optional[RequestRunner] = None, parent=None):
+        super().__init__(parent)
+        self._headers = [header for header, _ in columns]
+        self._keys = [key for _, key in columns]
+        self._id_key = id_key
+        self._columns: List[list] = [[] for _ in self._keys]
+        self._ids: list = []
+        self.runner = runner
+        self._fetch_page: Optional[Callable[[Any], Dict]] = None
+        self._next_cursor = None
+        self._fetching = False
+        self._generation = 0  # bumped on reset so late pages of an old listing are dropped
+
+    # ---------------- Qt model interface ----------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._columns[index.column()][index.row()]
+            return "" if value is None else str(value)
+        if role == Qt.UserRole:
+            return self._ids[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._next_cursor is not None and not self._fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._fetching = True
+        fetch_page, cursor, generation = self._fetch_page, self._next_cursor, self._generation
+        self.runner.submit(
+            None,
+            lambda: fetch_page(cursor),
+            lambda page: self._on_page(generation, page),
+            lambda error: self._on_page(generation, {"error": error}),
+        )
+
+    # ---------------- Loading ----------------
+    def set_records(self, records: Iterable[Dict]):
+        """Replace the contents with `records` (no further pages)."""
+        self.beginResetModel()
+        self._reset(records)
+        self.endResetModel()
+
+    def load_pages(self, first_page: Dict, fetch_page: Callable[[Any], Dict]):
+        """
+        Show first_page ({"items", "next_cursor"}) and fetch the rest on demand;
+        fetch_page(after) returns the next page and runs on the runner's pool.
+        """
+        self.beginResetModel()
+        self._reset(first_page.get("items", []))
+        self._fetch_page = fetch_page
+        self._next_cursor = first_page.get("next_cursor")
+        self.endResetModel()
+
+    def clear(self):
+        self.set_records([])
+
+    def append_records(self, records: Sequence[Dict]):
+        if not records:
+            return
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        for column, key in zip(self._columns, self._keys):
+            column.extend(r.get(key) for r in records)
+        self._ids.extend(r.get(self._id_key) for r in records)
+        self.endInsertRows()
+
+    def _reset(self, records):
+        records = list(records)
+        self._columns = [[r.get(key) for r in records] for key in self._keys]
+        self._ids = [r.get(self._id_key) for r in records]
+        self._fetch_page = None
+        self._next_cursor = None
+        self._fetching = False
+        self._generation += 1
+
+    def _on_page(self, generation, page):
+        if generation != self._generation:
+            return
+        self._fetching = False
+        if "items" not in page:
+            self._next_cursor = None  # stop paging on errors
+            return
+        self.append_records(page["items"])
+        self._next_cursor = page.get("next_cursor")
+
+    # ---------------- Row access ----------------
+    def row_id(self, row: int):
+        return self._ids[row] if 0 <= row < len(self._ids) else None
+
+    def record(self, row: int) -> Dict:
+        """The visible values of one row keyed by record key, plus its ID."""
+        values = {key: column[row] for key, column in zip(self._keys, self._columns)}
+        values[self._id_key] = self._ids[row]
+        return values
+
+    def has_id(self, row_id) -> bool:
+        return row_id in self._ids
+
+    def update_record(self, row_id, values: Dict) -> bool:
+        """Patch the row carrying row_id with the given keys in place; False if it is not shown."""
+        try:
+            row = self._ids.index(row_id)
+        except ValueError:
+            return False
+        changed = [c for c, key in enumerate(self._keys) if key in values]
+        for c in changed:
+            self._columns[c][row] = values[self._keys[c]]
+        if changed:
+            self.dataChanged.emit(self.index(row, min(changed)), self.index(row, max(changed)), [Qt.DisplayRole])
+        return True
+
+    def remove_id(self, row_id) -> bool:
+        """Remove the row carrying row_id; False if it is not shown."""
+        try:
+            row = self._ids.index(row_id)
+        except ValueError:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column in self._columns:
+            del column[row]
+        del self._ids[row]
+        self.endRemoveRows()
+        return True
+
+
+class RecordTable(QTableView):
+    """
+    QTableView over a RecordTableModel, set up like the tabs' old QTableWidgets
+    (whole-row selection, last column stretched, fixed row height).
+    """
+
+    def __init__(self, columns: Sequence[Tuple[str, str]], id_key: str,
+                 runner: Optional[RequestRunner] = None, parent=None):
+        super().__init__(parent)
+        self.records = RecordTableModel(columns, id_key, runner, self)
+        self.setModel(self.records)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.horizontalHeader().setStretchLastSection(True)
+        # Fixed row height lets the view skip measuring rows it does not paint
+        self.verticalHeader().setSectionResizeMode(self.verticalHeader().ResizeMode.Fixed)
+
+    def current_row(self) -> int:
+        index = self.currentIndex()
+        return index.row() if index.isValid() else -1
+
+    def current_id(self):
+        """Hidden ID of the selected row, or None."""
+        return self.records.row_id(self.current_row())
+
+    def current_record(self) -> Optional[Dict]:
+        """Values of the selected row as shown (see RecordTableModel.record), or None."""
+        row = self.current_row()
+        return self.records.record(row) if row >= 0 else None
+
+    def set_records(self, records: Iterable[Dict]):
+        self.records.set_records(records)
+
+    def load_pages(self, first_page: Dict, fetch_page: Callable[[Any], Dict]):
+        self.records.load_pages(first_page, fetch_page)
+
+    def remove_id(self, row_id) -> bool:
+        return self.records.remove_id(row_id)
+
+    def update_record(self, row_id, values: Dict) -> bool:
+        return self.records.update_record(row_id, values)
+
+    def append_records(self, records: Sequence[Dict]):
+        self.records.append_records(records)
@@ -0,0 +1,117 @@
+import logging
+from itertools import count
+from typing import Any, Callable, Hashable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+
+class _JobSignals(QObject):
+    # (job key, result) / (job key, error text); queued back to the GUI thread
+    finished = Signal(object, object)
+    failed = Signal(object, str)
+
+
+class _Job(QRunnable):
+    def __init__(self, key, fn: Callable[[], Any]):
+        super().__init__()
+        self.key = key
+        self.fn = fn
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:  # delivered to the GUI instead of killing the worker
+            self.signals.failed.emit(self.key, str(e) or type(e).__name__)
+            return
+        self.signals.finished.emit(self.key, result)
+
+
+class RequestRunner(QObject):
+    """
+    Run blocking ApiClient calls on a QThreadPool and deliver results on the GUI thread.
+
+    - submit(key, fn, on_done): while a call with the same key is in flight,
+      later submissions wait for that call instead of issuing their own.
+      Use key=None for calls that must always run (adds, deletes, updates).
+    - channel: only the newest submission on a channel gets its callbacks run,
+      so a slow, older search cannot overwrite a newer one's results.
+    - busy_changed(bool) fires when the first call starts / the last one ends.
+    """
+    busy_changed = Signal(bool)
+
+    def __init__(self, max_threads: int = 4, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._inflight: dict = {}    # key -> [(ticket, on_done, on_error, channel), ...]
+        self._jobs: dict = {}        # key -> _Job (kept alive until it reports back)
+        self._latest: dict = {}      # channel -> newest ticket
+        self._tickets = count()
+        self._busy = False
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._inflight)
+
+    def submit(
+        self,
+        key: Optional[Hashable],
+        fn: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[str], None]] = None,
+        channel: Optional[Hashable] = None,
+    ):
+        ticket = next(self._tickets)
+        if channel is not None:
+            self._latest[channel] = ticket
+        waiter = (ticket, on_done, on_error, channel)
+        if key is not None and key in self._inflight:
+            self._inflight[key].append(waiter)
+            return
+        if key is None:
+            key = ("_uncoalesced", ticket)
+        self._inflight[key] = [waiter]
+        job = _Job(key, fn)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        self._jobs[key] = job
+        self.pool.start(job)
+        self._update_busy()
+
+    @Slot(object, object)
+    def _on_finished(self, key, result):
+        for ticket, on_done, _, channel in self._pop(key):
+            if self._is_current(ticket, channel):
+                on_done(result)
+        self._update_busy()
+
+    @Slot(object, str)
+    def _on_failed(self, key, error):
+        for ticket, _, on_error, channel in self._pop(key):
+            if self._is_current(ticket, channel):
+                if on_error is not None:
+                    on_error(error)
+                else:
+                    logger.warning("Background request failed: %s", error)
+        self._update_busy()
+
+    def _pop(self, key):
+        self._jobs.pop(key, None)
+        return self._inflight.pop(key, [])
+
+    def _is_current(self, ticket, channel) -> bool:
+        return channel is None or self._latest.get(channel) == ticket
+
+    def _update_busy(self):
+        # Callbacks may have queued follow-up calls, so compare against the last state sent
+        if self.busy != self._busy:
+            self._busy = self.busy
+            self.busy_changed.emit(self._busy)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until every queued call has finished (used on shutdown)."""
+        return self.pool.waitForDone(msecs)
@@ -1,24 +1,29 @@
 # gui/main_gui.py
 import sys
-from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget
+from PySide6.QtWidgets import QApplication, QMainWindow, QProgressBar, QTabWidget
 from gui.widgets.parts_tab import PartsTab
 from gui.widgets.locations_tab import LocationsTab
 from gui.widgets.boxes_tab import BoxesTab
 from gui.widgets.inventory_tab import InventoryTab
 from gui.api_client import ApiClient
+from gui.common.live import LiveUpdates
+from gui.common.worker import RequestRunner
 
 def start_app():
     app_qt = QApplication(sys.argv)
     client = ApiClient("http://127.0.0.1:8000")  # connect to backend
+    # All API calls run on this pool so the window never waits on the network
+    runner = RequestRunner()
+    app_qt.aboutToQuit.connect(lambda: (runner.wait(5000), client.close()))
 
     window = QMainWindow()
     window.setWindowTitle("Parts Inventory GUI v1")
 
     tabs = QTabWidget()
-    parts_tab = PartsTab(client)
-    locations_tab = LocationsTab(client)
-    boxes_tab = BoxesTab(client)
-    inventory_tab = InventoryTab(client)
+    parts_tab = PartsTab(client, runner)
+    locations_tab = LocationsTab(client, runner)
+    boxes_tab = BoxesTab(client, runner)
+    inventory_tab = InventoryTab(client, runner)
 
     tabs.addTab(parts_tab, "Parts")
     tabs.addTab(locations_tab, "Locations")
@@ -34,6 +39,32 @@ def start_app():
     tabs.currentChanged.connect(on_tab_changed)
 
     window.setCentralWidget(tabs)
+
+    # Busy indicator: indeterminate bar in the status bar while requests are in flight
+    busy_bar = QProgressBar()
+    busy_bar.setRange(0, 0)
+    busy_bar.setMaximumWidth(150)
+    busy_bar.setVisible(False)
+    window.statusBar().addPermanentWidget(busy_bar)
+
+    def on_busy_changed(busy):
+        busy_bar.setVisible(busy)
+        if busy:
+            window.statusBar().showMessage("Contacting server...")
+        else:
+            window.statusBar().clearMessage()
+
+    runner.busy_changed.connect(on_busy_changed)
+
+    # Live updates: other stations' edits patch the inventory table as they happen
+    live = LiveUpdates(client)
+    live.change.connect(inventory_tab.apply_change)
+    live.resync.connect(inventory_tab.refresh_view)
+    live.connected.connect(
+        lambda ok: window.statusBar().showMessage("Live updates connected" if ok else "Live updates offline", 3000)
+    )
+    app_qt.aboutToQuit.connect(live.stop)
+    live.start()
     window.resize(1000, 700)
     window.show()
     sys.exit(app_qt.exec())
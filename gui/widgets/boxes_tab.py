@@ -1,10 +1,16 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QMessageBox
-from gui.common.dialogs import confirm
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QMessageBox
+from gui.common.dialogs import confirm, error_popup
+from gui.common.tables import RecordTable
+from gui.common.worker import RequestRunner
+
+# Rows requested per /boxes/all page while scrolling through Show Boxes
+PAGE_SIZE = 500
 
 class BoxesTab(QWidget):
-    def __init__(self, client):
+    def __init__(self, client, runner: RequestRunner = None):
         super().__init__()
         self.client = client
+        self.runner = runner or RequestRunner(parent=self)
         layout = QVBoxLayout(self)
 
         # Controls (horizontal layout to match other tabs)
@@ -26,9 +32,8 @@ class BoxesTab(QWidget):
         layout.addLayout(ctl)
 
         # Table (only show Box Code + Location Name)
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["Box Code", "Location Name"])
+        self.table = RecordTable([("Box Code", "code"), ("Location Name", "location_name")],
+                                 id_key="box_id", runner=self.runner)
         layout.addWidget(self.table)
 
         # Events
@@ -42,7 +47,10 @@ class BoxesTab(QWidget):
         loc_name = self.location_name.text().strip()
         if not label or not loc_name:
             return
-        result = self.client.add_box(label, loc_name)
+        self.runner.submit(None, lambda: self.client.add_box(label, loc_name), self._on_box_added,
+                           error_popup(self, "Add Box"))
+
+    def _on_box_added(self, result):
         if isinstance(result, dict) and ("error" in result or "message" in result):
             msg = result.get("error") or result.get("message") or "Unknown response from server."
             QMessageBox.information(self, "Add Box", str(msg))
@@ -52,29 +60,31 @@ class BoxesTab(QWidget):
         label = self.box_label.text().strip()
         if not label:
             return
-        d = self.client.search_box(label)
-        self.table.setRowCount(0)
+        self.runner.submit(("search_box", label), lambda: self.client.search_box(label), self._show_box,
+                           error_popup(self, "Search Box"), channel=(self, "table"))
+
+    def _show_box(self, d):
         if isinstance(d, dict) and all(k in d for k in ("box_id", "code", "location_name")):
-            self.table.insertRow(0)
-            code_item = QTableWidgetItem(d["code"])
-            loc_item = QTableWidgetItem(d["location_name"])
-            code_item.setData(32, d["box_id"])  # 32 = Qt.UserRole
-            self.table.setItem(0, 0, code_item)
-            self.table.setItem(0, 1, loc_item)
+            self.table.set_records([d])
+        else:
+            self.table.set_records([])
 
     def delete_selected(self):
-        row = self.table.currentRow()
-        if row < 0:
+        box_id = self.table.current_id()  # hidden ID of the selected row
+        if box_id is None:
             return
-        item = self.table.item(row, 0)
-        if item is None:
-            return
-        box_id = item.data(32)  # retrieve hidden ID
         if not confirm("Delete Box", f"Delete box ID {box_id}?"):
             return
-        self.client.delete_box(box_id)
-        self.table.removeRow(row)
+        self.runner.submit(None, lambda: self.client.delete_box(box_id),
+                           lambda _: self.table.remove_id(box_id), error_popup(self, "Delete Box"))
 
     def show_boxes(self):
-        result = self.client.get("/boxes/print")
-        QMessageBox.information(self, "Show Boxes", result.get("message", "Done"))
\ No newline at end of file
+        self.runner.submit("show_boxes", lambda: self.client.list_boxes_page(limit=PAGE_SIZE), self._show_boxes,
+                           error_popup(self, "Show Boxes"), channel=(self, "table"))
+
+    def _show_boxes(self, page):
+        if "items" not in page:
+            msg = page.get("error") or page.get("message") or "Unknown error"
+            QMessageBox.information(self, "Show Boxes", msg)
+            return
+        self.table.load_pages(page, lambda after: self.client.list_boxes_page(after, PAGE_SIZE))
\ No newline at end of file
@@ -2,16 +2,19 @@ from typing import Any, List, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QPushButton, QTableWidget, QMessageBox, QComboBox
+    QLineEdit, QPushButton, QMessageBox, QComboBox
 )
-from gui.common.tables import fill_table
-from gui.common.dialogs import confirm
+from gui.common.completer import RemoteCompleter
+from gui.common.tables import RecordTable
+from gui.common.dialogs import confirm, error_popup
+from gui.common.worker import RequestRunner
 
 
 class InventoryTab(QWidget):
-    def __init__(self, client):
+    def __init__(self, client, runner: Optional[RequestRunner] = None):
         super().__init__()
         self.client = client
+        self.runner = runner or RequestRunner(parent=self)
         layout = QVBoxLayout(self)
 
         # Controls (horizontal layout to match other tabs)
@@ -20,11 +23,13 @@ class InventoryTab(QWidget):
         self.part_number = QLineEdit(); self.part_number.setPlaceholderText("Part Number")
         self.description = QLineEdit(); self.description.setPlaceholderText("Description")
         self.quantity = QLineEdit(); self.quantity.setPlaceholderText("Quantity")
+        RemoteCompleter(self.box_id, self.client, self.runner, "boxes")
+        RemoteCompleter(self.part_number, self.client, self.runner, "parts")
 
         # Location dropdown instead of free text
         self.location_dropdown = QComboBox()
         self.location_dropdown.setPlaceholderText("Choose Location")
-        self.refresh_locations()  # populate dropdown at startup
+        self.refresh_locations()  # populate dropdown at startup (in the background)
 
         btn_add = QPushButton("Add Inventory")
         btn_search = QPushButton("Search Inventory")
@@ -47,12 +52,16 @@ class InventoryTab(QWidget):
         layout.addLayout(ctl)
 
         # Table (operator-friendly: Box ID, Part Number, Description, Location Name, Quantity)
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["Box ID", "Part Number", "Description", "Location Name", "Quantity"])
+        # Inventory IDs are kept as the hidden row ID of each displayed row
+        self.table = RecordTable(
+            [("Box ID", "box_id"), ("Part Number", "part_number"), ("Description", "description"),
+             ("Location Name", "location_name"), ("Quantity", "quantity")],
+            id_key="inventory_id", runner=self.runner,
+        )
         layout.addWidget(self.table)
 
-        # Internal map to track inventory IDs per displayed row
-        self.id_map: List[int] = []
+        # Criteria behind the rows on screen, so live changes can be matched against them
+        self._filter: Optional[dict] = None
 
         # Events
         btn_add.clicked.connect(self.add_inventory)
@@ -64,7 +73,13 @@ class InventoryTab(QWidget):
 
     def refresh_locations(self):
         """Populate the location dropdown from backend using /locations/all."""
-        data = self.client.list_locations()
+        self.runner.submit("list_locations", self.client.list_locations, self._fill_locations,
+                           error_popup(self, "Locations"), channel=(self, "locations"))
+
+    def _fill_locations(self, data):
+        if data is getattr(self, "_last_locations", None):
+            return  # server answered 304: dropdown already up to date
+        self._last_locations = data
         self.location_dropdown.clear()
         if isinstance(data, list):
             for loc in data:
@@ -86,7 +101,14 @@ class InventoryTab(QWidget):
         except ValueError:
             QMessageBox.information(self, "Add Inventory", "Quantity must be an integer.")
             return
-        result = self.client.add_inventory(box_id, part_number, location_name, q_int)
+        self.runner.submit(
+            None,
+            lambda: self.client.add_inventory(box_id, part_number, description, location_name, q_int),
+            self._on_inventory_added,
+            error_popup(self, "Add Inventory"),
+        )
+
+    def _on_inventory_added(self, result: Any):
         if isinstance(result, dict) and ("error" in result or "message" in result):
             msg = self._normalize_msg(result.get("error"), result.get("message"))
             QMessageBox.information(self, "Add Inventory", msg)
@@ -97,44 +119,85 @@ class InventoryTab(QWidget):
         pn = self.part_number.text().strip()
 
         if box_id:
-            data: Any = self.client.search_inventory_by_box(box_id)
+            self._search({"box_id": box_id})
         elif pn:
-            data: Any = self.client.search_inventory(pn)
+            self._search({"part_number": pn})
+
+    def _search(self, criteria: dict):
+        """Show inventory matching criteria: box_id (optionally with location_name) or part_number."""
+        self._filter = criteria
+        if "box_id" in criteria:
+            box_code = criteria["box_id"]
+            key, fetch = ("search_inventory_by_box", box_code), lambda: self.client.search_inventory_by_box(box_code)
         else:
+            pn = criteria["part_number"]
+            key, fetch = ("search_inventory", pn), lambda: self.client.search_inventory(pn)
+        if "location_name" in criteria:
+            title = "Call Inventory"
+            on_done = lambda data: self._show_box_contents(criteria["location_name"], criteria["box_id"], data)
+        else:
+            title, on_done = "Inventory Search", self._show_inventory
+        self.runner.submit(key, fetch, on_done, error_popup(self, title), channel=(self, "table"))
+
+    def refresh_view(self):
+        """Fetch the current search again (used when live updates were missed)."""
+        if self._filter is not None:
+            self._search(self._filter)
+
+    def apply_change(self, change: dict):
+        """Patch the visible rows from a live /events change instead of searching again."""
+        entity = change.get("entity")
+        if entity == "locations":
+            self.refresh_locations()
+            return
+        if entity != "inventory" or self._filter is None:
             return
+        inv_id = change.get("id")
+        data = change.get("data")
+        if change.get("op") == "delete" or not data:
+            self.table.remove_id(inv_id)
+            return
+        row = {
+            "inventory_id": inv_id,
+            "box_id": data.get("box_code"),
+            "part_number": data.get("part_number"),
+            "description": data.get("description") or "",
+            "location_name": data.get("location_name"),
+            "quantity": data.get("quantity"),
+        }
+        if all(row.get(key) == value for key, value in self._filter.items()):
+            if not self.table.update_record(inv_id, row):
+                self.table.append_records([row])
+        else:
+            # e.g. the part number was changed so the row left this search
+            self.table.remove_id(inv_id)
 
-        rows: List[List[Any]] = []
-        id_map: List[int] = []
+    def _show_inventory(self, data: Any):
+        required = ("inventory_id", "box_id", "part_number", "location_name", "quantity")
+        rows: List[dict] = []
 
         if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict) and all(k in item for k in ("inventory_id", "box_id", "part_number", "location_name", "quantity")):
-                    rows.append([item["box_id"], item["part_number"], item.get("description", ""), item["location_name"], item["quantity"]])
-                    id_map.append(int(item.get("inventory_id", -1)))
+            rows = [item for item in data if isinstance(item, dict) and all(k in item for k in required)]
         elif isinstance(data, dict):
-            if all(k in data for k in ("inventory_id", "box_id", "part_number", "location_name", "quantity")):
-                rows.append([data["box_id"], data["part_number"], data.get("description", ""), data["location_name"], data["quantity"]])
-                id_map.append(int(data.get("inventory_id", -1)))
+            if all(k in data for k in required):
+                rows = [data]
             elif "error" in data or "message" in data:
                 msg = self._normalize_msg(data.get("error"), data.get("message"))
                 QMessageBox.information(self, "Inventory Search", msg)
 
-        fill_table(self.table, rows)
-        self.id_map = id_map
+        self.table.set_records(rows)
 
     def delete_selected(self):
-        row = self.table.currentRow()
-        if row < 0 or row >= len(self.id_map):
+        if self.table.current_row() < 0:
             return
-        inv_id = self.id_map[row]
+        inv_id = self.table.current_id()
         if inv_id is None or inv_id == -1:
             QMessageBox.information(self, "Delete Inventory", "Cannot delete: invalid inventory ID.")
             return
         if not confirm("Delete Inventory", f"Delete inventory ID {inv_id}?"):
             return
-        self.client.delete_inventory(inv_id)
-        self.table.removeRow(row)
-        del self.id_map[row]
+        self.runner.submit(None, lambda: self.client.delete_inventory(inv_id),
+                           lambda _: self.table.remove_id(inv_id), error_popup(self, "Delete Inventory"))
 
     def clear_fields(self):
         self.box_id.clear()
@@ -149,28 +212,28 @@ class InventoryTab(QWidget):
         if not location_name or not box_code:
             QMessageBox.information(self, "Call Inventory", "Location and Box ID are required.")
             return
-        data = self.client.call_inventory(location_name, box_code)
+        self._search({"box_id": box_code, "location_name": location_name})
+
+    def _show_box_contents(self, location_name: str, box_code: str, data: Any):
         if isinstance(data, dict) and ("error" in data or "message" in data):
             msg = self._normalize_msg(data.get("error"), data.get("message"))
             QMessageBox.information(self, "Call Inventory", msg)
             return
 
-        rows: List[List[Any]] = []
-        id_map: List[int] = []
+        rows: List[dict] = []
         if isinstance(data, list):
             for item in data:
-                if isinstance(item, dict) and all(k in item for k in ("inventory_id", "part_number", "description", "quantity")):
-                    rows.append([box_code, item["part_number"], item["description"], location_name, item["quantity"]])
-                    id_map.append(int(item.get("inventory_id", -1)))
-        fill_table(self.table, rows)
-        self.id_map = id_map
+                if not isinstance(item, dict) or item.get("location_name", location_name) != location_name:
+                    continue
+                if all(k in item for k in ("inventory_id", "part_number", "description", "quantity")):
+                    rows.append(dict(item, box_id=box_code, location_name=location_name))
+        self.table.set_records(rows)
 
     def update_inventory(self):
-        row = self.table.currentRow()
-        if row < 0 or row >= len(self.id_map):
+        if self.table.current_row() < 0:
             QMessageBox.information(self, "Update Inventory", "Select a row to update.")
             return
-        inv_id = self.id_map[row]
+        inv_id = self.table.current_id()
         if inv_id is None or inv_id == -1:
             QMessageBox.information(self, "Update Inventory", "Invalid inventory ID.")
             return
@@ -184,10 +247,38 @@ class InventoryTab(QWidget):
             QMessageBox.information(self, "Update Inventory", "Quantity must be an integer.")
             return
 
-        result = self.client.update_inventory(inv_id, part_number, description, q_int)
+        shown = self.table.current_record() or {}
+        expected = shown.get("quantity")
+        if (isinstance(expected, int) and part_number == shown.get("part_number")
+                and description == (shown.get("description") or "")):
+            # Only the count changed: send the difference from what is on screen,
+            # so a pick made elsewhere meanwhile is refused (409) rather than overwritten
+            fetch = lambda: self.client.adjust_inventory(inv_id, q_int - expected, expected_quantity=expected)
+        else:
+            fetch = lambda: self.client.update_inventory(inv_id, part_number, description, q_int)
+        self.runner.submit(
+            None,
+            fetch,
+            lambda result: self._on_inventory_updated(inv_id, result),
+            error_popup(self, "Update Inventory"),
+        )
+
+    def _on_inventory_updated(self, inv_id, result: Any):
         msg = self._normalize_msg(result.get("error"), result.get("message"))
         QMessageBox.information(self, "Update Inventory", msg)
-        self.search_inventory()
+        if result.get("conflict"):
+            self.refresh_view()  # show what the item holds now
+            return
+        if "error" in result:
+            return
+        # Patch the row from the response instead of searching again
+        values = {key: result[key] for key in ("part_number", "description") if key in result}
+        values["quantity"] = result.get("quantity", result.get("new_quantity"))
+        by_part = "part_number" in values and self._filter and "part_number" in self._filter
+        if by_part and self._filter["part_number"] != values["part_number"]:
+            self.table.remove_id(inv_id)  # the part number changed so the row left this search
+        else:
+            self.table.update_record(inv_id, values)
 
     def _normalize_msg(self, error_val: Optional[Any], message_val: Optional[Any]) -> str:
         val = error_val if (isinstance(error_val, str) and error_val.strip()) else message_val
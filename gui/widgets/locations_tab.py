@@ -1,15 +1,18 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QMessageBox
+    QLineEdit, QPushButton, QMessageBox
 )
 from gui.api_client import ApiClient
-from gui.common.dialogs import confirm
+from gui.common.dialogs import confirm, error_popup
+from gui.common.tables import RecordTable
+from gui.common.worker import RequestRunner
 
 
 class LocationsTab(QWidget):
-    def __init__(self, client: ApiClient):
+    def __init__(self, client: ApiClient, runner: RequestRunner = None):
         super().__init__()
         self.client = client
+        self.runner = runner or RequestRunner(parent=self)
 
         layout = QVBoxLayout(self)
 
@@ -32,35 +35,34 @@ class LocationsTab(QWidget):
         layout.addLayout(ctl)
 
         # Table (only 2 visible columns: Name + Description)
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["Location Name", "Description"])
+        self.table = RecordTable([("Location Name", "location_name"), ("Description", "description")],
+                                 id_key="location_id", runner=self.runner)
         layout.addWidget(self.table)
 
         # Events
         btn_add.clicked.connect(self.add_location)
         btn_search.clicked.connect(self.search_location)
         btn_delete.clicked.connect(self.delete_location)
-        btn_show.clicked.connect(self.show_locations)
+        btn_show.clicked.connect(self.refresh_table)
 
-        # Initial refresh to show all locations
+        # Initial refresh to show all locations (runs in the background)
         self.refresh_table()
 
     def refresh_table(self):
         """Refresh the table with all locations from backend using /locations/all."""
-        data = self.client.list_locations()
+        self.runner.submit("list_locations", self.client.list_locations, self._show_locations,
+                           error_popup(self, "Locations"), channel=(self, "table"))
+
+    def _show_locations(self, data):
+        if data is getattr(self, "_last_locations", None):
+            return  # server answered 304: table already shows this data
+        self._last_locations = data
         rows = []
         if isinstance(data, list):
-            for loc in data:
-                if isinstance(loc, dict) and "location_name" in loc and "description" in loc:
-                    rows.append([loc["location_name"], loc["description"]])
+            rows = [loc for loc in data if isinstance(loc, dict) and "location_name" in loc and "description" in loc]
         elif isinstance(data, dict) and "location_name" in data and "description" in data:
-            rows.append([data["location_name"], data["description"]])
-
-        self.table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            for j, val in enumerate(row):
-                self.table.setItem(i, j, QTableWidgetItem(str(val)))
+            rows = [data]
+        self.table.set_records(rows)
 
     def add_location(self):
         name = self.location_name.text().strip()
@@ -68,7 +70,10 @@ class LocationsTab(QWidget):
         if not name or not description:
             QMessageBox.information(self, "Add Location", "Both name and description are required.")
             return
-        result = self.client.add_location(name, description)
+        self.runner.submit(None, lambda: self.client.add_location(name, description), self._on_location_added,
+                           error_popup(self, "Add Location"))
+
+    def _on_location_added(self, result):
         if isinstance(result, dict) and ("error" in result or "message" in result):
             msg = result.get("error") or result.get("message") or "Unknown response from server."
             QMessageBox.information(self, "Add Location", str(msg))
@@ -79,16 +84,15 @@ class LocationsTab(QWidget):
         name = self.location_name.text().strip()
         if not name:
             return
-        d = self.client.search_location(name)
-        self.table.setRowCount(0)
+        self.runner.submit(("search_location", name), lambda: self.client.search_location(name),
+                           self._show_location, error_popup(self, "Search Location"), channel=(self, "table"))
+
+    def _show_location(self, d):
+        self._last_locations = None
         if isinstance(d, dict) and all(k in d for k in ("location_id", "location_name", "description")):
-            self.table.insertRow(0)
-            name_item = QTableWidgetItem(d["location_name"])
-            desc_item = QTableWidgetItem(d["description"])
-            name_item.setData(32, d["location_id"])  # 32 = Qt.UserRole
-            self.table.setItem(0, 0, name_item)
-            self.table.setItem(0, 1, desc_item)
+            self.table.set_records([d])
         else:
+            self.table.set_records([])
             QMessageBox.information(
                 self,
                 "Search Location",
@@ -96,18 +100,14 @@ class LocationsTab(QWidget):
             )
 
     def delete_location(self):
-        selected = self.table.currentRow()
-        if selected < 0:
-            return
-        item = self.table.item(selected, 0)
-        if item is None:
+        location_id = self.table.current_id()  # hidden ID of the selected row
+        if location_id is None:
             return
-        location_id = item.data(32)  # retrieve hidden ID
         if not confirm("Delete Location", f"Delete location ID {location_id}?"):
             return
-        self.client.delete_location(location_id)
-        self.table.removeRow(selected)
+        self.runner.submit(None, lambda: self.client.delete_location(location_id),
+                           lambda _: self._on_location_deleted(location_id), error_popup(self, "Delete Location"))
 
-    def show_locations(self):
-        result = self.client.get("/locations/print")
-        QMessageBox.information(self, "Show Locations", result.get("message", "Done"))
+    def _on_location_deleted(self, location_id):
+        self.table.remove_id(location_id)
+        self._last_locations = None  # the cached listing still has the deleted row
@@ -1,16 +1,24 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QMessageBox
-from gui.common.dialogs import confirm
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QMessageBox
+from gui.common.completer import RemoteCompleter
+from gui.common.dialogs import confirm, error_popup
+from gui.common.tables import RecordTable
+from gui.common.worker import RequestRunner
+
+# Rows requested per /parts/all page while scrolling through Show Parts
+PAGE_SIZE = 500
 
 class PartsTab(QWidget):
-    def __init__(self, client):
+    def __init__(self, client, runner: RequestRunner = None):
         super().__init__()
         self.client = client
+        self.runner = runner or RequestRunner(parent=self)
         layout = QVBoxLayout(self)
 
         # Controls
         ctl = QHBoxLayout()
         self.part_number = QLineEdit()
         self.part_number.setPlaceholderText("Part Number")
+        RemoteCompleter(self.part_number, self.client, self.runner, "parts")
         self.description = QLineEdit()
         self.description.setPlaceholderText("Description")
         btn_add = QPushButton("Add Part")
@@ -26,9 +34,8 @@ class PartsTab(QWidget):
         layout.addLayout(ctl)
 
         # Table (only show Part Number + Description)
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["Part Number", "Description"])
+        self.table = RecordTable([("Part Number", "part_number"), ("Description", "description")],
+                                 id_key="part_id", runner=self.runner)
         layout.addWidget(self.table)
 
         # Events
@@ -42,7 +49,10 @@ class PartsTab(QWidget):
         desc = self.description.text().strip()
         if not pn or not desc:
             return
-        result = self.client.add_part(pn, desc)
+        self.runner.submit(None, lambda: self.client.add_part(pn, desc), self._on_part_added,
+                           error_popup(self, "Add Part"))
+
+    def _on_part_added(self, result):
         # Show popup if backend returns a message or error
         if isinstance(result, dict) and ("error" in result or "message" in result):
             msg = result.get("error") or result.get("message") or "Unknown response from server."
@@ -53,53 +63,34 @@ class PartsTab(QWidget):
         pn = self.part_number.text().strip()
         if not pn:
             return
-        d = self.client.search_part(pn)
-        self.table.setRowCount(0)
+        self.runner.submit(("search_part", pn), lambda: self.client.search_part(pn), self._show_part,
+                           error_popup(self, "Search Part"), channel=(self, "table"))
+
+    def _show_part(self, d):
         if isinstance(d, dict) and all(k in d for k in ("part_id", "part_number", "description")):
-            self.table.insertRow(0)
-            pn_item = QTableWidgetItem(d["part_number"])
-            desc_item = QTableWidgetItem(d["description"])
-            # Store hidden part_id in the first column item
-            pn_item.setData(32, d["part_id"])  # 32 = Qt.UserRole
-            self.table.setItem(0, 0, pn_item)
-            self.table.setItem(0, 1, desc_item)
+            self.table.set_records([d])
+        else:
+            self.table.set_records([])
 
     def delete_selected(self):
-        row = self.table.currentRow()
-        if row < 0:
+        part_id = self.table.current_id()  # hidden ID of the selected row
+        if part_id is None:
             return
-        item = self.table.item(row, 0)
-        if item is None:
-            return
-        part_id = item.data(32)  # retrieve hidden ID
         if not confirm("Delete Part", f"Delete part ID {part_id}?"):
             return
-        self.client.delete_part(part_id)
-        self.table.removeRow(row)
+        self.runner.submit(None, lambda: self.client.delete_part(part_id),
+                           lambda _: self.table.remove_id(part_id), error_popup(self, "Delete Part"))
 
     def show_parts(self):
-        # 1. Trigger backend console print
-        result = self.client.get("/parts/print")
-
-        # 2. Fetch all parts for the GUI table
-        data = self.client.list_parts()
+        # Fetch the first page for the GUI table; the rest loads as it scrolls
+        self.runner.submit("show_parts", lambda: self.client.list_parts_page(limit=PAGE_SIZE), self._show_parts,
+                           error_popup(self, "Show Parts"), channel=(self, "table"))
 
-        if not isinstance(data, list):
-            msg = data.get("error") or data.get("message") or "Unknown error"
+    def _show_parts(self, page):
+        if "items" not in page:
+            msg = page.get("error") or page.get("message") or "Unknown error"
             QMessageBox.information(self, "Show Parts", msg)
             return
 
-        # 3. Populate the table
-        self.table.setRowCount(0)
-        for row, p in enumerate(data):
-            self.table.insertRow(row)
-            pn_item = QTableWidgetItem(p["part_number"])
-            desc_item = QTableWidgetItem(p["description"])
-            pn_item.setData(32, p["part_id"])  # hidden ID
-            self.table.setItem(row, 0, pn_item)
-            self.table.setItem(row, 1, desc_item)
-
-        # 4. Show confirmation popup
-        msg = result.get("message") or result.get("error") or "Done"
-        QMessageBox.information(self, "Show Parts", msg)
+        self.table.load_pages(page, lambda after: self.client.list_parts_page(after, PAGE_SIZE))
 
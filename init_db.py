@@ -8,22 +8,14 @@ from app.models.part import Part
 Base.metadata.create_all(bind=engine)
 print("✅ Database tables created.") """
 
-from sqlalchemy import event
 from app.db import Base, engine
 from app.models.location import Location
 from app.models.box import Box
-from models.inventory import InventoryItem
+from app.models.inventory import InventoryItem
 from app.models.part import Part
 
-# Enable SQLite pragmas for safety and robustness
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_conn, conn_record):
-    cursor = dbapi_conn.cursor()
-    # Enforce foreign key constraints (prevents orphaned records)
-    cursor.execute("PRAGMA foreign_keys=ON;")
-    # Use Write-Ahead Logging for safer concurrent writes
-    cursor.execute("PRAGMA journal_mode=WAL;")
-    cursor.close()
+# FK enforcement, WAL and the other SQLite pragmas are applied to every
+# connection by app.db (see SQLITE_PRAGMAS), so they also hold here.
 
 # Create all tables
 Base.metadata.create_all(bind=engine)
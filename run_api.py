@@ -2,5 +2,5 @@ import uvicorn
 from app.main import create_app
 
 if __name__ == "__main__":
-    # Start FastAPI backend
-    uvicorn.run(create_app(), host="127.0.0.1", port=8000)
+    # Start FastAPI backend; open /events streams would otherwise hold up Ctrl+C
+    uvicorn.run(create_app(), host="127.0.0.1", port=8000, timeout_graceful_shutdown=5)